@@ -26,7 +26,6 @@ from core_libs.eo.ccd.k8s_data.pods import (
 from core_libs.eo.ccd.k8s_data.secrets import CcdSecrets
 from core_libs.eo.integration.integration_data import CvnfmIntegrationData
 from core_libs.vim.data.constants import ServerKeys
-from core_libs.vim.openstack import OpenStack
 from kubernetes.client import V1Deployment
 
 from apps.codeploy.data.cluster_data import (
@@ -47,6 +46,9 @@ from libs.common.deployment_manager.dm_collect_logs import (
     DeploymentManagerLogCollection,
 )
 from libs.common.master_node_ssh_client import SSHMasterNode
+from libs.common.shared_openstack import OPENSTACK_CLIENTS, SharedOpenStack
+from libs.common.k8s_client_registry import K8S_CLIENTS
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
 from libs.common.versions_collector import VersionCollector
 from libs.utils.common_utils import is_asyncio_task_alive, compare_versions
 from libs.utils.logging.logger import logger, log_exception
@@ -69,7 +71,7 @@ class CodeployApp:
         :return: instance of K8sApiClient class
         :rtype: K8sApiClient
         """
-        return K8sApiClient(
+        return K8S_CLIENTS.get_client(
             namespace=self.namespace,
             kubeconfig_path=self.kubeconfig_path,
             download_location=DEFAULT_DOWNLOAD_LOCATION,
@@ -138,12 +140,12 @@ class CodeployApp:
         return MasterNode(config=self.config)
 
     @cached_property
-    def openstack_cluster(self) -> OpenStack:
-        """Openstack cluster object
+    def openstack_cluster(self) -> SharedOpenStack:
+        """Openstack cluster object shared between all cluster VIM consumers
         Returns:
             Openstack cluster object
         """
-        return OpenStack(config=self.config, cluster_vim=True)
+        return OPENSTACK_CLIENTS.get(self.config, cluster_vim=True)
 
     @cached_property
     def is_vmvnfm_installed(self) -> bool:
@@ -367,7 +369,8 @@ class CodeployApp:
             while not self.k8s_eo_client.is_pod_exists(pod) and is_asyncio_task_alive(
                 task_name=task_name
             ):
-                await asyncio.sleep(5)
+                with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                    await asyncio.sleep(5)
 
         self.k8s_eo_client.delete_pod(pod=ERIC_GR_BUR_ORCH)
 
@@ -384,7 +387,8 @@ class CodeployApp:
         while self.k8s_eo_client.is_pod_running(
             pod=ERIC_VNFLCM_DB
         ) and is_asyncio_task_alive(task_name=task_name):
-            await asyncio.sleep(5)
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                await asyncio.sleep(5)
 
         self.k8s_eo_client.delete_pod(pod=ERIC_CTRL_BRO)
 
@@ -472,12 +476,13 @@ class CodeployApp:
             )
             return failed_pods
 
-        result = wait_for(
-            lambda: len(get_failed_pods()) == 0,
-            interval=15.0,
-            timeout=GrTimeouts.GR_CONTROLLER_POD_UP_STATE,
-            raise_exc=False,
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            result = wait_for(
+                lambda: len(get_failed_pods()) == 0,
+                interval=15.0,
+                timeout=GrTimeouts.GR_CONTROLLER_POD_UP_STATE,
+                raise_exc=False,
+            )
         if not result:
             logger.error(
                 f"GR Controller timeout {GrTimeouts.GR_CONTROLLER_POD_UP_STATE} exited. Some pods are not up."
@@ -615,11 +620,12 @@ class CodeployApp:
         logger.info(
             f"Verifying that no free memory space is available on the {pod.name} pod"
         )
-        wait_for(
-            lambda: self.check_free_memory_on_pod(pod, file_sys_name) == "0",
-            timeout=timeout,
-            exc_msg=f"{pod.name} pod still has {self.check_free_memory_on_pod(pod, file_sys_name)} of free memory",
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            wait_for(
+                lambda: self.check_free_memory_on_pod(pod, file_sys_name) == "0",
+                timeout=timeout,
+                exc_msg=f"{pod.name} pod still has {self.check_free_memory_on_pod(pod, file_sys_name)} of free memory",
+            )
 
     @retry_deco(MissingKeyInConfigMapError)
     def get_idam_db_pod_leader_name(self) -> str:
@@ -682,9 +688,11 @@ class CodeployApp:
             list with IPs
         """
         logger.info(f"Collecting Master Nodes IPs from {self.env_name!r} cluster's VIM")
+        # 'name' filter works like an 'in' operator on VIM side, so prefix is checked on client side
+        servers = self.openstack_cluster.list_servers({ServerKeys.NAME: self.env_name})
         master_nodes = [
             server
-            for server in self.openstack_cluster.servers.list_servers()
+            for server in servers
             if server[ServerKeys.NAME].startswith(f"{self.env_name}-cp-")
             or f"{self.env_name}-controlplane-" in server[ServerKeys.NAME]
         ]
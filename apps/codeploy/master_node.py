@@ -54,6 +54,7 @@ class MasterNode:
             A path to the downloaded EO master node SSH private key
         """
         remote_path = self._config.read_section(CcdConfigKeys.MASTER_PKEY)
+        # secret, so it is not kept in the persistent artefact cache
         return FileUtils.check_path_for_url(remote_path, DEFAULT_DOWNLOAD_LOCATION)
 
     @cached_property
@@ -86,6 +87,7 @@ class MasterNode:
                 key_filename=self.ssh_pkey,
                 worker_ip=self.worker_ip,
                 worker_username=self.worker_username,
+                site=self.cluster_name,
             )
         return self._ssh_client
 
@@ -3,6 +3,7 @@
 from core_libs.common.custom_exceptions import PodsStatusCheckFailedError
 
 from apps.codeploy.codeploy_app import CodeployApp
+from libs.common.step_timer import timed_step
 from libs.utils.logging.logger import logger
 
 
@@ -30,6 +31,7 @@ class PodsHealthChecker:
             "Completed. Pods healthcheck and failed pods check passed successfully."
         )
 
+    @timed_step()
     def check_pods_health(self) -> None:
         """
         Methods that checks pods health
@@ -48,6 +50,7 @@ class PodsHealthChecker:
                 active_site_unhealthy + passive_site_unhealthy
             )
 
+    @timed_step()
     def check_failed_pods(self) -> None:
         """
         Methods that checks failed pods
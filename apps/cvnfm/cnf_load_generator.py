@@ -0,0 +1,284 @@
+"""Module with CnfLoadGenerator class that measures EVNFM LCM throughput with bulk CNF lifecycle"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable
+
+from core_libs.eo.evnfm.evnfm_constants import Operations
+
+from apps.cvnfm.cvnfm_app import CvnfmApp
+from apps.cvnfm.data.constants import PackageTestValues
+from apps.cvnfm.data.cvnfm_artefact_model import CvnfmArtifactModel
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.latency_stats import summarize_latencies
+from libs.common.rate_limiter import RateLimiter
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+MAX_REPORTED_ERRORS = 20
+
+
+class LoadPhases:
+    """Phases of bulk CNF lifecycle"""
+
+    CREATE_IDENTIFIER = "create_identifier"
+    INSTANTIATE = "instantiate"
+    SCALE_OUT = "scale_out"
+    TERMINATE = "terminate"
+
+
+@dataclass
+class LoadSettings:
+    """Settings of bulk CNF lifecycle load"""
+
+    instances: int
+    concurrency: int = 5
+    rate: float | None = None
+    aspect_id: str = PackageTestValues.ASPECT
+    is_scale: bool = True
+
+
+@dataclass
+class OperationSample:
+    """Timings of one load operation"""
+
+    instance_name: str
+    scheduled: float
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+
+    @property
+    def latency(self) -> float:
+        """Operation execution time in seconds"""
+        return self.finished - self.started
+
+    @property
+    def queue_delay(self) -> float:
+        """Time in seconds operation waited for free worker after its rate slot"""
+        return self.started - self.scheduled
+
+
+@dataclass
+class PhaseResult:
+    """Results of one load phase"""
+
+    name: str
+    samples: list[OperationSample] = field(default_factory=list)
+    duration: float = 0
+    results: dict[str, Any] = field(default_factory=dict)
+
+    def to_report(self) -> dict:
+        """Summarize phase samples
+        Returns:
+            phase report dictionary
+        """
+        errors = [sample for sample in self.samples if sample.error]
+        return {
+            "total": len(self.samples),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(self.samples), 3)
+            if self.samples
+            else 0,
+            "duration": round(self.duration, 3),
+            "throughput": round(len(self.samples) / self.duration, 3)
+            if self.duration
+            else 0,
+            "latency": summarize_latencies(
+                [sample.latency for sample in self.samples if not sample.error]
+            ),
+            "queue_delay": summarize_latencies(
+                [sample.queue_delay for sample in self.samples]
+            ),
+            "error_messages": [
+                f"{sample.instance_name}: {sample.error}"
+                for sample in errors[:MAX_REPORTED_ERRORS]
+            ],
+        }
+
+
+class CnfLoadGenerator:
+    """
+    Generates EVNFM LCM load: creates N CNF instance identifiers, instantiates N CNFs concurrently,
+    scales and terminates them. Operations of every phase are started with limited rate and run
+    by limited number of workers. Per-operation latency, queueing delay and errors are recorded
+    and written to JSON report, so runs on different sites (e.g. before and after switchover) can be compared.
+    """
+
+    def __init__(
+        self,
+        cvnfm_app: CvnfmApp,
+        cluster_name: str,
+        name_prefix: str,
+        package: CvnfmArtifactModel | None = None,
+    ):
+        """
+        Args:
+            cvnfm_app: CvnfmApp instance
+            cluster_name: name of the registered cluster config to instantiate CNFs on
+            name_prefix: prefix of CNF instance names
+            package: onboarded CNF package, cnf_smallstack_pkg is used if not provided
+        """
+        self.cvnfm_app = cvnfm_app
+        self.cluster_name = cluster_name
+        self.name_prefix = name_prefix
+        self.package = package or cvnfm_app.cnf_smallstack_pkg
+        self.phases: list[PhaseResult] = []
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    def run(self, settings: LoadSettings, report_path: Path | None = None) -> dict:
+        """Run full bulk CNF lifecycle and write JSON report
+        Args:
+            settings: LoadSettings instance
+            report_path: path of JSON report, generated in LOAD_REPORTS_DIR if not provided
+        Returns:
+            report dictionary
+        """
+        started = datetime.now()
+        self.phases = []
+        names = [
+            f"{self.name_prefix}-load-{index}" for index in range(settings.instances)
+        ]
+        identifiers = self._run_phase(
+            LoadPhases.CREATE_IDENTIFIER, names, self._create_identifier, settings
+        )
+        instantiated = self._run_phase(
+            LoadPhases.INSTANTIATE,
+            list(identifiers),
+            lambda name: self.cvnfm_app.instantiate_cnf(
+                identifiers[name], self.package.package_id, self.cluster_name, name
+            ),
+            settings,
+        )
+        try:
+            if settings.is_scale:
+                self._run_phase(
+                    LoadPhases.SCALE_OUT,
+                    list(instantiated),
+                    lambda name: self.cvnfm_app.lcm_tracker.wait(
+                        self.cvnfm_app.send_scale_cnf_request(
+                            identifiers[name], Operations.SCALE_OUT, settings.aspect_id
+                        ),
+                        timeout=self.cvnfm_app.lcm_operation_timeout,
+                    ),
+                    settings,
+                )
+        finally:
+            self._run_phase(
+                LoadPhases.TERMINATE,
+                list(instantiated),
+                lambda name: self.cvnfm_app.terminate_cnf_instance(identifiers[name]),
+                settings,
+            )
+            self._delete_identifiers(
+                [
+                    cnf_id
+                    for name, cnf_id in identifiers.items()
+                    if name not in instantiated
+                ]
+            )
+
+        report = {
+            "host": self.cvnfm_app.hostname,
+            "started": started.isoformat(timespec="seconds"),
+            "settings": asdict(settings),
+            "phases": {phase.name: phase.to_report() for phase in self.phases},
+        }
+        self._write_report(report, report_path or self._default_report_path(started))
+        return report
+
+    def _create_identifier(self, name: str) -> str:
+        """Create CNF instance identifier
+        Args:
+            name: CNF instance name
+        Returns:
+            CNF instance ID
+        """
+        return self.cvnfm_app.create_cnf_instance_identifier(
+            self.package.descriptor_id, vapp_name=name
+        )
+
+    def _run_phase(
+        self,
+        phase_name: str,
+        names: list[str],
+        operation: Callable[[str], Any],
+        settings: LoadSettings,
+    ) -> dict[str, Any]:
+        """Run operation for every CNF instance with limited rate and concurrency
+        Args:
+            phase_name: name of the phase
+            names: CNF instance names
+            operation: callable that performs operation for CNF instance name
+            settings: LoadSettings instance
+        Returns:
+            results of succeeded operations by CNF instance name
+        """
+        self._logger.info(
+            f"Start {phase_name} phase for {len(names)} CNF(s) with "
+            f"concurrency={settings.concurrency}, rate={settings.rate}"
+        )
+        phase = PhaseResult(name=phase_name)
+        self.phases.append(phase)
+        rate_limiter = RateLimiter(settings.rate)
+
+        def run_operation(sample: OperationSample) -> None:
+            sample.started = monotonic()
+            try:
+                phase.results[sample.instance_name] = operation(sample.instance_name)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self._logger.warning(
+                    f"{phase_name} of {sample.instance_name} failed: {err}"
+                )
+                sample.error = repr(err)
+            finally:
+                sample.finished = monotonic()
+
+        phase_started = monotonic()
+        with ThreadPoolExecutor(
+            max_workers=settings.concurrency, thread_name_prefix=phase_name
+        ) as executor:
+            for name in names:
+                sample = OperationSample(
+                    instance_name=name, scheduled=rate_limiter.acquire()
+                )
+                phase.samples.append(sample)
+                executor.submit(run_operation, sample)
+        phase.duration = monotonic() - phase_started
+
+        self._logger.info(f"Phase {phase_name} finished: {phase.to_report()}")
+        return phase.results
+
+    def _delete_identifiers(self, cnf_ids: list[str]) -> None:
+        """Delete identifiers of CNF instances that were not instantiated
+        Args:
+            cnf_ids: CNF instance IDs
+        """
+        for cnf_id in cnf_ids:
+            try:
+                self.cvnfm_app.api.instances.delete_instance_identifier(cnf_id)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self._logger.warning(f"Failed to delete identifier {cnf_id}: {err}")
+
+    def _default_report_path(self, started: datetime) -> Path:
+        """Generate report path for the run
+        Args:
+            started: time when the run started
+        Returns:
+            report path
+        """
+        return LOAD_REPORTS_DIR / (
+            f"cnf_load_{self.cvnfm_app.hostname}_{started:%Y%m%d_%H%M%S}.json"
+        )
+
+    def _write_report(self, report: dict, report_path: Path) -> None:
+        """Write report to JSON file
+        Args:
+            report: report dictionary
+            report_path: path of JSON report
+        """
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2))
+        self._logger.info(f"CNF load report is written to {report_path}")
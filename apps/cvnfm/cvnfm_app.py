@@ -1,11 +1,14 @@
 """ Module with CvnfmApp class"""
 import asyncio
+import os
+import tempfile
 from functools import cached_property
 from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urlparse
 
 from core_libs.common.constants import ArtefactConfigKeys
 from core_libs.common.constants import CcdConfigKeys
-from core_libs.common.csar_utils import CsarUtils
 from core_libs.common.custom_exceptions import (
     AssetNotFoundException,
     UnexpectedInstanceState,
@@ -27,15 +30,23 @@ from apps.evnfm.data.constants import (
     InstanceFields,
     OperationFields,
     DEFAULT_EVNFM_APP_TIMEOUT,
+    DEFAULT_ONBOARDING_TIMEOUT,
 )
 from apps.evnfm.evnfm_app import EvnfmApp
+from apps.evnfm.package_upload_api import OnboardingTimings
+from libs.common.artefact_cache import ARTEFACT_CACHE
 from libs.common.config_reader import ConfigReader
 from libs.common.constants import DEFAULT_DOWNLOAD_LOCATION
-from libs.common.custom_exceptions import UnexpectedNumberOfCnfInstances
+from libs.common.csar_rewriter import randomize_vnfd_id
+from libs.common.custom_exceptions import (
+    ThreadTimeoutExpiredError,
+    UnexpectedNumberOfCnfInstances,
+)
 from libs.common.deployment_manager.dm_collect_logs import (
     DeploymentManagerLogCollection,
 )
 from libs.common.env_variables import ENV_VARS
+from libs.common.step_timer import timed_step
 from libs.utils.logging.logger import logger, log_exception
 
 
@@ -49,7 +60,9 @@ class CvnfmApp(EvnfmApp):
         self.cnf_id = None
         self.unsigned_cnf_id = None
         self.vnf_lcm_op_occ_id = None
-        self.namespace = None
+        # namespaces of instantiated CNF instances by instance ID
+        self.instance_namespaces: dict[str, str] = {}
+        self.onboarding_timings: dict[str, OnboardingTimings] = {}
 
     @property
     def registry_user_name(self):
@@ -80,6 +93,14 @@ class CvnfmApp(EvnfmApp):
         """
         return self.config.artefacts.get_by_id(ArtefactConfigKeys.CNF_TEST_PACKAGE)
 
+    @property
+    def lcm_operation_timeout(self) -> int:
+        """Time in seconds for LCM operation to reach final state,
+        lcm_timeout of CNF package if provided, default timeout otherwise"""
+        if self.cnf_smallstack_pkg.lcm_timeout:
+            return int(self.cnf_smallstack_pkg.lcm_timeout)
+        return super().lcm_operation_timeout
+
     @cached_property
     def cnf_upgrade_smallstack_pkg(self) -> CvnfmArtifactModel:
         """
@@ -99,6 +120,7 @@ class CvnfmApp(EvnfmApp):
 
     # endregion CNF packages
 
+    @timed_step()
     def download_cnf_package_and_randomize_vnf_id(
         self, package: CvnfmArtifactModel, is_randomize_vnfd: bool = False
     ) -> None:
@@ -108,10 +130,21 @@ class CvnfmApp(EvnfmApp):
         :param is_randomize_vnfd: option for randomize vnfd
         """
         logger.info("Download cnf package file to system")
-        package.path = self.download_file(package.url)
         if is_randomize_vnfd:
-            CsarUtils.randomize_vnfd_id(package, tmp_dir_path=DEFAULT_DOWNLOAD_LOCATION)
+            # randomized package is streamed from the cached base package, base package stays unchanged
+            package.path = Path(DEFAULT_DOWNLOAD_LOCATION) / (
+                Path(urlparse(package.url).path).name
+            )
+            with ARTEFACT_CACHE.read_only(
+                package.url, DEFAULT_DOWNLOAD_LOCATION
+            ) as base_package_path:
+                package.descriptor_id = randomize_vnfd_id(
+                    base_package_path, package.path
+                )
+        else:
+            package.path = self.download_file(package.url)
 
+    @timed_step()
     def onboard_cnf_package(
         self, package: CvnfmArtifactModel, cleanup_pkg: bool = False
     ) -> str:
@@ -128,9 +161,14 @@ class CvnfmApp(EvnfmApp):
             payload = self.evnfm_test_data.packages_test_data.get_create_vnf_package_resource_json(
                 package.onboarding_timeout
             )
-            package_id = self.api.packages_client.onboard_csar_package(
-                payload, package.path
+            # package content is streamed from disk, upload and processing times are measured
+            package_id, timings = self.package_upload_api.onboard_csar_package(
+                payload,
+                package.path,
+                timeout=int(package.onboarding_timeout or DEFAULT_ONBOARDING_TIMEOUT)
+                * 60,
             )
+            self.onboarding_timings[package_id] = timings
             package.descriptor_id = self.api.packages_client.find_vnfd_id(package_id)
         finally:
             if cleanup_pkg:
@@ -138,6 +176,40 @@ class CvnfmApp(EvnfmApp):
                 FileUtils.delete_file(package.path)
         return package_id
 
+    def is_package_onboarded(self, descriptor_id: str, package_id: str) -> bool:
+        """
+        Check that package with provided descriptor id is onboarded with provided package id,
+        used to validate package stored in checkpoint by previous session
+        Args:
+            descriptor_id: package descriptor id
+            package_id: package id
+        Returns:
+            True if package is onboarded
+        """
+        return (
+            self.api.packages_client.check_if_package_with_vnfd_id_exists(descriptor_id)
+            == package_id
+        )
+
+    def is_instance_instantiated(self, instance_id: str) -> bool:
+        """
+        Check that CNF instance exists and is instantiated,
+        used to validate instance stored in checkpoint by previous session
+        Args:
+            instance_id: CNF instance id
+        Returns:
+            True if instance is instantiated
+        """
+        response = self.api.instances.get_instance_by_id(
+            instance_id, check_response=False
+        )
+        return (
+            response.status_code == HTTPStatus.OK
+            and response.json().get(InstanceFields.INSTANTIATION_STATE)
+            == InstantiateStates.INSTANTIATED
+        )
+
+    @timed_step()
     def delete_cnf_package_if_exists(self, package_descriptor_id: str) -> None:
         """
         Delete CNF package if it exits
@@ -151,6 +223,7 @@ class CvnfmApp(EvnfmApp):
             logger.info(f"Package id to be deleted {package_id!r}")
             self.api.packages.delete_vnf_package(package_id)
 
+    @timed_step()
     def create_cnf_instance_identifier(
         self, descriptor_id: str, vapp_name: str | None = None
     ):
@@ -173,6 +246,7 @@ class CvnfmApp(EvnfmApp):
         ).json()["id"]
         return cnf_id
 
+    @timed_step()
     def instantiate_cnf(
         self, cnf_id: str, package_id: str, cluster_name: str, instance_name: str
     ) -> str:
@@ -195,6 +269,9 @@ class CvnfmApp(EvnfmApp):
 
         logger.info(f"Sending Instantiate CNF request for CNF ID {cnf_id}")
         logger.info("Instantiating a CNF instance")
+        self.instance_namespaces[cnf_id] = instantiate_data[
+            CommonFields.ADDITIONAL_PARAMS
+        ][CommonFields.NAMESPACE]
         response = self.api.instances.instantiate_cnf(cnf_id, instantiate_data)
         vnf_lcm_op_occ_id = self.get_vnf_lcm_op_occ_id_from_response(response)
 
@@ -202,8 +279,8 @@ class CvnfmApp(EvnfmApp):
             f"Verifying CNF Lifecycle operation state for vnfLcmOpOccId {vnf_lcm_op_occ_id}"
         )
         try:
-            self.api.instances_client.wait_for_lcm_operation(vnf_lcm_op_occ_id)
-        except UnexpectedInstanceState as exception:
+            self.lcm_tracker.wait(vnf_lcm_op_occ_id, timeout=self.lcm_operation_timeout)
+        except (UnexpectedInstanceState, ThreadTimeoutExpiredError) as exception:
             if ENV_VARS.is_rv_setup:
                 asyncio.run(
                     self.dm_log_collector.collect_logs_if_failed_pods(
@@ -249,12 +326,9 @@ class CvnfmApp(EvnfmApp):
         instantiate_data = self.evnfm_test_data.instance_test_data.instantiate_cnf_data(
             cluster_name, instance_name, DEFAULT_EVNFM_APP_TIMEOUT
         )
-        self.namespace = instantiate_data[CommonFields.ADDITIONAL_PARAMS][
-            CommonFields.NAMESPACE
-        ]
         additional_params_data = (
             self.evnfm_test_data.instance_test_data.upd_inst_cnf_with_additional_params(
-                self.namespace
+                instantiate_data[CommonFields.ADDITIONAL_PARAMS][CommonFields.NAMESPACE]
             )
         )
         data.update(additional_params_data)
@@ -263,6 +337,7 @@ class CvnfmApp(EvnfmApp):
 
         return instantiate_data
 
+    @timed_step()
     def terminate_cnf_instance(
         self, instance_id: str, remove_cnf_identifier: bool = True
     ) -> None:
@@ -280,8 +355,9 @@ class CvnfmApp(EvnfmApp):
         )
         response = self.api.instances.delete_cnf(instance_id, delete_instance_json)
         vnf_lcm_op_occ_id = self.get_vnf_lcm_op_occ_id_from_response(response)
-        self.api.instances_client.wait_for_lcm_operation(vnf_lcm_op_occ_id)
+        self.lcm_tracker.wait(vnf_lcm_op_occ_id, timeout=self.lcm_operation_timeout)
 
+        self.instance_namespaces.pop(instance_id, None)
         if remove_cnf_identifier:
             self.api.instances.delete_instance_identifier(instance_id)
 
@@ -291,6 +367,7 @@ class CvnfmApp(EvnfmApp):
         operation: str,
         package_id: str,
         is_additional_params: bool = False,
+        namespace: str | None = None,
     ) -> dict:
         """
         This function updates the payload if the additional param file provided
@@ -298,46 +375,35 @@ class CvnfmApp(EvnfmApp):
         :param operation: the operation type (eg. scale, change_package)
         :param package_id: the id of the package to parse the additional parameters from
         :param is_additional_params: Flag that define usage of additional params
+        :param namespace: namespace of the CNF instance, used by additional params
         :return: updated payload dict with additional parameters, or empty dict
         """
         additional_pars = {}
 
         logger.info("Updating payload field: additionalParams")
         if operation == EvnfmOperations.SCALE:
-            filename_to_use = (
-                self.download_file(self.cnf_smallstack_pkg.additional_config_scale)
-                if self.cnf_smallstack_pkg.additional_config_scale
-                else None
-            )
-            logger.debug(
-                f"Filename for additional parameters (scale operation): {filename_to_use}"
-            )
+            config_url = self.cnf_smallstack_pkg.additional_config_scale
         elif operation == EvnfmOperations.CHANGE_PACKAGE:
-            filename_to_use = (
-                self.download_file(self.cnf_smallstack_pkg.additional_config_modify)
-                if self.cnf_smallstack_pkg.additional_config_modify
-                else None
-            )
-            logger.debug(
-                f"Filename for additional parameters (instantiate operation): {filename_to_use}"
-            )
+            config_url = self.cnf_smallstack_pkg.additional_config_modify
         else:
             logger.error(f"Unknown operation: {operation}")
             return additional_pars
 
-        if filename_to_use is not None:
-            try:
-                logger.info(f"Get additionalParams from file: {filename_to_use}")
+        if config_url:
+            # per call directory, so concurrent operations don't delete each other's file
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # trailing separator as in DEFAULT_DOWNLOAD_LOCATION
+                filename_to_use = self.download_file(config_url, tmp_dir + os.sep)
+                logger.info(
+                    f"Get additionalParams for {operation} from file: {filename_to_use}"
+                )
                 additional_pars = build_json_from_file(filename_to_use)
                 logger.debug(f"Additional config provided by user is {additional_pars}")
-            finally:
-                logger.debug(f"Delete uploaded file {filename_to_use}")
-                FileUtils.delete_file(filename_to_use)
         else:
             if is_additional_params:
                 logger.debug("Applying additional params for CNF package")
                 additional_pars = self.evnfm_test_data.instance_test_data.upd_inst_cnf_with_additional_params(
-                    self.namespace
+                    namespace
                 )
             else:
                 logger.info(
@@ -352,6 +418,7 @@ class CvnfmApp(EvnfmApp):
         payload.get(CommonFields.ADDITIONAL_PARAMS).update(additional_pars)
         return payload
 
+    @timed_step()
     def upgrade_vnf_instance(
         self,
         is_additional_params_for_change_pkg: bool,
@@ -366,6 +433,7 @@ class CvnfmApp(EvnfmApp):
             cnf_id: ID of the instantiated CNF package
         """
         logger.info("Upgrading CNF instance")
+        cnf_id = cnf_id or self.cnf_id
         upgrade_instance_json = (
             self.evnfm_test_data.instance_test_data.change_cnf_instance_json(
                 self.cnf_upgrade_smallstack_pkg.descriptor_id,
@@ -380,8 +448,8 @@ class CvnfmApp(EvnfmApp):
             operation=EvnfmOperations.CHANGE_PACKAGE,
             package_id=cnf_package_id,
             is_additional_params=is_additional_params_for_change_pkg,
+            namespace=self.instance_namespaces.get(cnf_id),
         )
-        cnf_id = cnf_id or self.cnf_id
         response = self.api.instances.change_cnf_instance(cnf_id, upgrade_instance_json)
         assert response.status_code == HTTPStatus.ACCEPTED, log_exception(
             f"Response code is not {HTTPStatus.ACCEPTED}"
@@ -465,6 +533,7 @@ class CvnfmApp(EvnfmApp):
             InstantiateFields.VNFD_ID
         ), log_exception("The VNF Package ID does not match!")
 
+    @timed_step()
     def make_scale_cnf_operation(
         self, scale_operation: str, aspect_id: str, is_additional_params: bool = False
     ) -> int:
@@ -480,7 +549,30 @@ class CvnfmApp(EvnfmApp):
             self.cnf_id, aspect_id
         )
 
-        logger.info(f"{scale_operation} cnf instance with id {self.cnf_id!r}")
+        self.vnf_lcm_op_occ_id = self.send_scale_cnf_request(
+            self.cnf_id, scale_operation, aspect_id, is_additional_params
+        )
+
+        return start_scale_status
+
+    def send_scale_cnf_request(
+        self,
+        instance_id: str,
+        scale_operation: str,
+        aspect_id: str,
+        is_additional_params: bool = False,
+    ) -> str:
+        """
+        Send Scale In or Scale Out request for CNF instance
+        Args:
+            instance_id: CNF instance ID
+            scale_operation: operation to perform: Scale In or Scale Out
+            aspect_id: aspect id that used for scaling
+            is_additional_params: Flag that define usage of additional params
+        Returns:
+            vnfLcmOpOccId of the scale operation
+        """
+        logger.info(f"{scale_operation} cnf instance with id {instance_id!r}")
         payload = self.evnfm_test_data.instance_test_data.scale_vnf(
             scale_operation=scale_operation, aspect_id=aspect_id
         )
@@ -490,12 +582,11 @@ class CvnfmApp(EvnfmApp):
             operation=EvnfmOperations.SCALE,
             package_id=self.cnf_smallstack_pkg.package_id,
             is_additional_params=is_additional_params,
+            namespace=self.instance_namespaces.get(instance_id),
         )
-        logger.info(f"Scale a CNF with id={self.cnf_id}")
-        response = self.api.instances.scale_vnf_instance(self.cnf_id, payload)
-        self.vnf_lcm_op_occ_id = self.get_vnf_lcm_op_occ_id_from_response(response)
-
-        return start_scale_status
+        logger.info(f"Scale a CNF with id={instance_id}")
+        response = self.api.instances.scale_vnf_instance(instance_id, payload)
+        return self.get_vnf_lcm_op_occ_id_from_response(response)
 
     def verify_scale_operation_workflow(
         self, scale_operation: Operations, aspect_id: str, start_scale_status: int
@@ -542,6 +633,7 @@ class CvnfmApp(EvnfmApp):
             payload.update(timeout)
         return payload
 
+    @timed_step()
     def modify_cnf(self, instance_id, data):
         """
         Method to modify CNF instance
@@ -11,6 +11,8 @@ class PackageStates:
 class PackageFields:
     """Class for CVNFM package fields"""
 
+    ID = "id"
+    VNFD_ID = "vnfdId"
     USAGE_STATE = "usageState"
     OPERATIONAL_STATE = "operationalState"
 
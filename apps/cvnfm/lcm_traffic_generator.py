@@ -0,0 +1,333 @@
+"""Module with LcmTrafficGenerator class that keeps EVNFM traffic flowing to measure switchover impact"""
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from threading import Event
+from time import monotonic
+from typing import Any, Callable, Iterator
+
+from apps.cvnfm.cvnfm_app import CvnfmApp
+from apps.cvnfm.data.cvnfm_artefact_model import CvnfmArtifactModel
+from apps.gr.data.constants import GrTimeouts
+from apps.gr.geo_redundancy import GeoRedundancyApp
+from libs.common.availability_prober import (
+    RECOVERY_TIMEOUT,
+    ProbeSample,
+    build_availability_report,
+)
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.custom_exceptions import ThreadTimeoutExpiredError
+from libs.common.latency_stats import summarize_latencies
+from libs.common.thread_runner import ThreadRunner
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+READ_REQUEST_INTERVAL = 2
+LCM_REQUEST_INTERVAL = 30
+TRAFFIC_WARMUP = 60
+TRAFFIC_COOLDOWN = 60
+TRAFFIC_STOP_TIMEOUT = 10 * 60
+
+
+class TrafficMarks:
+    """Names of traffic timeline marks"""
+
+    SWITCHOVER_STARTED = "switchover_started"
+    SWITCHOVER_FINISHED = "switchover_finished"
+
+
+@dataclass
+class RequestClass:
+    """Class of requests sent repeatedly with given interval"""
+
+    name: str
+    call: Callable[[], Any]
+    interval: float
+
+
+class LcmTrafficGenerator:
+    """
+    Keeps steady stream of EVNFM read requests (package and instance listings) and light LCM
+    requests (instantiate/terminate of small CNF) through the EVNFM host, every request class
+    in own thread. Failed requests drop shared EVNFM sessions so next request logs in again
+    as real client would do. Error rate, latency and recovery time are reported per request class
+    and per phase relative to switchover: before, during and after.
+    """
+
+    def __init__(
+        self,
+        cvnfm_app: CvnfmApp,
+        cluster_name: str,
+        name_prefix: str,
+        package: CvnfmArtifactModel | None = None,
+    ):
+        """
+        Args:
+            cvnfm_app: CvnfmApp instance
+            cluster_name: name of the registered cluster config to instantiate CNFs on
+            name_prefix: prefix of CNF instance names
+            package: onboarded CNF package, cnf_smallstack_pkg is used if not provided
+        """
+        self.cvnfm_app = cvnfm_app
+        self.cluster_name = cluster_name
+        self.name_prefix = name_prefix
+        self.package = package or cvnfm_app.cnf_smallstack_pkg
+        self.samples: dict[str, list[ProbeSample]] = {}
+        self.marks: dict[str, float] = {}
+        self.report: dict | None = None
+        self._cnf_counter = count()
+        self._started: float | None = None
+        self._started_at: datetime | None = None
+        self._stop_event = Event()
+        self._threads: list[ThreadRunner] = []
+        self._leftover_cnf_ids: list[str] = []
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    @property
+    def request_classes(self) -> list[RequestClass]:
+        """Request classes of generated traffic"""
+        return [
+            RequestClass(
+                "list_packages",
+                lambda: self.cvnfm_app.api.packages.get_packages().json(),
+                READ_REQUEST_INTERVAL,
+            ),
+            RequestClass(
+                "list_instances",
+                lambda: self.cvnfm_app.api.instances.get_instances().json(),
+                READ_REQUEST_INTERVAL,
+            ),
+            RequestClass(
+                "instantiate_terminate",
+                self._instantiate_and_terminate_cnf,
+                LCM_REQUEST_INTERVAL,
+            ),
+        ]
+
+    @contextmanager
+    def running(self) -> Iterator["LcmTrafficGenerator"]:
+        """Context manager that generates traffic while the block is running"""
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def start(self) -> None:
+        """Start traffic threads"""
+        self._stop_event.clear()
+        self._started = monotonic()
+        self._started_at = datetime.now()
+        self.marks = {}
+        self.report = None
+        self.samples = {}
+        self._threads = []
+        for request_class in self.request_classes:
+            self.samples[request_class.name] = []
+            thread = ThreadRunner(
+                target=self._send_requests,
+                args=(request_class,),
+                name=f"TRAFFIC_{request_class.name.upper()}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(
+        self,
+        recovery_timeout: int = RECOVERY_TIMEOUT,
+        stop_timeout: int = TRAFFIC_STOP_TIMEOUT,
+    ) -> dict:
+        """Wait until requests of every class succeed again, stop traffic, clean up CNFs left
+        by failed LCM requests and write report
+        Args:
+            recovery_timeout: max time to wait for requests to succeed
+            stop_timeout: max time to wait for every traffic thread to finish its request
+        Returns:
+            traffic report
+        """
+        deadline = monotonic() + recovery_timeout
+        while not self._is_recovered() and monotonic() < deadline:
+            self._stop_event.wait(READ_REQUEST_INTERVAL)
+        self._stop_event.set()
+        for thread in self._threads:
+            try:
+                thread.join_with_result(timeout=stop_timeout)
+            except ThreadTimeoutExpiredError as err:
+                # daemon thread, it is left behind not to block the test
+                self._logger.warning(err)
+        self._clean_up_leftover_cnfs()
+        self.report = self.get_report()
+        self._write_report(
+            LOAD_REPORTS_DIR / f"lcm_traffic_{self._started_at:%Y%m%d_%H%M%S}.json"
+        )
+        return self.report
+
+    def mark(self, name: str) -> None:
+        """Mark an event on traffic timeline
+        Args:
+            name: event name
+        """
+        self.marks[name] = monotonic() - self._started
+        self._logger.info(f"Traffic mark {name!r} at {self.marks[name]:.1f} seconds")
+
+    def run_during_switchover(
+        self, gr_app: GeoRedundancyApp, backup_id: str | None = None
+    ) -> bool:
+        """Generate traffic before, during and after switchover made in GeoRedundancyApp switchover thread
+        Args:
+            gr_app: GeoRedundancyApp instance
+            backup_id: if backup id provided it will be used for switchover
+        Returns:
+            True if switchover success else False
+        """
+        with self.running():
+            self._stop_event.wait(TRAFFIC_WARMUP)
+            self.mark(TrafficMarks.SWITCHOVER_STARTED)
+            switchover_thread = gr_app.make_and_verify_switchover_in_separate_thread(
+                backup_id=backup_id
+            )
+            is_switchover_success = switchover_thread.join_with_result(
+                timeout=GrTimeouts.SWITCHOVER_TIMEOUT
+            )
+            self.mark(TrafficMarks.SWITCHOVER_FINISHED)
+            self._stop_event.wait(TRAFFIC_COOLDOWN)
+        return is_switchover_success
+
+    def _send_requests(self, request_class: RequestClass) -> None:
+        """Send requests of the class with its interval until stopped
+        Args:
+            request_class: RequestClass instance
+        """
+        while not self._stop_event.is_set():
+            request_started = monotonic()
+            error = None
+            try:
+                request_class.call()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                error = type(err).__name__
+                self._logger.warning(f"{request_class.name} request failed: {err}")
+                self.cvnfm_app.invalidate_api_sessions()
+            self.samples[request_class.name].append(
+                ProbeSample(
+                    timestamp=request_started - self._started,
+                    ok=error is None,
+                    latency=monotonic() - request_started,
+                    error=error,
+                )
+            )
+            self._stop_event.wait(
+                max(request_class.interval - (monotonic() - request_started), 0)
+            )
+
+    def _instantiate_and_terminate_cnf(self) -> None:
+        """Create identifier, instantiate and terminate small CNF,
+        the CNF is cleaned up if any of the requests fails"""
+        name = f"{self.name_prefix}-traffic-{next(self._cnf_counter)}"
+        cnf_id = self.cvnfm_app.create_cnf_instance_identifier(
+            self.package.descriptor_id, vapp_name=name
+        )
+        try:
+            self.cvnfm_app.instantiate_cnf(
+                cnf_id, self.package.package_id, self.cluster_name, name
+            )
+            self.cvnfm_app.terminate_cnf_instance(cnf_id)
+        except Exception:
+            self._clean_up_cnf(cnf_id)
+            raise
+
+    def _clean_up_cnf(self, cnf_id: str) -> bool:
+        """Terminate CNF if it is instantiated and delete its identifier,
+        CNF is kept to be cleaned up on stop if the host doesn't respond
+        Args:
+            cnf_id: CNF instance id
+        Returns:
+            True if CNF is cleaned up
+        """
+        try:
+            if self.cvnfm_app.is_instance_instantiated(cnf_id):
+                self.cvnfm_app.terminate_cnf_instance(cnf_id)
+            else:
+                self.cvnfm_app.api.instances.delete_instance_identifier(cnf_id)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._logger.warning(f"Clean up of CNF {cnf_id!r} failed: {err}")
+            if cnf_id not in self._leftover_cnf_ids:
+                self._leftover_cnf_ids.append(cnf_id)
+            return False
+        if cnf_id in self._leftover_cnf_ids:
+            self._leftover_cnf_ids.remove(cnf_id)
+        return True
+
+    def _clean_up_leftover_cnfs(self) -> None:
+        """Clean up CNFs left by failed LCM requests"""
+        for cnf_id in list(self._leftover_cnf_ids):
+            self._clean_up_cnf(cnf_id)
+        if self._leftover_cnf_ids:
+            self._logger.error(
+                f"CNFs are left after LCM traffic: {self._leftover_cnf_ids}"
+            )
+
+    def _is_recovered(self) -> bool:
+        """Check that the last request of every class succeeded
+        Returns:
+            True if all request classes are recovered
+        """
+        return all(samples and samples[-1].ok for samples in self.samples.values())
+
+    def _get_phase(self, timestamp: float) -> str:
+        """Get traffic phase of the sample relative to switchover marks
+        Args:
+            timestamp: sample timestamp
+        Returns:
+            phase name
+        """
+        if timestamp < self.marks.get(TrafficMarks.SWITCHOVER_STARTED, float("inf")):
+            return "before"
+        if timestamp <= self.marks.get(TrafficMarks.SWITCHOVER_FINISHED, float("inf")):
+            return "during"
+        return "after"
+
+    def get_report(self) -> dict:
+        """Build traffic report from collected samples
+        Returns:
+            report with availability, error rate and latency per request class and phase
+        """
+        report = {
+            "host": self.cvnfm_app.hostname,
+            "started": self._started_at.isoformat(timespec="seconds"),
+            "marks": {name: round(value, 3) for name, value in self.marks.items()},
+            "request_classes": {},
+        }
+        for name, samples in self.samples.items():
+            phases = {}
+            for sample in samples:
+                phases.setdefault(self._get_phase(sample.timestamp), []).append(sample)
+            report["request_classes"][name] = {
+                **build_availability_report(samples),
+                "phases": {
+                    phase: {
+                        "requests": len(phase_samples),
+                        "error_rate": round(
+                            sum(not sample.ok for sample in phase_samples)
+                            / len(phase_samples),
+                            3,
+                        ),
+                        "latency": summarize_latencies(
+                            [sample.latency for sample in phase_samples if sample.ok]
+                        ),
+                    }
+                    for phase, phase_samples in phases.items()
+                },
+            }
+        return report
+
+    def _write_report(self, report_path: Path) -> None:
+        """Write traffic report to JSON file
+        Args:
+            report_path: path of JSON report
+        """
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report, indent=2))
+        self._logger.info(f"LCM traffic report is written to {report_path}")
@@ -4,6 +4,8 @@ Module for store E-VNFM related data
 
 
 DEFAULT_EVNFM_APP_TIMEOUT = 900
+# minutes, the same unit as onboarding_timeout of artefacts config
+DEFAULT_ONBOARDING_TIMEOUT = 90
 
 
 class OperationFields:
@@ -22,3 +24,65 @@ class InstanceFields:
     VNF_INSTANCE_NAME = "vnfInstanceName"
     METADATA = "metadata"
     EXTENSIONS = "extensions"
+
+
+class LcmOperationStates:
+    """Class for E-VNFM LCM operation occurrence states"""
+
+    STARTING = "STARTING"
+    PROCESSING = "PROCESSING"
+    COMPLETED = "COMPLETED"
+    FAILED_TEMP = "FAILED_TEMP"
+    FAILED = "FAILED"
+    ROLLING_BACK = "ROLLING_BACK"
+    ROLLED_BACK = "ROLLED_BACK"
+
+    FINAL = COMPLETED, FAILED_TEMP, FAILED, ROLLED_BACK
+
+
+class PackageFields:
+    """Class for E-VNFM VNF package fields"""
+
+    ID = "id"
+    ONBOARDING_STATE = "onboardingState"
+    ONBOARDING_FAILURE_DETAILS = "onboardingFailureDetails"
+
+
+class PackageOnboardingStates:
+    """Class for E-VNFM VNF package onboarding states"""
+
+    CREATED = "CREATED"
+    UPLOADING = "UPLOADING"
+    PROCESSING = "PROCESSING"
+    ONBOARDED = "ONBOARDED"
+    ERROR = "ERROR"
+
+
+class EvnfmPackagePaths:
+    """Class for E-VNFM VNF package management API paths"""
+
+    _VNFPKGM_V1 = "/vnfpkgm/v1"
+
+    VNF_PACKAGES = f"{_VNFPKGM_V1}/vnf_packages"
+    VNF_PACKAGE = f"{VNF_PACKAGES}/{{package_id}}"
+    PACKAGE_CONTENT = f"{VNF_PACKAGE}/package_content"
+
+
+class EvnfmApiClients:
+    """Class for clients of EvnfmApi used by the apps, attribute names of EvnfmApi instance"""
+
+    PACKAGES = "packages"
+    PACKAGES_CLIENT = "packages_client"
+    INSTANCES = "instances"
+    INSTANCES_CLIENT = "instances_client"
+    CLUSTERS = "clusters"
+    CLUSTERS_CLIENT = "clusters_client"
+
+    ALL = (
+        PACKAGES,
+        PACKAGES_CLIENT,
+        INSTANCES,
+        INSTANCES_CLIENT,
+        CLUSTERS,
+        CLUSTERS_CLIENT,
+    )
@@ -1,30 +1,40 @@
 """
 Module with EvnfmApp class
 """
+from functools import cached_property
 from pathlib import Path
 from urllib import parse
 
-from core_libs.common.custom_exceptions import (
-    UnexpectedInstanceState,
-    UnexpectedOperationType,
-)
-from core_libs.common.file_utils import FileUtils
+from core_libs.common.custom_exceptions import UnexpectedOperationType
 from core_libs.common.misc_utils import wait_for
 from core_libs.eo.evnfm.evnfm_api import EvnfmApi
 from core_libs.eo.evnfm.evnfm_constants import (
     InstantiateFields,
     InstantiateStates,
     Operations,
-    OperationState,
     OperationTypes,
 )
 from core_libs.eo.evnfm.evnfm_test_data import EvnfmTestData
 from requests import Response
 
-from apps.evnfm.data.constants import InstanceFields, OperationFields
+from apps.evnfm.data.constants import (
+    EvnfmApiClients,
+    InstanceFields,
+    OperationFields,
+)
+from apps.evnfm.lcm_operation_tracker import (
+    LCM_OPERATION_TIMEOUT,
+    LcmOperationTracker,
+)
+from apps.evnfm.package_upload_api import EvnfmPackageUploadApi
+from libs.common.api_call_stats import ApiClients, count_session_requests
+from libs.common.artefact_cache import ARTEFACT_CACHE
 from libs.common.config_reader import ConfigReader
 from libs.common.constants import DEFAULT_DOWNLOAD_LOCATION, EvnfmConfigKeys
 from libs.common.custom_exceptions import UnexpectedResponseContentError
+from libs.common.session_pool import SESSION_POOL
+from libs.common.step_timer import timed_step
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
 from libs.utils.logging.logger import log_exception, logger
 
 
@@ -38,8 +48,6 @@ class EvnfmApp:
         self.evnfm_test_data = EvnfmTestData()
         self.vnf_lcm_op_occ_id = None
         self.instance_id = None
-        self._api = None
-        self._default_api = None
 
     @property
     def hostname(self):
@@ -78,27 +86,80 @@ class EvnfmApp:
 
     @property
     def api(self) -> EvnfmApi:
-        """Property that create connection to EVNFM with non-default user"""
-        if not self._api:
-            self._api = EvnfmApi(
-                url=self.hostname,
-                username=self.user_name,
-                password=self.user_password,
-                tenant=self.tenant,
-            )
-        return self._api
+        """Property that returns shared connection to EVNFM with non-default user"""
+        return self._get_shared_api(self.user_name, self.user_password)
 
     @property
     def default_api(self) -> EvnfmApi:
-        """Property that create connection to EVNFM with default user"""
-        if not self._default_api:
-            self._default_api = EvnfmApi(
-                url=self.hostname,
-                username=self.default_user_name,
-                password=self.default_user_password,
-                tenant=self.tenant,
-            )
-        return self._default_api
+        """Property that returns shared connection to EVNFM with default user"""
+        return self._get_shared_api(self.default_user_name, self.default_user_password)
+
+    def _get_shared_api(self, username: str, password: str) -> EvnfmApi:
+        """Get EVNFM connection from session pool shared by all apps working with the same host and user
+        Args:
+            username: EVNFM user name
+            password: EVNFM user password
+        Returns:
+            EvnfmApi instance
+        """
+        return SESSION_POOL.get(
+            key=self._get_api_session_key(username),
+            factory=lambda: self._create_api(username, password),
+        )
+
+    def _create_api(self, username: str, password: str) -> EvnfmApi:
+        """Login to EVNFM and count requests sent over sessions of the EVNFM clients used by the apps
+        Args:
+            username: EVNFM user name
+            password: EVNFM user password
+        Returns:
+            EvnfmApi instance
+        """
+        api = EvnfmApi(
+            url=self.hostname,
+            username=username,
+            password=password,
+            tenant=self.tenant,
+        )
+        # clients may share one session, its requests must be counted once
+        sessions = {}
+        for client_name in EvnfmApiClients.ALL:
+            session = getattr(api, client_name).session
+            sessions[id(session)] = session
+        for session in sessions.values():
+            count_session_requests(session, ApiClients.EVNFM)
+        return api
+
+    def _get_api_session_key(self, username: str) -> tuple:
+        """Get session pool key of EVNFM connection
+        Args:
+            username: EVNFM user name
+        Returns:
+            session pool key
+        """
+        return EvnfmApi.__name__, self.hostname, username, self.tenant
+
+    def invalidate_api_sessions(self) -> None:
+        """Drop shared EVNFM connections of this app users, next API call logs in again,
+        e.g. when the host was switched to another site and old token is not accepted anymore
+        """
+        for username in self.user_name, self.default_user_name:
+            SESSION_POOL.invalidate(self._get_api_session_key(username))
+
+    @property
+    def package_upload_api(self) -> EvnfmPackageUploadApi:
+        """Property that returns package upload API over shared connection to EVNFM with non-default user"""
+        return EvnfmPackageUploadApi(session=self.api.packages.session)
+
+    @cached_property
+    def lcm_tracker(self) -> LcmOperationTracker:
+        """Tracker that waits for LCM operations of this app concurrently"""
+        return LcmOperationTracker(api_getter=lambda: self.api)
+
+    @property
+    def lcm_operation_timeout(self) -> int:
+        """Time in seconds for LCM operation of this app to reach final state"""
+        return LCM_OPERATION_TIMEOUT
 
     @staticmethod
     def get_vnf_lcm_op_occ_id_from_response(response: Response) -> str:
@@ -114,6 +175,7 @@ class EvnfmApp:
         logger.info(f"Operation ID: {vnf_lcm_op_occ_id}")
         return vnf_lcm_op_occ_id
 
+    @timed_step()
     def verify_scale_operation(
         self,
         instance_id: str,
@@ -139,27 +201,16 @@ class EvnfmApp:
 
         scale_text = "higher" if scale_index > 0 else "less"
 
-        logger.info("Assert that pending operation status is SCALE")
-        operation_type = (
-            self.api.instances.query_vnflcm_occ_id(self.vnf_lcm_op_occ_id)
-            .json()
-            .get(OperationFields.OPERATION)
+        logger.info("Wait for the Scale operation to be completed")
+        operation = self.lcm_tracker.wait(
+            self.vnf_lcm_op_occ_id, timeout=self.lcm_operation_timeout
         )
+
+        logger.info("Assert that finished operation is SCALE")
+        operation_type = operation.get(OperationFields.OPERATION)
         assert operation_type == OperationTypes.SCALE, log_exception(
             f"Operation is not SCALE. {operation_type}"
         )
-        logger.info("Wait for the Scale operation to be completed")
-        self.api.instances_client.wait_for_lcm_operation(self.vnf_lcm_op_occ_id)
-
-        logger.info("Assert that finished operation state is COMPLETED")
-        operation_state = (
-            self.api.instances.query_vnflcm_occ_id(self.vnf_lcm_op_occ_id)
-            .json()
-            .get(OperationFields.OPERATION_STATE)
-        )
-        assert operation_state == OperationState.COMPLETED, log_exception(
-            f"Received operation type is not {OperationState.COMPLETED}"
-        )
         logger.info(
             f"Assert that scale status is {scale_text} by 1 than before {scale_operation}."
         )
@@ -185,52 +236,40 @@ class EvnfmApp:
         logger.debug(f"HOSTNAME: {hostname}")
         return hostname
 
+    @timed_step()
     def verify_heal_operation(self) -> None:
         """
         Verifies if the HEAL operation performed successfully or not
         Raises:
             UnexpectedOperationType: in case of unexpected operation type
-            UnexpectedInstanceState: in case of unexpected instance operation status
+            UnexpectedInstanceState: in case operation is not completed successfully
         """
-        logger.info("Assert that pending operation status is HEAL")
-        operation_type = (
-            self.api.instances.query_vnflcm_occ_id(self.vnf_lcm_op_occ_id)
-            .json()
-            .get(OperationFields.OPERATION)
+        logger.info("Wait for the HEAL operation to be completed")
+        operation = self.lcm_tracker.wait(
+            self.vnf_lcm_op_occ_id, timeout=self.lcm_operation_timeout
         )
+
+        logger.info("Assert that finished operation is HEAL")
+        operation_type = operation.get(OperationFields.OPERATION)
         if not operation_type == OperationTypes.HEAL:
             raise UnexpectedOperationType(
                 log_exception(f"Operation type is not HEAL. {operation_type}")
             )
-        logger.info("Wait for the HEAL operation to be completed")
-        self.api.instances_client.wait_for_lcm_operation(self.vnf_lcm_op_occ_id)
-
-        logger.info("Assert that finished operation state is COMPLETED")
-        operation_state = (
-            self.api.instances.query_vnflcm_occ_id(self.vnf_lcm_op_occ_id)
-            .json()
-            .get(OperationFields.OPERATION_STATE)
-        )
-        if not operation_state == OperationState.COMPLETED:
-            raise UnexpectedInstanceState(
-                log_exception(
-                    f"Received operation type is not {OperationState.COMPLETED}"
-                )
-            )
 
     @staticmethod
-    def download_file(file_path: str) -> Path:
+    def download_file(
+        file_path: str, destination_dir: str | Path = DEFAULT_DOWNLOAD_LOCATION
+    ) -> Path:
         """
         Download the file to the system
         Args:
             file_path: Path to file
+            destination_dir: Directory to download the file to
         Returns:
             Local file path
         """
         logger.info(f"Downloading file: {file_path!r}")
-        return FileUtils.check_path_for_url(
-            file_path, DEFAULT_DOWNLOAD_LOCATION, path_like=True
-        )
+        return ARTEFACT_CACHE.fetch(file_path, destination_dir)
 
     def is_package_instantiated(
         self,
@@ -261,12 +300,13 @@ class EvnfmApp:
             )
             return instantiate_status == InstantiateStates.INSTANTIATED
 
-        wait_for(
-            check_instance_status,
-            interval=5.0,
-            timeout=120,
-            exc_msg=f"Instantiation has got an unexpected state! {instantiate_status!r}",
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            wait_for(
+                check_instance_status,
+                interval=5.0,
+                timeout=120,
+                exc_msg=f"Instantiation has got an unexpected state! {instantiate_status!r}",
+            )
 
     def is_instance_exists(self, descriptor_id: str) -> bool:
         """
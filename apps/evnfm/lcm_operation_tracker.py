@@ -0,0 +1,214 @@
+"""Module with LcmOperationTracker class for tracking many E-VNFM LCM operations at once"""
+from collections import deque
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable
+
+from core_libs.common.custom_exceptions import UnexpectedInstanceState
+from core_libs.eo.evnfm.evnfm_api import EvnfmApi
+
+from apps.evnfm.data.constants import LcmOperationStates, OperationFields
+from libs.common.custom_exceptions import ThreadTimeoutExpiredError
+from libs.common.thread_runner import ThreadRunner
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+LCM_OPERATION_POLL_INTERVAL = 10
+LCM_OPERATION_TIMEOUT = 30 * 60
+LATENCY_HISTORY_SIZE = 10000
+
+
+@dataclass
+class LcmOperation:
+    """Tracked E-VNFM LCM operation occurrence"""
+
+    op_occ_id: str
+    timeout: int
+    started: float = field(default_factory=monotonic)
+    finished: float | None = None
+    operation: str | None = None
+    state: str | None = None
+    future: Future = field(default_factory=Future)
+
+    @property
+    def latency(self) -> float | None:
+        """Time in seconds from operation registration to its final state"""
+        return self.finished - self.started if self.finished else None
+
+    @property
+    def is_expired(self) -> bool:
+        """True if operation didn't reach final state within timeout"""
+        return monotonic() - self.started > self.timeout
+
+
+class LcmOperationTracker:
+    """
+    Tracks many vnfLcmOpOcc IDs by one polling thread.
+    Every registered operation gets a future that is resolved with the final operation occurrence data
+    when operation is COMPLETED, or failed with UnexpectedInstanceState when operation fails.
+    Operations are dropped when they are waited for, only their latencies are kept.
+    """
+
+    def __init__(
+        self,
+        api_getter: Callable[[], EvnfmApi],
+        interval: int = LCM_OPERATION_POLL_INTERVAL,
+    ):
+        """
+        Args:
+            api_getter: callable that returns EvnfmApi instance to query operations with
+            interval: interval between polling rounds
+        """
+        self._api_getter = api_getter
+        self._interval = interval
+        self._operations: dict[str, LcmOperation] = {}
+        self._latencies: deque[tuple[str, float]] = deque(maxlen=LATENCY_HISTORY_SIZE)
+        self._lock = Lock()
+        self._poller: ThreadRunner | None = None
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    @property
+    def latencies(self) -> dict[str, float]:
+        """Latencies of the last finished operations in seconds by vnfLcmOpOcc ID"""
+        with self._lock:
+            operations = list(self._operations.values())
+            latencies = dict(self._latencies)
+        latencies.update(
+            (operation.op_occ_id, operation.latency)
+            for operation in operations
+            if operation.latency is not None
+        )
+        return latencies
+
+    def get_operation(self, op_occ_id: str) -> LcmOperation:
+        """Get tracked operation that is not waited for yet
+        Args:
+            op_occ_id: vnfLcmOpOcc ID
+        Returns:
+            LcmOperation instance
+        """
+        return self._operations[op_occ_id]
+
+    def track(self, op_occ_id: str, timeout: int = LCM_OPERATION_TIMEOUT) -> Future:
+        """Register operation for tracking
+        Args:
+            op_occ_id: vnfLcmOpOcc ID
+            timeout: time for operation to reach final state
+        Returns:
+            future that is resolved with final operation occurrence data
+        """
+        with self._lock:
+            if op_occ_id not in self._operations:
+                self._logger.info(f"Start tracking LCM operation {op_occ_id}")
+                self._operations[op_occ_id] = LcmOperation(op_occ_id, timeout=timeout)
+            if self._poller is None or not self._poller.is_alive():
+                self._poller = ThreadRunner(
+                    target=self._poll, name="LCM_TRACKER", daemon=True
+                )
+                self._poller.start()
+            return self._operations[op_occ_id].future
+
+    def wait(self, op_occ_id: str, timeout: int = LCM_OPERATION_TIMEOUT) -> dict:
+        """Track operation and wait for its final state
+        Args:
+            op_occ_id: vnfLcmOpOcc ID
+            timeout: time for operation to reach final state
+        Raises:
+            UnexpectedInstanceState: when operation is not completed successfully
+        Returns:
+            final operation occurrence data
+        """
+        future = self.track(op_occ_id, timeout=timeout)
+        try:
+            return future.result()
+        finally:
+            self._release([op_occ_id])
+
+    def wait_all(
+        self, op_occ_ids: list[str], timeout: int = LCM_OPERATION_TIMEOUT
+    ) -> dict[str, dict | Exception]:
+        """Track operations and wait for all of them to reach final state concurrently
+        Args:
+            op_occ_ids: vnfLcmOpOcc IDs
+            timeout: time for every operation to reach final state
+        Returns:
+            final operation occurrence data or raised exception by vnfLcmOpOcc ID
+        """
+        futures = {op_id: self.track(op_id, timeout=timeout) for op_id in op_occ_ids}
+        wait(futures.values())
+        self._release(op_occ_ids)
+        return {
+            op_id: future.exception() or future.result()
+            for op_id, future in futures.items()
+        }
+
+    def _release(self, op_occ_ids: list[str]) -> None:
+        """Stop tracking finished operations and keep their latencies
+        Args:
+            op_occ_ids: vnfLcmOpOcc IDs
+        """
+        with self._lock:
+            for op_id in op_occ_ids:
+                operation = self._operations.get(op_id)
+                if operation is None or not operation.future.done():
+                    continue
+                del self._operations[op_id]
+                if operation.latency is not None:
+                    self._latencies.append((op_id, operation.latency))
+
+    def _poll(self) -> None:
+        """Poll all pending operations until all of them are finished"""
+        while True:
+            with self._lock:
+                pending = [
+                    op for op in self._operations.values() if not op.future.done()
+                ]
+                if not pending:
+                    self._poller = None
+                    return
+            for operation in pending:
+                self._poll_operation(operation)
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                sleep(self._interval)
+
+    def _poll_operation(self, operation: LcmOperation) -> None:
+        """Query operation occurrence and resolve its future if operation is finished
+        Args:
+            operation: LcmOperation instance
+        """
+        try:
+            data = (
+                self._api_getter()
+                .instances.query_vnflcm_occ_id(operation.op_occ_id)
+                .json()
+            )
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._logger.warning(f"Failed to query {operation.op_occ_id}: {err}")
+            data = {}
+
+        operation.operation = data.get(OperationFields.OPERATION, operation.operation)
+        operation.state = data.get(OperationFields.OPERATION_STATE, operation.state)
+
+        if operation.state in LcmOperationStates.FINAL:
+            operation.finished = monotonic()
+            self._logger.info(
+                f"LCM operation {operation.operation} {operation.op_occ_id} finished "
+                f"with state {operation.state} in {operation.latency:.1f} seconds"
+            )
+            if operation.state == LcmOperationStates.COMPLETED:
+                operation.future.set_result(data)
+            else:
+                operation.future.set_exception(
+                    UnexpectedInstanceState(
+                        f"LCM operation {operation.op_occ_id} finished with state {operation.state}: {data}"
+                    )
+                )
+        elif operation.is_expired:
+            operation.future.set_exception(
+                ThreadTimeoutExpiredError(
+                    f"LCM operation {operation.op_occ_id} didn't finish within {operation.timeout} seconds, "
+                    f"last state: {operation.state}"
+                )
+            )
@@ -0,0 +1,146 @@
+"""Module with EvnfmPackageUploadApi class for onboarding of big CSAR packages with streaming upload"""
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic, sleep
+
+from core_libs.common.base_rest import BaseREST
+
+from apps.evnfm.data.constants import (
+    EvnfmPackagePaths,
+    PackageFields,
+    PackageOnboardingStates,
+)
+from libs.common.custom_exceptions import PackageOnboardingError
+from libs.common.streaming_multipart import StreamingMultipartEncoder, UploadMetrics
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+ONBOARDING_POLL_INTERVAL = 5
+UPLOAD_CONNECT_TIMEOUT = 30
+UPLOAD_RESPONSE_TIMEOUT = 10 * 60
+
+
+@dataclass
+class OnboardingTimings:
+    """Package onboarding time split into upload transfer, upload response and server processing"""
+
+    upload: UploadMetrics
+    upload_response_time: float
+    processing_time: float | None = None
+
+    def to_report(self) -> dict:
+        """Timings report
+        Returns:
+            timings report dictionary
+        """
+        return {
+            **self.upload.to_report(),
+            "upload_response_time": round(self.upload_response_time, 3),
+            "processing_time": round(self.processing_time, 3)
+            if self.processing_time is not None
+            else None,
+        }
+
+
+class EvnfmPackageUploadApi(BaseREST):
+    """
+    E-VNFM VNF package management API that uploads package content as multipart body streamed
+    from disk by chunks, so memory usage doesn't depend on package size, and measures upload
+    transfer time, time to upload response and package processing time on the server
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    def onboard_csar_package(
+        self, payload: dict, package_path: str | Path, timeout: int
+    ) -> tuple[str, OnboardingTimings]:
+        """Create package resource, upload package content and wait until package is onboarded
+        Args:
+            payload: create VNF package resource request body
+            package_path: path of CSAR package
+            timeout: max time to wait for package onboarding after upload
+        Returns:
+            package id and onboarding timings
+        """
+        package_id = self.create_package_resource(payload)
+        timings = self.upload_package_content(package_id, package_path)
+        processing_started = monotonic()
+        self.wait_package_onboarded(package_id, timeout)
+        timings.processing_time = monotonic() - processing_started
+        self._logger.info(
+            f"Package {package_id} onboarding timings: {timings.to_report()}"
+        )
+        return package_id, timings
+
+    def create_package_resource(self, payload: dict) -> str:
+        """Create VNF package resource
+        Args:
+            payload: create VNF package resource request body
+        Returns:
+            package id
+        """
+        response = self.post(
+            f"{self.url}{EvnfmPackagePaths.VNF_PACKAGES}", json=payload
+        )
+        return response.json()[PackageFields.ID]
+
+    def upload_package_content(
+        self, package_id: str, package_path: str | Path
+    ) -> OnboardingTimings:
+        """Upload package content streamed from disk
+        Args:
+            package_id: package id
+            package_path: path of CSAR package
+        Returns:
+            onboarding timings without processing time
+        """
+        encoder = StreamingMultipartEncoder(package_path)
+        self._logger.info(
+            f"Uploading {package_path} ({encoder.len} bytes) to package {package_id}"
+        )
+        try:
+            # session is used directly, so the body is not read or logged by request wrappers
+            response = self.session.put(
+                f"{self.url}{EvnfmPackagePaths.PACKAGE_CONTENT.format(package_id=package_id)}",
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
+                verify=False,
+                timeout=(UPLOAD_CONNECT_TIMEOUT, UPLOAD_RESPONSE_TIMEOUT),
+            )
+        finally:
+            encoder.close()
+        upload_response_time = monotonic() - (encoder.metrics.finished or monotonic())
+        response.raise_for_status()
+        return OnboardingTimings(
+            upload=encoder.metrics, upload_response_time=upload_response_time
+        )
+
+    def wait_package_onboarded(self, package_id: str, timeout: int) -> None:
+        """Wait until package onboarding state is ONBOARDED
+        Args:
+            package_id: package id
+            timeout: max time to wait
+        Raises:
+            PackageOnboardingError: if onboarding failed or timeout expired
+        """
+        deadline = monotonic() + timeout
+        state = None
+        while monotonic() < deadline:
+            package = self.get(
+                f"{self.url}{EvnfmPackagePaths.VNF_PACKAGE.format(package_id=package_id)}"
+            ).json()
+            state = package.get(PackageFields.ONBOARDING_STATE)
+            if state == PackageOnboardingStates.ONBOARDED:
+                return
+            if state == PackageOnboardingStates.ERROR:
+                raise PackageOnboardingError(
+                    f"Package {package_id} onboarding failed: "
+                    f"{package.get(PackageFields.ONBOARDING_FAILURE_DETAILS)}"
+                )
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                sleep(ONBOARDING_POLL_INTERVAL)
+        raise PackageOnboardingError(
+            f"Package {package_id} is not onboarded within {timeout} seconds, state: {state}"
+        )
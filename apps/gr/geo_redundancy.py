@@ -1,24 +1,35 @@
 """
 Module that contains relative Geographical Redundancy functions
 """
+from contextlib import asynccontextmanager, contextmanager
 from functools import cached_property
+from typing import AsyncIterator, Iterator
 
 from core_libs.common.constants import CommonConfigKeys
-from core_libs.common.misc_utils import wait_for
+from core_libs.common.misc_utils import format_url, wait_for
 
 from apps.gr.data.constants import GrSearchPatterns, GrTimeouts, GeoRecoveryStatuses
 from apps.gr.geo_base import GeoBase
 from apps.gr.geo_status import GeoStatusApp
 from apps.gr.gr_docker_registry_app import GrDockerRegistryApp
 from apps.gr.gr_rest.gr_rest_api_client import GrRestApiClient
+from libs.common.availability_prober import (
+    AvailabilityProber,
+    ProbeEndpoint,
+    is_http_endpoint_available,
+)
 from libs.common.bur_sftp_server.bur_sftp_server import BurSftpServer
 from libs.common.config_reader import ConfigReader
+from libs.common.constants import EvnfmConfigKeys
 from libs.common.custom_exceptions import (
     GrBackupIdNotFoundError,
     GrRecoveryStatusNotFound,
 )
 from libs.common.deployment_manager.dm_constants import DeploymentManagerCmds
+from libs.common.env_variables import ENV_VARS
+from libs.common.step_timer import timed_step
 from libs.common.thread_runner import ThreadRunner
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
 from libs.utils.common_utils import (
     is_pattern_match_text,
     search_with_pattern,
@@ -44,6 +55,7 @@ class GeoRedundancyApp(GeoBase):
         self._active_site_gr_registry = None
         self._passive_site_gr_registry = None
         self._sftp_server = None
+        self.availability_report: dict | None = None
 
     @property
     def sftp_server(self) -> BurSftpServer:
@@ -88,6 +100,7 @@ class GeoRedundancyApp(GeoBase):
         """Passive Site name"""
         return self.passive_site_config.read_section(CommonConfigKeys.ENV_NAME)
 
+    @timed_step()
     def verify_gr_availability(
         self, output_pattern: str = GrSearchPatterns.AVAILABILITY_AVAILABLE
     ) -> bool:
@@ -114,9 +127,75 @@ class GeoRedundancyApp(GeoBase):
             output = self.run_dm_docker_cmd(cmd)
             return is_pattern_match_text(output_pattern, output, group=0)
 
-        return wait_for(
-            check_availability, timeout=timeout, interval=interval, exc_msg=exc_msg
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            return wait_for(
+                check_availability, timeout=timeout, interval=interval, exc_msg=exc_msg
+            )
+
+    def create_availability_prober(self) -> AvailabilityProber:
+        """
+        Create prober of the EVNFM host, GR REST metadata endpoints and GR docker registries of both sites
+        Returns:
+            AvailabilityProber instance
+        """
+        evnfm_url = format_url(
+            self.active_site_config.read_section(EvnfmConfigKeys.EVNFM_HOST)
         )
+        endpoints = [
+            ProbeEndpoint("evnfm", lambda: is_http_endpoint_available(evnfm_url))
+        ]
+        for site_name, api_client, registry in (
+            (
+                self.active_site_name,
+                self.api_client_active_site,
+                self.active_site_gr_registry,
+            ),
+            (
+                self.passive_site_name,
+                self.api_client_passive_site,
+                self.passive_site_gr_registry,
+            ),
+        ):
+            endpoints += [
+                ProbeEndpoint(
+                    f"gr_metadata_{site_name}",
+                    lambda client=api_client: client.mgmt.get_metadata().ok,
+                ),
+                ProbeEndpoint(f"gr_registry_{site_name}", registry.api_client.ping),
+            ]
+        return AvailabilityProber(endpoints)
+
+    @contextmanager
+    def availability_probing(self) -> Iterator[AvailabilityProber]:
+        """Context manager that probes API availability in background thread while the block is running"""
+        prober = self.create_availability_prober()
+        try:
+            with prober.probing():
+                yield prober
+        finally:
+            self.availability_report = prober.report
+
+    @asynccontextmanager
+    async def availability_probing_async(self) -> AsyncIterator[AvailabilityProber]:
+        """Async context manager that probes API availability while the block is running"""
+        prober = self.create_availability_prober()
+        try:
+            async with prober.probing_async():
+                yield prober
+        finally:
+            self.availability_report = prober.report
+
+    @staticmethod
+    def _is_probe_availability(probe_availability: bool | None) -> bool:
+        """Resolve if API availability should be probed during switchover
+        Args:
+            probe_availability: explicit value, PROBE_SWITCHOVER_AVAILABILITY is used if None
+        Returns:
+            True if availability should be probed
+        """
+        if probe_availability is None:
+            return ENV_VARS.is_probe_switchover_availability
+        return probe_availability
 
     def _create_switchover_cmd(
         self,
@@ -141,6 +220,7 @@ class GeoRedundancyApp(GeoBase):
             backup_id=backup_id,
         )
 
+    @timed_step()
     def make_switchover(
         self,
         *,
@@ -159,59 +239,81 @@ class GeoRedundancyApp(GeoBase):
         logger.info("Switchover execution completed")
         return stdout_switchover
 
+    @timed_step()
     def make_and_verify_switchover(
         self,
         *,
         backup_id: str | None = None,
         output_pattern: str = GrSearchPatterns.SWITCH_OVER_SUCCESS_STATUS,
+        probe_availability: bool | None = None,
     ) -> bool:
         """
         Function that makes switchover operation and verifies the output with the provided pattern
         Args:
             backup_id: if backup id provided it will be used for switchover otherwise DM will be decided automatically
             output_pattern: pattern for check switchover output
+            probe_availability: if True API availability is probed during switchover,
+                report is stored in availability_report, PROBE_SWITCHOVER_AVAILABILITY is used if not provided
         Returns:
             True if switchover success else False
         """
-        stdout_switchover = self.make_switchover(backup_id=backup_id)
+        if self._is_probe_availability(probe_availability):
+            with self.availability_probing():
+                stdout_switchover = self.make_switchover(backup_id=backup_id)
+        else:
+            stdout_switchover = self.make_switchover(backup_id=backup_id)
         return is_pattern_match_text(output_pattern, stdout_switchover, group=0)
 
-    async def make_switchover_async(self, backup_id: str | None = None) -> str:
+    async def make_switchover_async(
+        self, backup_id: str | None = None, probe_availability: bool | None = None
+    ) -> str:
         """
         Function that makes switchover operation in async mode
 
         Args:
             backup_id: if backup id provided it will be used for switchover otherwise DM will be decided automatically
+            probe_availability: if True API availability is probed during switchover,
+                report is stored in availability_report, PROBE_SWITCHOVER_AVAILABILITY is used if not provided
 
         Returns:
             Switchover output
         """
         logger.info("Execute switchover...")
         switchover_cmd = self._create_switchover_cmd(backup_id)
-        stdout_switchover = await self.run_dm_docker_cmd_async(switchover_cmd)
+        if self._is_probe_availability(probe_availability):
+            async with self.availability_probing_async():
+                stdout_switchover = await self.run_dm_docker_cmd_async(switchover_cmd)
+        else:
+            stdout_switchover = await self.run_dm_docker_cmd_async(switchover_cmd)
         logger.info("Switchover execution completed")
         return stdout_switchover
 
     def make_and_verify_switchover_in_separate_thread(
-        self, backup_id: str | None = None, thread_name: str = "SWITCHOVER"
+        self,
+        backup_id: str | None = None,
+        thread_name: str = "SWITCHOVER",
+        probe_availability: bool | None = None,
     ) -> ThreadRunner:
         """
         Make switchover in separate python thread
         Args:
             backup_id: if backup id provided it will be used for switchover otherwise DM will be decided automatically
             thread_name: specify thread name if needed
+            probe_availability: if True API availability is probed during switchover,
+                report is stored in availability_report, PROBE_SWITCHOVER_AVAILABILITY is used if not provided
         Returns:
             threading instance with running switchover
         """
         switchover_thread = ThreadRunner(
             target=self.make_and_verify_switchover,
-            kwargs={"backup_id": backup_id},
+            kwargs={"backup_id": backup_id, "probe_availability": probe_availability},
             name=thread_name,
             daemon=True,
         )
         switchover_thread.start()
         return switchover_thread
 
+    @timed_step()
     def get_backup_id_from_availability(self) -> str:
         """
         Get backup id from availability command output
@@ -228,6 +330,7 @@ class GeoRedundancyApp(GeoBase):
             raise GrBackupIdNotFoundError(f"Backup ID can't be found in {output=}")
         return backup_id
 
+    @timed_step()
     def verify_images_sync_between_registries(self) -> bool:
         """
         Verify images synced between Active and Passive site GR docker registries
@@ -265,16 +368,18 @@ class GeoRedundancyApp(GeoBase):
 
             return result
 
-        return wait_for(
-            is_passive_site_gr_docker_registry_sync_with_active_site,
-            timeout=GrTimeouts.IMAGE_SYNC,
-            interval=20,
-            exc_msg=(
-                "Images are not properly synced between Active and Passive sites "
-                f"GR docker registries within timeout: {GrTimeouts.IMAGE_SYNC / 60} min"
-            ),
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            return wait_for(
+                is_passive_site_gr_docker_registry_sync_with_active_site,
+                timeout=GrTimeouts.IMAGE_SYNC,
+                interval=20,
+                exc_msg=(
+                    "Images are not properly synced between Active and Passive sites "
+                    f"GR docker registries within timeout: {GrTimeouts.IMAGE_SYNC / 60} min"
+                ),
+            )
 
+    @timed_step()
     def verify_backup_id_updated_in_availability(self, interval: float = 5.0) -> bool:
         """
         Verify Backup ID is updated in GR Availability cmd output within timeout
@@ -286,13 +391,14 @@ class GeoRedundancyApp(GeoBase):
         )
         init_backup_id = self.get_backup_id_from_availability()
 
-        return wait_for(
-            lambda: init_backup_id != self.get_backup_id_from_availability(),
-            timeout=GrTimeouts.AVAILABILITY,
-            interval=interval,
-            exc_msg=f"Backup ID is not updated in GR Availability cmd output "
-            f"within timeout {GrTimeouts.AVAILABILITY}",
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            return wait_for(
+                lambda: init_backup_id != self.get_backup_id_from_availability(),
+                timeout=GrTimeouts.AVAILABILITY,
+                interval=interval,
+                exc_msg=f"Backup ID is not updated in GR Availability cmd output "
+                f"within timeout {GrTimeouts.AVAILABILITY}",
+            )
 
     def get_recovery_status(self) -> str:
         """
@@ -315,6 +421,7 @@ class GeoRedundancyApp(GeoBase):
             )
         return status
 
+    @timed_step()
     def verify_recovery_status(
         self, expected_status: GeoRecoveryStatuses, timeout: int = 30
     ) -> bool:
@@ -344,13 +451,15 @@ class GeoRedundancyApp(GeoBase):
                 )
             return result
 
-        return wait_for(
-            is_recovery_status_expected,
-            timeout=timeout,
-            interval=10,
-            exc_msg=f"Recovery Status not in {expected_status=}",
-        )
+        with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+            return wait_for(
+                is_recovery_status_expected,
+                timeout=timeout,
+                interval=10,
+                exc_msg=f"Recovery Status not in {expected_status=}",
+            )
 
+    @timed_step()
     def update_site_recovery_status(self) -> bool:
         """
         Execute and verify update recovery state deployment management cmd
@@ -15,6 +15,7 @@ from libs.common.custom_exceptions import (
     GrStatusOutputError,
     GrStatusOutputMissmatchError,
 )
+from libs.common.step_timer import timed_step
 from libs.utils.common_utils import search_with_pattern, get_datetime_from_str
 from libs.utils.logging.logger import logger, log_exception
 
@@ -24,6 +25,7 @@ class GeoStatusApp(GeoBase):
     Class that contains relative Geo Status fields and operations
     """
 
+    @timed_step()
     def make_and_verify_geo_status_command(self) -> bool:
         """
         Execute Deployment Manager GR Status command and verify output is match conditions for switchover:
@@ -73,6 +75,7 @@ class GeoStatusApp(GeoBase):
             exc_msg="GR Status does not match switchover conditions",
         )
 
+    @timed_step()
     def geo_status_if_primary_not_alive(self) -> bool:
         """
         Execute Deployment Manager GR Status command when primary site are not available
@@ -3,6 +3,8 @@
 from apps.gr.gr_rest.gr_mgmt import GrApiMgmt
 from apps.gr.gr_rest.gr_user_session import GrUserSession
 from libs.common.config_reader import ConfigReader
+from libs.common.constants import GrConfigKeys
+from libs.common.session_pool import SESSION_POOL
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 
 
@@ -10,10 +12,25 @@ class GrRestApiClient:
     """A class for interacting with the GR REST API"""
 
     def __init__(self, site_config: ConfigReader):
-        _session = GrUserSession(site_config=site_config)
+        self._site_config = site_config
         self._logger = set_eo_gr_logger_for_class(self)
 
-        self.mgmt = GrApiMgmt(session=_session)
+    @property
+    def mgmt(self) -> GrApiMgmt:
+        """GR management API over user session shared per (host, user)"""
+        return GrApiMgmt(session=self._session)
+
+    @property
+    def _session(self) -> GrUserSession:
+        """GR user session from session pool"""
+        return SESSION_POOL.get(
+            key=(
+                GrUserSession.__name__,
+                self._site_config.read_section(GrConfigKeys.GR_HOST),
+                self._site_config.read_section(GrConfigKeys.GR_USER_NAME),
+            ),
+            factory=lambda: GrUserSession(site_config=self._site_config),
+        )
 
     def get_metadata(self) -> dict:
         """Get cluster (site) metadata
@@ -15,7 +15,6 @@ from core_libs.common.custom_exceptions import (
     AssetNotFoundException,
     UnexpectedInstanceState,
 )
-from core_libs.eo.ccd.k8s_api_client import K8sApiClient
 from core_libs.eo.constants import ApiKeys
 from core_libs.eo.evnfm.evnfm_constants import Operations
 from core_libs.eo.vmvnfm.vmvnfm_cli import VmVnfmCli
@@ -28,8 +27,16 @@ from apps.vmvnfm.data.service_data import VmvnfmServiceLabel, VmvnfmServiceNames
 from apps.vmvnfm.data.service_model import VmvnfmServiceModel
 from apps.vmvnfm.data.services import ECM_SERVICES, VIM_SERVICE
 from apps.vmvnfm.data.vmvnfm_artefact_model import VmvnfmArtefactModel
+from apps.vmvnfm.vnflcm_shell import VnflcmShell
+from apps.vmvnfm.vnflcm_tables import (
+    VnflcmTable,
+    VnflcmTablesCache,
+    get_uuid_cell,
+)
 from apps.vmvnfm.workflow_service import WorkflowService
 from libs.common.config_reader import ConfigReader
+from libs.common.k8s_client_registry import K8S_CLIENTS
+from libs.common.step_timer import timed_step
 from libs.common.vmvnfm_logging.vmvnfm_logger_setter import VmvnfmLogLevelSetter
 from libs.utils.logging.logger import log_exception, logger
 
@@ -42,7 +49,7 @@ class VmvnfmApp(EvnfmApp):
     def __init__(self, config: ConfigReader):
         super().__init__(config)
         self.config = config
-        self.k8s_client = K8sApiClient(
+        self.k8s_client = K8S_CLIENTS.get_client(
             namespace=self.config.read_section(CcdConfigKeys.CODEPLOY_NAMESPACE),
             kubeconfig_path=self.config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH),
         )
@@ -50,6 +57,17 @@ class VmvnfmApp(EvnfmApp):
         self.workflow_service = WorkflowService(config, vnvnfm_cli=self.cli)
         self.scale_parameters = {}
         self.log_level_setter = VmvnfmLogLevelSetter(k8s_client=self.k8s_client)
+        self.service_tables = VnflcmTablesCache(
+            list_services=lambda name: self.cli.list_services(service_name=name)
+        )
+
+    @cached_property
+    def shell(self) -> VnflcmShell:
+        """Persistent shell session in VNFLCM service pod"""
+        return VnflcmShell(
+            k8s_client=self.k8s_client,
+            kubeconfig_path=self.config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH),
+        )
 
     @cached_property
     def vnf_package(self) -> VmvnfmArtefactModel:
@@ -128,6 +146,7 @@ class VmvnfmApp(EvnfmApp):
         """
         logger.info(f"Adding {service.name.upper()} service with the registration file")
         output_cmd = self.cli.add_service(service.name, config_path)
+        self.service_tables.invalidate(service.name)
         assert service.add_success_text in output_cmd, log_exception(
             f"{service.name.upper()} addition failed"
         )
@@ -152,10 +171,23 @@ class VmvnfmApp(EvnfmApp):
         Returns:
             cmd output
         """
+        return self.get_service_table(service).raw
+
+    def get_service_table(
+        self, service: str | VmvnfmServiceModel, refresh: bool = False
+    ) -> VnflcmTable:
+        """
+        Returns parsed table with registered services list, cached until services of this type are changed
+        Args:
+            service: the service to be checked
+            refresh: if True services list is re-requested from VNFLCM
+        Returns:
+            VnflcmTable instance
+        """
         if isinstance(service, VmvnfmServiceModel):
             service = service.name
         logger.info(f"Searching for the {service}")
-        return self.cli.list_services(service_name=service)
+        return self.service_tables.get(service, refresh=refresh)
 
     def get_vnf_id(self, vapp_name: str) -> str:
         """
@@ -167,14 +199,14 @@ class VmvnfmApp(EvnfmApp):
         Raises:
             AssetNotFoundException if no VNF found
         """
-        vnf_list = self.get_service_list(VmvnfmServiceNames.VNF)
-        regex = r"\s{1,}\d{1,}\s{1,}\|\s(?P<vnf_id>.{36}).*" + vapp_name
-        try:
-            return re.search(regex, vnf_list).groupdict()["vnf_id"]
-        except AttributeError:
-            raise AssetNotFoundException(
-                log_exception("No VNF IDs found on the VM VNFM VNFLCM pod")
-            ) from None
+        # VNFs are changed by LCM operations, not by VNFLCM CLI, so list is always re-requested
+        vnf_table = self.get_service_table(VmvnfmServiceNames.VNF, refresh=True)
+        for row in vnf_table.find_rows(vapp_name):
+            if vnf_id := get_uuid_cell(row):
+                return vnf_id
+        raise AssetNotFoundException(
+            log_exception("No VNF IDs found on the VM VNFM VNFLCM pod")
+        )
 
     def get_vim_service_by_name(self, service_instance_name):
         """
@@ -239,7 +271,8 @@ class VmvnfmApp(EvnfmApp):
             AssertionError: when service deleting failed
         """
         logger.info(f"Deleting {service.name} service")
-        output_cmd = self.cli.execute_vnflcm_cli_command(cmd)
+        output_cmd = self.shell.execute(cmd, check=False).output
+        self.service_tables.invalidate(service.name)
         assert service.delete_success_text in output_cmd, log_exception(
             f"{service.name.upper()} service delete failed"
         )
@@ -255,6 +288,7 @@ class VmvnfmApp(EvnfmApp):
         """
         logger.info(f"Deleting {service.name} service")
         self.cli.execute_vnflcm_interactive_cli_command(cmd=cmd, intended_answer="1")
+        self.service_tables.invalidate(service.name)
 
     def delete_service_config(self, file_path):
         """
@@ -307,7 +341,7 @@ class VmvnfmApp(EvnfmApp):
                     base_url, service=service
                 )
             assert not self.service_exists(
-                service, self.cli.list_services(service.name)
+                service, self.get_service_list(service)
             ), log_exception(f"{service.name.upper()} service delete failed")
         else:
             logger.info(
@@ -328,17 +362,17 @@ class VmvnfmApp(EvnfmApp):
         logger.info(
             f"Searching for the {service.name} with the given parameter: {param}"
         )
-        output_cmd = self.cli.list_services(service_name=service.name)
-        no_alternative = service.alternative_not_found_text in output_cmd
+        services_table = self.get_service_table(service)
+        no_alternative = service.alternative_not_found_text in services_table
         assert (
-            service.not_found_text in output_cmd
+            service.not_found_text in services_table
             or no_alternative
-            or output_cmd.count("baseUrl") > 0
+            or "baseUrl" in services_table
         ), log_exception(
             f"{service.name} list output is invalid, "
             "check the 'eric-vnflcm-service-0' POD health!"
         )
-        return output_cmd.count(param)
+        return services_table.count(param)
 
     def cleanup_ecm_services(self, base_url):
         """
@@ -361,6 +395,7 @@ class VmvnfmApp(EvnfmApp):
         self.delete_service_by_name(vim_name, VIM_SERVICE)
         self.delete_service_config(VIM_SERVICE.config_path)
 
+    @timed_step()
     def install_vnf_package(self, package_url, vnfd_id):
         """
         Attempts to install a VNF package into VMVNFM
@@ -373,31 +408,33 @@ class VmvnfmApp(EvnfmApp):
         timebased_id = datetime.now().strftime("%y_%m_%d_%H_%M_%S")
         temp_dir = f"/tmp/{timebased_id}"
 
+        package_dir = f"{VmvnfmPaths.PACKAGES_REPO}{vnfd_id}"
         logger.info(
-            f"Creating temporary dir to store the downloaded package: {temp_dir}"
+            f"Creating temporary dir to store the downloaded package: {temp_dir} "
+            f"and package dir based on the vnfd_id of the package: {package_dir}"
+        )
+        self.shell.execute_batch(
+            [CMD.MK_DIR.format(temp_dir), CMD.MK_DIR.format(package_dir)]
         )
-        cmd = CMD.MK_DIR.format(temp_dir)
-        self.cli.execute_vnflcm_cli_command(cmd)
 
         logger.info("Downloading package from repository...")
         self.cli.download_file_to_pod(package_url, temp_dir)
-        cmd = CMD.FIND_FILE.format(temp_dir)
-        downloaded_package_filepath = self.cli.execute_vnflcm_cli_command(cmd).strip()
+        downloaded_package_filepath = self.shell.execute(
+            CMD.FIND_FILE.format(temp_dir)
+        ).output.strip()
 
-        package_dir = f"{VmvnfmPaths.PACKAGES_REPO}{vnfd_id}"
         logger.info(
-            f"Creating package dir based on the vnfd_id of the package: {package_dir}"
+            f"Unzipping downloaded file into package dir: {package_dir} "
+            f"and deleting downloaded package file: {downloaded_package_filepath}"
+        )
+        self.shell.execute_batch(
+            [
+                CMD.UNZIP_TO_DIR.format(downloaded_package_filepath, package_dir),
+                CMD.RM_R.format(downloaded_package_filepath),
+            ]
         )
-        cmd = CMD.MK_DIR.format(package_dir)
-        self.cli.execute_vnflcm_cli_command(cmd)
-
-        logger.info(f"Unzipping downloaded file into package dir: {package_dir}")
-        cmd = CMD.UNZIP_TO_DIR.format(downloaded_package_filepath, package_dir)
-        self.cli.execute_vnflcm_cli_command(cmd)
-
-        logger.info(f"Deleting downloaded package file: {downloaded_package_filepath}")
-        self.cli.remove_file_from_pod(downloaded_package_filepath)
 
+    @timed_step()
     def uninstall_vnf_package(self, vnfd_id):
         """
         Attempts to delete a VNF package from VMVNFM
@@ -409,8 +446,7 @@ class VmvnfmApp(EvnfmApp):
         logger.info(
             f"Recursively deleting the content of the package dir: {package_dir}"
         )
-        cmd = CMD.RM_R.format(package_dir)
-        self.cli.execute_vnflcm_cli_command(cmd)
+        self.shell.execute(CMD.RM_R.format(package_dir))
 
     def delete_registered_ecm_services_by_url(self, base_url):
         """
@@ -466,8 +502,9 @@ class VmvnfmApp(EvnfmApp):
         env_files_path = VmvnfmPaths.ENVIRONMENT_FILES.format(descriptor_id=vnfd_id)
 
         logger.info("Get Environment File name")
-        cmd = CMD.LS.format(env_files_path)
-        env_file_name = self.cli.execute_vnflcm_cli_command(cmd).strip()
+        env_file_name = self.shell.execute(
+            CMD.LS.format(env_files_path), check=False
+        ).output.strip()
 
         if not env_file_name:
             raise AssetNotFoundException("Environment File is not found")
@@ -519,6 +556,7 @@ class VmvnfmApp(EvnfmApp):
 
         return init_scale_level
 
+    @timed_step()
     def make_and_verify_scale_operation(
         self, instance_id: str, scale_operation: Operations, aspect_id: str
     ) -> None:
@@ -539,6 +577,7 @@ class VmvnfmApp(EvnfmApp):
             start_scale_status=init_scale_level,
         )
 
+    @timed_step()
     def make_and_verify_heal_operation(self, vnf_id: str) -> None:
         """
         Performs VNF heal operation and verifies its result
@@ -552,6 +591,7 @@ class VmvnfmApp(EvnfmApp):
 
         self.verify_heal_operation()
 
+    @timed_step()
     def create_vnf_instance_identifier(
         self,
         descriptor_id: str,
@@ -598,6 +638,7 @@ class VmvnfmApp(EvnfmApp):
             **kwargs
         )
 
+    @timed_step()
     def instantiate_vnf(
         self,
         vnf_id: str,
@@ -658,6 +699,7 @@ class VmvnfmApp(EvnfmApp):
         self.is_package_instantiated(vnf_id, check_response=False)
         return vnf_id
 
+    @timed_step()
     def terminate_instance(
         self, instance_id: str, remove_package_id: bool = True
     ) -> None:
@@ -0,0 +1,218 @@
+"""Module with VnflcmShell class: persistent shell session in VNFLCM service pod"""
+import re
+from copy import copy
+from dataclasses import dataclass
+from threading import RLock
+from time import monotonic
+from uuid import uuid4
+
+from core_libs.eo.ccd.k8s_api_client import K8sApiClient
+from core_libs.eo.ccd.k8s_data.pods import VNFLCM_SERVICE
+from kubernetes.client import CoreV1Api
+from kubernetes.stream import stream
+from kubernetes.stream.ws_client import WSClient
+
+from libs.common.custom_exceptions import VnflcmShellError
+from libs.common.k8s_client_registry import K8S_CLIENTS
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+SHELL_CMD = ["/bin/bash"]
+DEFAULT_CMD_TIMEOUT = 5 * 60
+READ_INTERVAL = 1
+
+
+@dataclass
+class ShellResult:
+    """Result of command executed in VNFLCM shell"""
+
+    cmd: str
+    output: str
+    exit_code: int
+    stderr: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True if command finished with zero exit code"""
+        return self.exit_code == 0
+
+
+class VnflcmShell:
+    """
+    Persistent interactive shell session in VNFLCM service pod.
+    All commands are multiplexed over one exec websocket: every command is followed by
+    unique sentinel line with command exit code in stdout and the same sentinel in stderr,
+    which delimit command output in both streams, so stderr never mixes with stdout.
+    Session is re-opened automatically if it is closed, e.g. after pod restart.
+    """
+
+    def __init__(
+        self,
+        k8s_client: K8sApiClient,
+        kubeconfig_path: str,
+        container: str | None = None,
+    ):
+        self.k8s_client = k8s_client
+        self._kubeconfig_path = kubeconfig_path
+        self._container = container
+        self._ws: WSClient | None = None
+        self._pod_name: str | None = None
+        self._lock = RLock()
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    def __enter__(self) -> "VnflcmShell":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """True if shell session is opened"""
+        return self._ws is not None and self._ws.is_open()
+
+    def open(self) -> None:
+        """Open shell session in VNFLCM service pod"""
+        with self._lock:
+            if self.is_open:
+                return
+            self._pod_name = self.k8s_client.get_pod_full_name(VNFLCM_SERVICE)
+            self._logger.info(f"Opening persistent shell session in {self._pod_name}")
+            # stream() replaces request method of the ApiClient while connecting,
+            # so it gets a copy to keep the shared cluster ApiClient untouched
+            core_v1_api = CoreV1Api(
+                api_client=copy(K8S_CLIENTS.get_api_client(self._kubeconfig_path))
+            )
+            kwargs = {"container": self._container} if self._container else {}
+            self._ws = stream(
+                core_v1_api.connect_get_namespaced_pod_exec,
+                self._pod_name,
+                self.k8s_client.namespace,
+                command=SHELL_CMD,
+                stdin=True,
+                stdout=True,
+                stderr=True,
+                tty=False,
+                _preload_content=False,
+                **kwargs,
+            )
+
+    def close(self) -> None:
+        """Close shell session"""
+        with self._lock:
+            if self._ws is not None:
+                self._logger.info(f"Closing shell session in {self._pod_name}")
+                if self._ws.is_open():
+                    self._ws.write_stdin("exit\n")
+                self._ws.close()
+                self._ws = None
+
+    def execute(
+        self, cmd: str, timeout: int = DEFAULT_CMD_TIMEOUT, check: bool = True
+    ) -> ShellResult:
+        """Execute command in shell session
+        Args:
+            cmd: shell command
+            timeout: time to wait for command to finish
+            check: if True raise an exception when command exits with non-zero code
+        Raises:
+            VnflcmShellError: when command fails and check=True or shell session is broken
+        Returns:
+            ShellResult instance
+        """
+        return self.execute_batch([cmd], timeout=timeout, check=check)[0]
+
+    def execute_batch(
+        self, cmds: list[str], timeout: int = DEFAULT_CMD_TIMEOUT, check: bool = True
+    ) -> list[ShellResult]:
+        """Execute list of commands in one round trip, commands are sent to the shell at once
+        Note: all commands are executed even if some of them fail, commands must not read stdin
+        Args:
+            cmds: shell commands
+            timeout: time to wait for all commands to finish
+            check: if True raise an exception when any command exits with non-zero code
+        Raises:
+            VnflcmShellError: when any command fails and check=True or shell session is broken
+        Returns:
+            list of ShellResult instances in order of provided commands
+        """
+        sentinels = [f"__VNFLCM_SHELL_END_{uuid4().hex}__" for _ in cmds]
+        script = "".join(
+            f"{cmd}\nprintf '\\n%s %s\\n' '{sentinel}' \"$?\"\n"
+            f"printf '\\n%s 0\\n' '{sentinel}' >&2\n"
+            for cmd, sentinel in zip(cmds, sentinels)
+        )
+        with self._lock:
+            self.open()
+            for cmd in cmds:
+                self._logger.debug(f"[{self._pod_name}] $ {cmd}")
+            self._ws.write_stdin(script)
+            stdout, stderr = self._read_until(sentinels[-1], timeout=timeout)
+
+        results = []
+        for cmd, sentinel in zip(cmds, sentinels):
+            output, exit_code, stdout = self._split_by_sentinel(stdout, sentinel)
+            errors, _, stderr = self._split_by_sentinel(stderr, sentinel)
+            result = ShellResult(
+                cmd=cmd, output=output, exit_code=exit_code, stderr=errors
+            )
+            self._logger.debug(
+                f"[{self._pod_name}] exit code {exit_code}: {output}"
+                + (f"\nSTDERR: {errors}" if errors else "")
+            )
+            if check and not result.ok:
+                raise VnflcmShellError(
+                    f"Command {cmd!r} failed with exit code {exit_code}: {output}"
+                    f"\nSTDERR: {errors}"
+                )
+            results.append(result)
+        return results
+
+    def _read_until(self, sentinel: str, timeout: int) -> tuple[str, str]:
+        """Read shell stdout and stderr until sentinel line appears in both streams
+        Args:
+            sentinel: sentinel to wait for
+            timeout: time to wait for sentinel
+        Raises:
+            VnflcmShellError: when session closed or sentinel not received within timeout
+        Returns:
+            all stdout and stderr read from shell including sentinel lines
+        """
+        pattern = re.compile(rf"\n{sentinel} \d+\n")
+        deadline = monotonic() + timeout
+        buffer = ""
+        errors = ""
+        while not (pattern.search(buffer) and pattern.search(errors)):
+            if not self._ws.is_open():
+                self._ws = None
+                raise VnflcmShellError(
+                    f"Shell session in {self._pod_name} was closed unexpectedly, output: {buffer}"
+                )
+            if monotonic() > deadline:
+                # output of timed out command can't be separated from next commands
+                self.close()
+                raise VnflcmShellError(
+                    f"Command output was not received within {timeout} seconds, output: {buffer}"
+                )
+            self._ws.update(timeout=READ_INTERVAL)
+            if self._ws.peek_stdout():
+                buffer += self._ws.read_stdout()
+            if self._ws.peek_stderr():
+                errors += self._ws.read_stderr()
+        return buffer, errors
+
+    @staticmethod
+    def _split_by_sentinel(buffer: str, sentinel: str) -> tuple[str, int, str]:
+        """Split shell output by command sentinel
+        Args:
+            buffer: shell output
+            sentinel: command sentinel
+        Returns:
+            command output, command exit code and the rest of the shell output
+        """
+        match = re.search(rf"\n{sentinel} (?P<exit_code>\d+)\n", buffer)
+        return (
+            buffer[: match.start()].strip("\n"),
+            int(match.group("exit_code")),
+            buffer[match.end() :],
+        )
@@ -0,0 +1,120 @@
+"""Module with parser and cache for VNFLCM CLI list tables"""
+import re
+from dataclasses import dataclass, field
+from threading import RLock
+from typing import Callable
+
+from libs.utils.logging.logger import logger
+
+UUID_PATTERN = re.compile(
+    r"^[\da-f]{8}-[\da-f]{4}-[\da-f]{4}-[\da-f]{4}-[\da-f]{12}$", re.IGNORECASE
+)
+TABLE_SEPARATOR_PATTERN = re.compile(r"^[\s+\-=|]*$")
+
+
+@dataclass
+class VnflcmTable:
+    """Parsed output of 'vnflcm <service> list' command"""
+
+    raw: str
+    header: list[str] = field(default_factory=list)
+    rows: list[dict[str, str]] = field(default_factory=list)
+
+    def find_rows(self, value: str) -> list[dict[str, str]]:
+        """Find rows that contain provided value in any cell
+        Args:
+            value: value to search for
+        Returns:
+            list of found rows
+        """
+        return [row for row in self.rows if any(value in cell for cell in row.values())]
+
+    def count(self, value: str) -> int:
+        """Count rows that contain provided value, falls back to raw output when table has no rows
+        Args:
+            value: value to search for
+        Returns:
+            number of rows (occurrences in raw output for non-table output)
+        """
+        if self.rows:
+            return len(self.find_rows(value))
+        return self.raw.count(value)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self.raw
+
+
+def parse_vnflcm_table(output: str) -> VnflcmTable:
+    """Parse VNFLCM CLI ASCII table into row records.
+    Lines with '|' delimiters are treated as table lines: the first one that has no number
+    in its first cell is a header, all following ones are rows. Border lines are skipped.
+    Args:
+        output: VNFLCM CLI command output
+    Returns:
+        VnflcmTable instance
+    """
+    table = VnflcmTable(raw=output)
+    for line in output.splitlines():
+        if "|" not in line or TABLE_SEPARATOR_PATTERN.match(line):
+            continue
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if not table.header and not cells[0].isdigit():
+            table.header = cells
+            continue
+        header = table.header or [str(index) for index in range(len(cells))]
+        table.rows.append(dict(zip(header, cells)))
+    return table
+
+
+def get_uuid_cell(row: dict[str, str]) -> str | None:
+    """Get first cell of the row which value is UUID
+    Args:
+        row: table row
+    Returns:
+        UUID value if found else None
+    """
+    return next((cell for cell in row.values() if UUID_PATTERN.match(cell)), None)
+
+
+class VnflcmTablesCache:
+    """
+    Cache of parsed VNFLCM list tables per service type.
+    Table of service type must be invalidated after any add/delete command for this service type.
+    """
+
+    def __init__(self, list_services: Callable[[str], str]):
+        """
+        Args:
+            list_services: callable that returns 'vnflcm <service> list' output by service name
+        """
+        self._list_services = list_services
+        self._lock = RLock()
+        self._tables: dict[str, VnflcmTable] = {}
+
+    def get(self, service_name: str, refresh: bool = False) -> VnflcmTable:
+        """Get parsed list table of service type, run list command only if table is not cached
+        Args:
+            service_name: VNFLCM service type name
+            refresh: if True table is re-requested, e.g. when it could be changed not by CLI commands
+        Returns:
+            VnflcmTable instance
+        """
+        with self._lock:
+            if refresh or service_name not in self._tables:
+                self._tables[service_name] = parse_vnflcm_table(
+                    self._list_services(service_name)
+                )
+            else:
+                logger.debug(f"Using cached {service_name} services list")
+            return self._tables[service_name]
+
+    def invalidate(self, service_name: str | None = None) -> None:
+        """Drop cached table of service type
+        Args:
+            service_name: VNFLCM service type name, all tables are dropped if not provided
+        """
+        with self._lock:
+            if service_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(service_name, None)
@@ -9,6 +9,7 @@ from core_libs.common.misc_utils import wait_for
 from core_libs.eo.vmvnfm.vmvnfm_test_data import VmVnfmTestData
 
 from apps.vmvnfm.data.services import WORKFLOW_SERVICE
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
 from libs.utils.logging.logger import logger, log_exception
 
 
@@ -131,11 +132,13 @@ class WorkflowService:
         if apply_wait:
             logger.debug("Applying wait to verify WF installation")
             # this wait is implemented to monitoring EO-177618, may need to be changed/removed after issue analysis
-            wait_for(
-                lambda: "no descriptor details present in db" not in exec_cmd().lower(),
-                timeout=3 * 60,
-                raise_exc=False,
-            )
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                wait_for(
+                    lambda: "no descriptor details present in db"
+                    not in exec_cmd().lower(),
+                    timeout=3 * 60,
+                    raise_exc=False,
+                )
             return bool(output_cmd.count(workflow_name))
         return bool(exec_cmd().count(workflow_name))
 
@@ -0,0 +1,388 @@
+"""Module with ApiCallStats class that counts calls to K8s, SSH and REST APIs and limits their rate"""
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Iterator
+from urllib.parse import urlsplit
+
+import requests
+
+from libs.common.constants import STRUCTURED_LOGGER_NAME
+from libs.common.rate_limiter import RateLimiter
+from libs.utils.logging.json_formatter import log_fields
+
+ID_SEGMENT_PATTERN = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|sha256:\w+)$")
+structured_logger = logging.getLogger(STRUCTURED_LOGGER_NAME)
+
+
+class ApiClients:
+    """Names of counted API clients, used as keys of QPS budgets"""
+
+    K8S = "k8s"
+    SSH = "ssh"
+    EO_NODE = "eo_node"
+    REGISTRY = "registry"
+    EVNFM = "evnfm"
+
+
+@dataclass
+class ApiCallSummary:
+    """Aggregated calls to one endpoint of the client with one verb"""
+
+    count: int = 0
+    errors: int = 0
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    latency: float = 0
+    max_latency: float = 0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average call latency in seconds"""
+        return self.latency / self.count if self.count else 0
+
+    def add(self, call: "ApiCall") -> None:
+        """Add call to the summary
+        Args:
+            call: finished call
+        """
+        self.count += 1
+        self.errors += call.failed
+        self.sent_bytes += call.sent_bytes
+        self.received_bytes += call.received_bytes
+        self.latency += call.latency
+        self.max_latency = max(self.max_latency, call.latency)
+
+
+@dataclass
+class ApiCall:
+    """Single call, bytes and result fields are filled by the caller when they are known"""
+
+    client: str
+    verb: str
+    endpoint: str
+    target: str
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    latency: float = 0
+    failed: bool = False
+    host: str | None = None
+    site: str | None = None
+    pod: str | None = None
+    exit_code: int | None = None
+    http_status: int | None = None
+    key: tuple = field(init=False)
+
+    def __post_init__(self):
+        self.key = self.client, self.verb, self.endpoint
+
+
+_current_call: ContextVar[ApiCall | None] = ContextVar("api_call", default=None)
+
+
+class ApiCallStats:
+    """
+    Counts calls, transferred bytes and latency per client, verb and endpoint for the current test
+    and the whole session. Calls of every client are spaced out by RateLimiter with the client QPS
+    budget, so heavy polling (health checks, wait loops, probers) can not overload API servers.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._limiters: dict[str, RateLimiter] = {}
+        self.test_summary: dict[tuple, ApiCallSummary] = {}
+        self.session_summary: dict[tuple, ApiCallSummary] = {}
+
+    def set_budgets(self, budgets: dict[str, float]) -> None:
+        """Set max number of calls per second per client, clients without budget are not limited
+        Args:
+            budgets: QPS budget by ApiClients value
+        """
+        with self._lock:
+            self._limiters = {
+                client: RateLimiter(rate) for client, rate in budgets.items()
+            }
+
+    def start_test(self) -> None:
+        """Start counting calls of a new test"""
+        with self._lock:
+            self.test_summary = {}
+
+    def finish_test(self) -> dict[tuple, ApiCallSummary]:
+        """Finish counting calls of the current test
+        Returns:
+            calls summary by (client, verb, endpoint)
+        """
+        with self._lock:
+            summary, self.test_summary = self.test_summary, {}
+        return summary
+
+    @contextmanager
+    def track(
+        self, client: str, verb: str, endpoint: str, sent_bytes: int = 0
+    ) -> Iterator[ApiCall]:
+        """Context manager that waits for the client QPS budget and counts the call made in the block
+        Args:
+            client: ApiClients value
+            verb: HTTP method, SSH operation etc.
+            endpoint: URL, K8s resource path or command, IDs are replaced with placeholder
+            sent_bytes: size of the request
+        Yields:
+            call to fill received bytes of
+        """
+        limiter = self._limiters.get(client)
+        if limiter:
+            limiter.acquire()
+        with self._count(client, verb, endpoint, sent_bytes) as call:
+            yield call
+
+    @asynccontextmanager
+    async def track_async(
+        self, client: str, verb: str, endpoint: str, sent_bytes: int = 0
+    ) -> AsyncIterator[ApiCall]:
+        """Async context manager that awaits the client QPS budget without blocking the event loop
+        and counts the call made in the block
+        Args:
+            client: ApiClients value
+            verb: HTTP method, SSH operation etc.
+            endpoint: URL, K8s resource path or command, IDs are replaced with placeholder
+            sent_bytes: size of the request
+        Yields:
+            call to fill received bytes of
+        """
+        limiter = self._limiters.get(client)
+        if limiter:
+            await limiter.acquire_async()
+        with self._count(client, verb, endpoint, sent_bytes) as call:
+            yield call
+
+    @contextmanager
+    def _count(
+        self, client: str, verb: str, endpoint: str, sent_bytes: int
+    ) -> Iterator[ApiCall]:
+        """Context manager that counts the call made in the block
+        Args:
+            client: ApiClients value
+            verb: HTTP method, SSH operation etc.
+            endpoint: URL, K8s resource path or command
+            sent_bytes: size of the request
+        Yields:
+            call to fill received bytes of
+        """
+        call = ApiCall(
+            client=client,
+            verb=verb,
+            endpoint=normalize_endpoint(endpoint),
+            target=endpoint,
+            sent_bytes=sent_bytes,
+        )
+        token = _current_call.set(call)
+        started = monotonic()
+        try:
+            yield call
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            call.latency = monotonic() - started
+            _current_call.reset(token)
+            with self._lock:
+                for summary in self.test_summary, self.session_summary:
+                    summary.setdefault(call.key, ApiCallSummary()).add(call)
+            if structured_logger.handlers:
+                log_call(call)
+
+    @staticmethod
+    def set_http_status(status: int) -> None:
+        """Set HTTP status of the call tracked in the current context, e.g. from transport layer
+        Args:
+            status: response status code
+        """
+        call = _current_call.get()
+        if call is not None:
+            call.http_status = status
+
+    @staticmethod
+    def set_host(host: str) -> None:
+        """Set host of the call tracked in the current context, e.g. when command is run via jump host
+        Args:
+            host: remote host name
+        """
+        call = _current_call.get()
+        if call is not None:
+            call.host = host
+
+    @staticmethod
+    def set_exit_code(exit_code: int) -> None:
+        """Set exit code of the command tracked in the current context, if it is not returned
+        Args:
+            exit_code: command exit code
+        """
+        call = _current_call.get()
+        if call is not None:
+            call.exit_code = exit_code
+
+    @staticmethod
+    def add_bytes(sent: int = 0, received: int = 0) -> None:
+        """Add transferred bytes to the call tracked in the current context, e.g. from transport layer
+        Args:
+            sent: request size
+            received: response size
+        """
+        call = _current_call.get()
+        if call is not None:
+            call.sent_bytes += sent
+            call.received_bytes += received
+
+
+API_CALLS = ApiCallStats()
+
+
+def log_call(call: ApiCall) -> None:
+    """Write the finished call with its typed fields to the structured log
+    Args:
+        call: finished call
+    """
+    structured_logger.info(
+        f"{call.client} {call.verb} {call.target}",
+        extra=log_fields(
+            client=call.client,
+            method=call.verb,
+            endpoint=call.endpoint,
+            command=call.target if call.verb == "exec" else None,
+            site=call.site,
+            host=call.host,
+            pod=call.pod,
+            duration=round(call.latency, 3),
+            exit_code=call.exit_code,
+            http_status=call.http_status,
+            failed=call.failed,
+            sent_bytes=call.sent_bytes,
+            received_bytes=call.received_bytes,
+        ),
+    )
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Drop host and query of URL and replace IDs in its path, so calls are grouped by endpoint
+    Args:
+        endpoint: URL, path or command
+    Returns:
+        endpoint without IDs
+    """
+    if "/" not in endpoint or " " in endpoint:
+        return endpoint
+    path = urlsplit(endpoint).path
+    return "/".join(
+        "{id}" if ID_SEGMENT_PATTERN.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def get_command_endpoint(cmd: str | list) -> str:
+    """Get endpoint of shell command: the program and its subcommand, e.g. 'kubectl get'
+    Args:
+        cmd: command
+    Returns:
+        command endpoint
+    """
+    tokens = [str(token) for token in cmd] if isinstance(cmd, list) else cmd.split()
+    return " ".join(token for token in tokens[:2] if not token.startswith("-"))
+
+
+def get_output_size(output: Any) -> int:
+    """Get size of command output
+    Args:
+        output: output string or result with stdout and stderr
+    Returns:
+        number of characters
+    """
+    if isinstance(output, str):
+        return len(output)
+    return sum(
+        len(getattr(output, stream, None) or "") for stream in ("stdout", "stderr")
+    )
+
+
+def tracked_command(
+    client: str, host_attr: str = "hostname", site_attr: str = "site"
+) -> Callable:
+    """Decorator of methods that run command on remote host, command is the first method argument,
+    coroutine functions are supported
+    Args:
+        client: ApiClients value
+        host_attr: attribute of the instance with the remote host name
+        site_attr: attribute of the instance with the site name
+    Returns:
+        decorator
+    """
+
+    def describe_call(call: ApiCall, instance, cmd: str | list) -> None:
+        call.target = " ".join(map(str, cmd)) if isinstance(cmd, list) else cmd
+        call.host = getattr(instance, host_attr, None)
+        call.site = getattr(instance, site_attr, None)
+
+    def set_output(call: ApiCall, output) -> None:
+        call.exit_code = getattr(output, "exit_code", call.exit_code)
+        call.received_bytes = get_output_size(output)
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, cmd, *args, **kwargs):
+                async with API_CALLS.track_async(
+                    client, "exec", get_command_endpoint(cmd), len(str(cmd))
+                ) as call:
+                    describe_call(call, self, cmd)
+                    output = await func(self, cmd, *args, **kwargs)
+                    set_output(call, output)
+                    return output
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, cmd, *args, **kwargs):
+            with API_CALLS.track(
+                client, "exec", get_command_endpoint(cmd), len(str(cmd))
+            ) as call:
+                describe_call(call, self, cmd)
+                output = func(self, cmd, *args, **kwargs)
+                set_output(call, output)
+                return output
+
+        return wrapper
+
+    return decorator
+
+
+def count_session_requests(session: requests.Session, client: str) -> None:
+    """Wrap send method of HTTP adapters mounted to the session to count requests and limit their rate
+    Args:
+        session: requests session
+        client: ApiClients value
+    """
+    for adapter in session.adapters.values():
+        if getattr(adapter, "counted_client", None):
+            continue
+        send = adapter.send
+
+        def counted_send(request, *args, _send=send, **kwargs):
+            body = request.body or b""
+            with API_CALLS.track(
+                client, request.method, request.url, len(body)
+            ) as call:
+                response = _send(request, *args, **kwargs)
+                call.received_bytes = int(response.headers.get("Content-Length", 0))
+                call.http_status = response.status_code
+                call.failed = not response.ok
+                return response
+
+        adapter.send = counted_send
+        adapter.counted_client = client
@@ -0,0 +1,366 @@
+"""Module with persistent content-addressed cache of downloaded artefacts (CSARs, RPMs, configs),
+secrets such as private keys must not be fetched through it"""
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from http import HTTPStatus
+from pathlib import Path
+from threading import Event, Lock
+from time import time
+from typing import Iterable, Iterator
+from urllib.parse import urlparse
+from uuid import uuid4
+
+import requests
+from core_libs.common.file_utils import FileUtils
+
+from libs.common.constants import UTF_8
+from libs.common.env_variables import ENV_VARS
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+DOWNLOAD_TIMEOUT = 60
+PREFETCH_WORKERS = 4
+LINK_ATTEMPTS = 2
+GB = 1024**3
+
+
+class CacheEntryFields:
+    """Fields of artefact cache index entry"""
+
+    SHA256 = "sha256"
+    SIZE = "size"
+    ETAG = "etag"
+    LAST_MODIFIED = "last_modified"
+    LAST_USED = "last_used"
+
+
+class ArtefactCache:
+    """
+    Persistent cache of remote artefacts shared by all test sessions on the runner.
+    Artefact content is stored once by its SHA-256 in objects/ directory, index.json maps URL
+    to content hash and ETag / Last-Modified validators, so cached artefact is revalidated with
+    conditional request instead of being downloaded again. All files are written to temporary
+    file first and moved in place atomically. Index and every URL are guarded by file locks,
+    so concurrent sessions download the same URL only once. Least recently used objects are
+    evicted when cache exceeds max size. Artefacts can be prefetched in background threads,
+    then getting of prefetched URL waits for its download instead of starting a new one.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_size: int):
+        """
+        Args:
+            cache_dir: cache directory
+            max_size: max cache size in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self._objects_dir = self.cache_dir / "objects"
+        self._locks_dir = self.cache_dir / "locks"
+        self._tmp_dir = self.cache_dir / "tmp"
+        self._index_path = self.cache_dir / "index.json"
+        self._prefetched: dict[str, Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._prefetch_lock = Lock()
+        self._stop_prefetch = Event()
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    def fetch(self, url: str, destination_dir: str | Path) -> Path:
+        """Get artefact by URL through cache and copy it to destination directory,
+        local paths and non-HTTP URLs are passed to FileUtils.check_path_for_url
+        Args:
+            url: artefact URL
+            destination_dir: directory to copy artefact to
+        Returns:
+            path of artefact copy in destination directory
+        """
+        if urlparse(url).scheme not in ("http", "https"):
+            return FileUtils.check_path_for_url(url, destination_dir, path_like=True)
+        destination = Path(destination_dir) / Path(urlparse(url).path).name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # copy, not link: callers may rewrite or delete the file
+        tmp_destination = destination.with_name(f".{destination.name}.{uuid4().hex}")
+        try:
+            shutil.copyfile(self.get(url), tmp_destination)
+        except (requests.RequestException, OSError) as err:
+            tmp_destination.unlink(missing_ok=True)
+            self._logger.warning(f"Artefact cache is bypassed for {url}: {err}")
+            return FileUtils.check_path_for_url(url, destination_dir, path_like=True)
+        os.replace(tmp_destination, destination)
+        return destination
+
+    @contextmanager
+    def read_only(self, url: str, destination_dir: str | Path) -> Iterator[Path]:
+        """Get path of artefact without copying its content while the context is active.
+        For HTTP URLs cached content is hard linked to a hidden file in destination directory,
+        so eviction of the object by another session doesn't remove the file being used,
+        the link is removed on exit. Returned file must not be modified or deleted by the caller
+        Args:
+            url: artefact URL
+            destination_dir: directory to link or download artefact to
+        Yields:
+            path of artefact
+        """
+        if urlparse(url).scheme in ("http", "https"):
+            try:
+                path = self._link(url, destination_dir)
+            except (requests.RequestException, OSError) as err:
+                self._logger.warning(f"Artefact cache is bypassed for {url}: {err}")
+            else:
+                try:
+                    yield path
+                finally:
+                    path.unlink(missing_ok=True)
+                return
+        yield FileUtils.check_path_for_url(url, destination_dir, path_like=True)
+
+    def _link(self, url: str, destination_dir: str | Path) -> Path:
+        """Hard link cached content of the artefact to a hidden file in destination directory,
+        content is copied if it can't be linked, e.g. directory is on another file system
+        Args:
+            url: artefact URL
+            destination_dir: directory to link artefact to
+        Raises:
+            FileNotFoundError: when cached content is evicted by other sessions before it is linked
+        Returns:
+            path of the link
+        """
+        destination = Path(destination_dir) / (
+            f".{Path(urlparse(url).path).name}.{uuid4().hex}"
+        )
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(LINK_ATTEMPTS):
+            path = self.get(url)
+            # objects are evicted under the index lock, so the object can't disappear meanwhile
+            with self._file_lock(self._index_path.with_suffix(".lock")):
+                if not path.exists():
+                    continue
+                try:
+                    os.link(path, destination)
+                    return destination
+                except OSError:
+                    # opened file stays readable even if the object is evicted later
+                    source = open(path, "rb")  # pylint: disable=consider-using-with
+            with source, open(destination, "wb") as destination_file:
+                shutil.copyfileobj(source, destination_file, DOWNLOAD_CHUNK_SIZE)
+            return destination
+        raise FileNotFoundError(f"Cached content of {url} is evicted by other sessions")
+
+    def prefetch(self, urls: Iterable[str]) -> dict[str, Future]:
+        """Start download of artefacts to cache in background threads, non-HTTP URLs are skipped
+        Args:
+            urls: artefact URLs
+        Returns:
+            futures of cached content paths by URL of all prefetched artefacts
+        """
+        with self._prefetch_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=PREFETCH_WORKERS,
+                    thread_name_prefix="ARTEFACT_PREFETCH",
+                )
+            for url in urls:
+                if (
+                    urlparse(url).scheme in ("http", "https")
+                    and url not in self._prefetched
+                ):
+                    self._logger.info(f"Prefetching artefact {url}")
+                    self._prefetched[url] = self._executor.submit(
+                        self._get, url, self._stop_prefetch
+                    )
+            return dict(self._prefetched)
+
+    def get_prefetched(self, url: str) -> Future | None:
+        """Get future of prefetched artefact
+        Args:
+            url: artefact URL
+        Returns:
+            future of cached content path or None if artefact is not prefetched
+        """
+        with self._prefetch_lock:
+            return self._prefetched.get(url)
+
+    def cancel_prefetch(self) -> None:
+        """Cancel prefetches that are not started yet, stop running prefetch downloads
+        after their current chunk and forget all prefetched artefacts"""
+        with self._prefetch_lock:
+            self._stop_prefetch.set()
+            self._stop_prefetch = Event()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self._prefetched = {}
+
+    def get(self, url: str) -> Path:
+        """Get path of cached artefact content, download or revalidate it if needed.
+        If the artefact is prefetched, its download is awaited and not repeated
+        Args:
+            url: artefact URL
+        Returns:
+            path of cached content
+        """
+        if future := self.get_prefetched(url):
+            try:
+                path = future.result()
+                if path.exists():
+                    return path
+            except (requests.RequestException, OSError, CancelledError) as err:
+                self._logger.warning(f"Prefetch of {url} failed: {err}")
+        return self._get(url)
+
+    def _get(self, url: str, stop_event: Event | None = None) -> Path:
+        """Download or revalidate artefact and get path of its cached content
+        Args:
+            url: artefact URL
+            stop_event: event that stops the download when it is set
+        Returns:
+            path of cached content
+        """
+        for directory in self._objects_dir, self._locks_dir, self._tmp_dir:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        url_lock = self._locks_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.lock"
+        with self._file_lock(url_lock):
+            entry = self._read_index().get(url)
+            if entry and not self._object_path(entry[CacheEntryFields.SHA256]).exists():
+                entry = None
+            try:
+                entry = self._download(url, entry, stop_event)
+            except requests.RequestException as err:
+                if not entry:
+                    raise
+                self._logger.warning(
+                    f"Revalidation of {url} failed, using cached artefact: {err}"
+                )
+            entry[CacheEntryFields.LAST_USED] = time()
+            with self._file_lock(self._index_path.with_suffix(".lock")):
+                index = self._read_index()
+                index[url] = entry
+                self._evict(index, keep=url)
+                self._write_index(index)
+        return self._object_path(entry[CacheEntryFields.SHA256])
+
+    def _download(
+        self, url: str, entry: dict | None, stop_event: Event | None = None
+    ) -> dict:
+        """Download artefact content, or revalidate cached one with conditional request
+        Args:
+            url: artefact URL
+            entry: cached index entry if exists
+            stop_event: event that stops the download when it is set
+        Raises:
+            CancelledError: when download is stopped by the event
+        Returns:
+            actual index entry
+        """
+        headers = {}
+        if entry and entry.get(CacheEntryFields.ETAG):
+            headers["If-None-Match"] = entry[CacheEntryFields.ETAG]
+        if entry and entry.get(CacheEntryFields.LAST_MODIFIED):
+            headers["If-Modified-Since"] = entry[CacheEntryFields.LAST_MODIFIED]
+
+        with requests.get(
+            url, headers=headers, stream=True, verify=False, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            if entry and response.status_code == HTTPStatus.NOT_MODIFIED:
+                self._logger.info(f"Using cached artefact {url}")
+                return entry
+            response.raise_for_status()
+
+            self._logger.info(f"Downloading artefact {url} to cache")
+            sha256 = hashlib.sha256()
+            tmp_path = self._tmp_dir / uuid4().hex
+            try:
+                with open(tmp_path, "wb") as tmp_file:
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        if stop_event is not None and stop_event.is_set():
+                            raise CancelledError(f"Download of {url} is stopped")
+                        sha256.update(chunk)
+                        tmp_file.write(chunk)
+                object_path = self._object_path(sha256.hexdigest())
+                os.replace(tmp_path, object_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            return {
+                CacheEntryFields.SHA256: sha256.hexdigest(),
+                CacheEntryFields.SIZE: object_path.stat().st_size,
+                CacheEntryFields.ETAG: response.headers.get("ETag"),
+                CacheEntryFields.LAST_MODIFIED: response.headers.get("Last-Modified"),
+            }
+
+    def _evict(self, index: dict, keep: str) -> None:
+        """Remove least recently used entries and their objects until cache fits max size
+        Args:
+            index: cache index, modified in place
+            keep: URL that must not be evicted
+        """
+        objects = {entry[CacheEntryFields.SHA256]: entry for entry in index.values()}
+        total_size = sum(entry[CacheEntryFields.SIZE] for entry in objects.values())
+        for url, entry in sorted(
+            index.items(), key=lambda item: item[1].get(CacheEntryFields.LAST_USED, 0)
+        ):
+            if total_size <= self.max_size:
+                break
+            if url == keep:
+                continue
+            sha256 = entry[CacheEntryFields.SHA256]
+            del index[url]
+            if all(
+                other[CacheEntryFields.SHA256] != sha256 for other in index.values()
+            ):
+                self._logger.info(f"Evicting {url} from artefact cache")
+                self._object_path(sha256).unlink(missing_ok=True)
+                total_size -= entry[CacheEntryFields.SIZE]
+
+    def _object_path(self, sha256: str) -> Path:
+        """Get path of content object by its hash
+        Args:
+            sha256: content hash
+        Returns:
+            object path
+        """
+        return self._objects_dir / sha256
+
+    def _read_index(self) -> dict:
+        """Read cache index
+        Returns:
+            cache index, empty if it doesn't exist or is broken
+        """
+        try:
+            return json.loads(self._index_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        """Write cache index atomically
+        Args:
+            index: cache index
+        """
+        tmp_path = self._tmp_dir / f"index.{uuid4().hex}"
+        tmp_path.write_text(json.dumps(index, indent=2))
+        os.replace(tmp_path, self._index_path)
+
+    @staticmethod
+    @contextmanager
+    def _file_lock(lock_path: Path) -> Iterator[None]:
+        """Exclusive lock shared between processes
+        Args:
+            lock_path: lock file path
+        """
+        with open(lock_path, "a", encoding=UTF_8) as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+ARTEFACT_CACHE = ArtefactCache(
+    cache_dir=ENV_VARS.artefact_cache_dir,
+    max_size=int(ENV_VARS.artefact_cache_max_size_gb * GB),
+)
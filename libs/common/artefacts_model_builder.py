@@ -29,6 +29,23 @@ class ArtefactsBuilder:
         logger.debug(f"Searching artefact by {artefact_id=}")
         return self._build_model_for_artefact_by_id(artefact_id)
 
+    def get_by_app_type(
+        self, app_type: str
+    ) -> list[CvnfmArtifactModel | VmvnfmArtefactModel]:
+        """
+        Get all artefacts of the application type
+
+        Args:
+            app_type: artefact application type, e.g. cvnfm
+        Returns:
+            list of artefact models
+        """
+        return [
+            self._build_model(artefact)
+            for artefact in self._config_artefacts.values()
+            if artefact.get(ArtefactConfigKeys.APPLICATION_TYPE) == app_type
+        ]
+
     def _build_model_for_artefact_by_id(
         self,
         artefact_id: str,
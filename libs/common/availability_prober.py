@@ -0,0 +1,291 @@
+"""Module with AvailabilityProber class that measures client-observed API unavailability"""
+import asyncio
+import json
+from bisect import bisect_left
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from threading import Event
+from time import monotonic
+from typing import AsyncIterator, Callable, Iterator
+
+import requests
+
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.latency_stats import summarize_latencies
+from libs.common.thread_runner import ThreadRunner
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+PROBE_INTERVAL = 0.5
+PROBE_TIMEOUT = 2
+RECOVERY_TIMEOUT = 5 * 60
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def is_http_endpoint_available(url: str, timeout: float = PROBE_TIMEOUT) -> bool:
+    """Check that HTTP endpoint answers without server error, authentication is not required
+    Args:
+        url: endpoint url
+        timeout: request timeout
+    Returns:
+        True if endpoint answered with status code below 500
+    """
+    response = requests.get(url, verify=False, timeout=timeout, allow_redirects=False)
+    return response.status_code < 500
+
+
+@dataclass
+class ProbeEndpoint:
+    """Endpoint to probe, check callable returns True if endpoint is available or raises an exception"""
+
+    name: str
+    check: Callable[[], bool]
+
+
+@dataclass
+class ProbeSample:
+    """Result of one probe"""
+
+    timestamp: float
+    ok: bool
+    latency: float
+    error: str | None = None
+
+
+@dataclass
+class UnavailabilityWindow:
+    """Period of time when endpoint probes were failing, timestamps are relative to probing start"""
+
+    start: float
+    end: float | None = None
+    failed_probes: int = 0
+    errors: set[str] = field(default_factory=set)
+
+    def to_report(self) -> dict:
+        """Window report
+        Returns:
+            window report dictionary
+        """
+        return {
+            "start": round(self.start, 3),
+            "end": round(self.end, 3) if self.end is not None else None,
+            "duration": round(self.end - self.start, 3)
+            if self.end is not None
+            else None,
+            "failed_probes": self.failed_probes,
+            "errors": sorted(self.errors),
+        }
+
+
+def build_availability_report(samples: list[ProbeSample]) -> dict:
+    """Build availability report from samples of one endpoint or request class
+    Args:
+        samples: samples ordered by time
+    Returns:
+        report with unavailability windows, downtime, recovery time and latency
+    """
+    windows: list[UnavailabilityWindow] = []
+    for sample in samples:
+        if not sample.ok:
+            if not windows or windows[-1].end is not None:
+                windows.append(UnavailabilityWindow(start=sample.timestamp))
+            windows[-1].failed_probes += 1
+            windows[-1].errors.add(sample.error or "unavailable")
+        elif windows and windows[-1].end is None:
+            windows[-1].end = sample.timestamp
+
+    latencies = [sample.latency for sample in samples if sample.ok]
+    histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+    for latency in latencies:
+        histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    return {
+        "probes": len(samples),
+        "failed_probes": sum(not sample.ok for sample in samples),
+        "unavailability_windows": [window.to_report() for window in windows],
+        "downtime": round(
+            sum(window.end - window.start for window in windows if window.end), 3
+        ),
+        # time of the first success after the last outage since probing start
+        "recovery_time": round(windows[-1].end, 3)
+        if windows and windows[-1].end is not None
+        else None,
+        "recovered": not windows or windows[-1].end is not None,
+        "latency": summarize_latencies(latencies),
+        "latency_histogram": {
+            f"le_{bucket}": count
+            for bucket, count in zip((*LATENCY_BUCKETS, "inf"), histogram)
+        },
+    }
+
+
+class AvailabilityProber:
+    """
+    Probes lightweight endpoints at sub-second intervals in background asyncio loop, every endpoint
+    has own task, blocking checks are run in threads. Reports unavailability windows, time of the
+    first success after the last outage (recovery time) and latency histogram per endpoint,
+    i.e. downtime observed by API clients during e.g. switchover.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[ProbeEndpoint],
+        interval: float = PROBE_INTERVAL,
+    ):
+        """
+        Args:
+            endpoints: list of ProbeEndpoint instances
+            interval: interval between probes of one endpoint
+        """
+        self.endpoints = endpoints
+        self.interval = interval
+        self.samples: dict[str, list[ProbeSample]] = {
+            endpoint.name: [] for endpoint in endpoints
+        }
+        self.report: dict | None = None
+        self._started: float | None = None
+        self._started_at: datetime | None = None
+        self._stop_event = Event()
+        self._thread: ThreadRunner | None = None
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    @contextmanager
+    def probing(self) -> Iterator["AvailabilityProber"]:
+        """Context manager that probes endpoints in background thread while the block is running"""
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @asynccontextmanager
+    async def probing_async(self) -> AsyncIterator["AvailabilityProber"]:
+        """Async context manager that probes endpoints in the running event loop while the block is running"""
+        self._reset()
+        task = asyncio.create_task(self.run(), name="availability_prober")
+        try:
+            yield self
+        finally:
+            await asyncio.to_thread(self._wait_for_recovery)
+            self._stop_event.set()
+            await task
+            self._finish()
+
+    def start(self) -> None:
+        """Start probing in background thread"""
+        self._reset()
+        self._thread = ThreadRunner(
+            target=asyncio.run,
+            args=(self.run(),),
+            name="AVAILABILITY_PROBER",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, recovery_timeout: int = RECOVERY_TIMEOUT) -> dict:
+        """Wait until all endpoints are available again and stop probing
+        Args:
+            recovery_timeout: max time to wait for endpoints to become available
+        Returns:
+            probing report
+        """
+        self._wait_for_recovery(recovery_timeout)
+        self._stop_event.set()
+        self._thread.join_with_result(timeout=PROBE_TIMEOUT + self.interval + 60)
+        return self._finish()
+
+    def _reset(self) -> None:
+        """Drop samples of previous probing and set probing start time"""
+        self._stop_event.clear()
+        self.samples = {endpoint.name: [] for endpoint in self.endpoints}
+        self.report = None
+        self._started = monotonic()
+        self._started_at = datetime.now()
+
+    async def run(self) -> None:
+        """Probe all endpoints until stopped"""
+        self._logger.info(
+            f"Start probing {[endpoint.name for endpoint in self.endpoints]} "
+            f"every {self.interval} seconds"
+        )
+        await asyncio.gather(
+            *(self._probe_endpoint(endpoint) for endpoint in self.endpoints)
+        )
+
+    async def _probe_endpoint(self, endpoint: ProbeEndpoint) -> None:
+        """Probe endpoint until stopped
+        Args:
+            endpoint: ProbeEndpoint instance
+        """
+        while not self._stop_event.is_set():
+            probe_started = monotonic()
+            error = None
+            try:
+                ok = bool(await asyncio.to_thread(endpoint.check))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                ok, error = False, type(err).__name__
+            self.samples[endpoint.name].append(
+                ProbeSample(
+                    timestamp=probe_started - self._started,
+                    ok=ok,
+                    latency=monotonic() - probe_started,
+                    error=error,
+                )
+            )
+            await asyncio.sleep(max(self.interval - (monotonic() - probe_started), 0))
+
+    def _wait_for_recovery(self, timeout: int = RECOVERY_TIMEOUT) -> None:
+        """Wait until the last probe of every endpoint is successful
+        Args:
+            timeout: max time to wait
+        """
+        deadline = monotonic() + timeout
+        while monotonic() < deadline:
+            if all(samples and samples[-1].ok for samples in self.samples.values()):
+                return
+            self._stop_event.wait(self.interval)
+        self._logger.warning(f"Not all endpoints recovered within {timeout} seconds")
+
+    def _finish(self) -> dict:
+        """Build, log and write probing report
+        Returns:
+            probing report
+        """
+        self.report = self.get_report()
+        for name, endpoint_report in self.report["endpoints"].items():
+            self._logger.info(
+                f"Endpoint {name!r}: downtime {endpoint_report['downtime']} seconds, "
+                f"recovery time {endpoint_report['recovery_time']} seconds, "
+                f"{len(endpoint_report['unavailability_windows'])} unavailability window(s)"
+            )
+        report_path = LOAD_REPORTS_DIR / (
+            f"availability_{self._started_at:%Y%m%d_%H%M%S}.json"
+        )
+        self._write_report(report_path)
+        return self.report
+
+    def get_report(self) -> dict:
+        """Build probing report from collected samples
+        Returns:
+            report with unavailability windows, downtime, recovery time and latency per endpoint
+        """
+        return {
+            "started": self._started_at.isoformat(timespec="seconds")
+            if self._started_at
+            else None,
+            "interval": self.interval,
+            "endpoints": {
+                name: build_availability_report(samples)
+                for name, samples in self.samples.items()
+            },
+        }
+
+    def _write_report(self, report_path: Path) -> None:
+        """Write probing report to JSON file
+        Args:
+            report_path: path of JSON report
+        """
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report, indent=2))
+        self._logger.info(f"Availability report is written to {report_path}")
@@ -4,7 +4,6 @@ from pathlib import Path
 
 import yaml
 from core_libs.common.constants import K8sKeys
-from core_libs.eo.ccd.k8s_api_client import K8sApiClient
 
 from libs.common.bur_sftp_server.constants import (
     SFTP_SERVER_POD,
@@ -16,6 +15,7 @@ from libs.common.constants import (
     DEFAULT_DOWNLOAD_LOCATION,
     GrConfigKeys,
 )
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.logging.logger import logger
 
 
@@ -62,7 +62,7 @@ class BurSftpServer:
     def k8s_client(self):
         """K8s client"""
         if self._k8s_client is None:
-            self._k8s_client = K8sApiClient(
+            self._k8s_client = K8S_CLIENTS.get_client(
                 namespace=self.namespace,
                 kubeconfig_path=self.kubeconfig,
                 download_location=DEFAULT_DOWNLOAD_LOCATION,
@@ -0,0 +1,132 @@
+"""Module with CheckpointStore class that persists created assets and completed tests of GR test stage"""
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator
+
+from libs.common.constants import UTF_8
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+
+class CheckpointFields:
+    """Fields of checkpoint file"""
+
+    ASSETS = "assets"
+    COMPLETED_TESTS = "completed_tests"
+
+
+class CheckpointAssets:
+    """Prefixes of keys of assets stored in checkpoint"""
+
+    CNF_PACKAGE = "cnf_package"
+    CNF_INSTANCE = "cnf_instance"
+
+
+class CheckpointStore:
+    """
+    JSON store of asset IDs (onboarded packages, instantiated CNFs) and tests
+    completed by the test stage, kept per GR_STAGE_SHARED_NAME, so later stages and reruns of the
+    stage can get assets created by previous sessions and skip completed tests instead of recreating
+    expensive state. File is updated under file lock and replaced atomically on every change.
+    """
+
+    def __init__(self, checkpoint_dir: str | Path, stage_name: str):
+        """
+        Args:
+            checkpoint_dir: directory of checkpoint files
+            stage_name: GR_STAGE_SHARED_NAME of the test stage
+        """
+        self.path = Path(checkpoint_dir) / f"{stage_name}.json"
+        self._lock = Lock()
+        self._logger = set_eo_gr_logger_for_class(self)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def get_asset(self, key: str, default: Any = None) -> Any:
+        """Get asset stored by this or previous sessions of the stage
+        Args:
+            key: asset key starting with CheckpointAssets value
+            default: value returned if asset is not stored
+        Returns:
+            asset value
+        """
+        return self._read()[CheckpointFields.ASSETS].get(key, default)
+
+    def save_asset(self, key: str, value: Any) -> None:
+        """Store asset
+        Args:
+            key: asset key starting with CheckpointAssets value
+            value: JSON serializable asset value, e.g. ID
+        """
+        with self._update() as checkpoint:
+            checkpoint[CheckpointFields.ASSETS][key] = value
+        self._logger.debug(f"Checkpoint asset {key}={value!r} saved")
+
+    def drop_asset(self, key: str) -> None:
+        """Remove asset, e.g. when it is deleted or turned out to be missing
+        Args:
+            key: asset key starting with CheckpointAssets value
+        """
+        with self._update() as checkpoint:
+            checkpoint[CheckpointFields.ASSETS].pop(key, None)
+
+    def is_test_completed(self, nodeid: str) -> bool:
+        """Check if the test passed in this or previous session of the stage
+        Args:
+            nodeid: pytest node id
+        Returns:
+            True if test is completed
+        """
+        return nodeid in self._read()[CheckpointFields.COMPLETED_TESTS]
+
+    def complete_test(self, nodeid: str) -> None:
+        """Mark test as completed
+        Args:
+            nodeid: pytest node id
+        """
+        with self._update() as checkpoint:
+            checkpoint[CheckpointFields.COMPLETED_TESTS][
+                nodeid
+            ] = datetime.now().isoformat(timespec="seconds")
+
+    def reset_test(self, nodeid: str) -> None:
+        """Mark test as not completed, so resumed session runs it again
+        Args:
+            nodeid: pytest node id
+        """
+        with self._update() as checkpoint:
+            checkpoint[CheckpointFields.COMPLETED_TESTS].pop(nodeid, None)
+
+    def _read(self) -> dict:
+        """Read checkpoint file
+        Returns:
+            checkpoint content, empty if file does not exist
+        """
+        try:
+            checkpoint = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            checkpoint = {}
+        except json.JSONDecodeError:
+            self._logger.warning(f"Checkpoint {self.path} is corrupted, ignoring it")
+            checkpoint = {}
+        checkpoint.setdefault(CheckpointFields.ASSETS, {})
+        checkpoint.setdefault(CheckpointFields.COMPLETED_TESTS, {})
+        return checkpoint
+
+    @contextmanager
+    def _update(self) -> Iterator[dict]:
+        """Context manager that reads checkpoint under lock and writes it back atomically
+        Yields:
+            checkpoint content to update
+        """
+        lock_path = self.path.with_suffix(".lock")
+        with self._lock, open(lock_path, "w", encoding=UTF_8) as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            checkpoint = self._read()
+            yield checkpoint
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(checkpoint, indent=2))
+            os.replace(tmp_path, self.path)
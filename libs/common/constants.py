@@ -9,10 +9,14 @@ ROOT_PATH = Path(__file__).parent.parent.parent
 DEFAULT_DOWNLOAD_LOCATION = str(ROOT_PATH / "downloads") + os.sep
 UTF_8 = "utf-8"
 EO_GR_LOGGER_NAME = "eo_gr"
+STRUCTURED_LOGGER_NAME = "eo_gr_structured"
 LOCAL_LOG_DIR = ROOT_PATH / "downloaded_logs"
 DEFAULT_NAME = "default-name"
 GR_TEST_PREFIX = "gr-test"
 ENV_PROPERTIES_FILE = ROOT_PATH / "env.properties"
+LOAD_REPORTS_DIR = ROOT_PATH / "load_reports"
+DEFAULT_ARTEFACT_CACHE_DIR = Path.home() / ".cache" / "eo_gr" / "artefacts"
+DEFAULT_CHECKPOINT_DIR = ROOT_PATH / "checkpoints"
 
 
 class ConfigFilePaths:
@@ -58,6 +62,12 @@ class GrEnvVariables:
     DOCKER_CONFIG = "DOCKER_CONFIG"
     GLOBAL_REGISTRY = "GLOBAL_REGISTRY"
     ENABLE_VMVNFM_DEBUG_LOG_LEVEL = "ENABLE_VMVNFM_DEBUG_LOG_LEVEL"
+    PROBE_SWITCHOVER_AVAILABILITY = "PROBE_SWITCHOVER_AVAILABILITY"
+    ARTEFACT_CACHE_DIR = "ARTEFACT_CACHE_DIR"
+    ARTEFACT_CACHE_MAX_SIZE_GB = "ARTEFACT_CACHE_MAX_SIZE_GB"
+    API_QPS_BUDGETS = "API_QPS_BUDGETS"
+    CHECKPOINT_DIR = "CHECKPOINT_DIR"
+    STRUCTURED_LOG_FILENAME = "STRUCTURED_LOG_FILENAME"
 
 
 class UtilScriptsEnvVarConst:
@@ -106,6 +116,15 @@ class EvnfmConfigKeys:
     EVNFM_USER_PASSWORD = "EVNFM_USER_PASSWORD"
 
 
+class ClusterVimConfigKeys:
+    """
+    Class to store keys to read cluster VIM data from env config files
+    """
+
+    OPENSTACK_CLUSTER_AUTH_URL = "OPENSTACK_CLUSTER_AUTH_URL"
+    OPENSTACK_CLUSTER_PROJECT_NAME = "OPENSTACK_CLUSTER_PROJECT_NAME"
+
+
 class EoVersionsFiles:
     """
     Stores constant paths formats for EO versions files
@@ -168,6 +187,7 @@ class DockerRegistryV2ApiPaths:
     Stores url paths for Docker Registry V2 API
     """
 
+    BASE = "v2/"
     REPOSITORIES = "v2/_catalog"
     TAGS = "v2/{repository}/tags/list"
 
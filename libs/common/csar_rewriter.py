@@ -0,0 +1,249 @@
+"""Module with streaming CSAR rewriter used for VNFD ID randomisation"""
+import hashlib
+import os
+import re
+import struct
+import zipfile
+from copy import copy
+from pathlib import Path
+from typing import Any, BinaryIO
+from uuid import uuid4
+
+import yaml
+
+from libs.common.custom_exceptions import CsarRewriteError
+from libs.utils.logging.logger import logger
+
+TOSCA_META_PATH = "TOSCA-Metadata/TOSCA.meta"
+ENTRY_DEFINITIONS_PATTERN = re.compile(rb"Entry-Definitions:\s*(\S+)")
+DESCRIPTOR_ID_KEY = "descriptor_id"
+MANIFEST_HASH_PATTERN = re.compile(
+    rb"(Source:\s*(?P<source>\S+)\s+Algorithm:\s*(?P<algorithm>\S+)\s+Hash:\s*)(?P<hash>[0-9a-fA-F]+)"
+)
+TEXT_MEMBER_SUFFIXES = (".yaml", ".yml", ".mf", ".meta")
+MAX_TEXT_MEMBER_SIZE = 10 * 1024 * 1024
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+LOCAL_FILE_HEADER_SIZE = 30
+ZIP64_EXTRA_ID = 0x0001
+DATA_DESCRIPTOR_FLAG = 0x08
+
+
+def randomize_vnfd_id(source: str | Path, destination: str | Path) -> str:
+    """Write copy of CSAR package with new random VNFD ID.
+    Only text members (VNFD, TOSCA.meta, manifest) that contain the VNFD ID are decompressed and
+    re-encoded, manifest hashes of changed members are recalculated, all other members
+    (images, charts) are copied as raw compressed bytes without decompression.
+    Note: source package is not modified, so it can be a cached read-only base package.
+    Args:
+        source: path of the source CSAR package
+        destination: path of the new CSAR package
+    Raises:
+        CsarRewriteError: when VNFD ID is not found in the package
+    Returns:
+        new VNFD ID
+    """
+    new_vnfd_id = str(uuid4())
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    tmp_destination = Path(destination).with_name(
+        f".{Path(destination).name}.{uuid4().hex}"
+    )
+    with open(source, "rb") as source_fp, zipfile.ZipFile(source_fp) as source_zip:
+        old_vnfd_id = _find_vnfd_id(source_zip)
+        logger.info(
+            f"Rewriting {source} to {destination} with VNFD ID {old_vnfd_id} -> {new_vnfd_id}"
+        )
+        rewritten = _rewrite_text_members(
+            source_zip, old_vnfd_id.encode(), new_vnfd_id.encode()
+        )
+        try:
+            with zipfile.ZipFile(tmp_destination, "w") as destination_zip:
+                for info in source_zip.infolist():
+                    if info.filename in rewritten:
+                        destination_zip.writestr(
+                            _clone_info(info),
+                            rewritten[info.filename],
+                            compress_type=info.compress_type,
+                        )
+                    else:
+                        _copy_raw_member(source_fp, info, destination_zip)
+            os.replace(tmp_destination, destination)
+        finally:
+            tmp_destination.unlink(missing_ok=True)
+    return new_vnfd_id
+
+
+def _find_vnfd_id(source_zip: zipfile.ZipFile) -> str:
+    """Find VNFD ID in the main VNFD of the package
+    Args:
+        source_zip: source CSAR package
+    Raises:
+        CsarRewriteError: when VNFD ID is not found
+    Returns:
+        VNFD ID
+    """
+    names = source_zip.namelist()
+    vnfd_paths = []
+    if TOSCA_META_PATH in names:
+        match = ENTRY_DEFINITIONS_PATTERN.search(source_zip.read(TOSCA_META_PATH))
+        if match:
+            vnfd_paths.append(match.group(1).decode())
+    vnfd_paths += [
+        name
+        for name in names
+        if name.startswith("Definitions/") and name.endswith((".yaml", ".yml"))
+    ]
+    for vnfd_path in vnfd_paths:
+        if vnfd_path in names:
+            try:
+                vnfd = yaml.safe_load(source_zip.read(vnfd_path))
+            except yaml.YAMLError as exc:
+                logger.warning(f"Can't parse {vnfd_path}: {exc}")
+                continue
+            vnfd_id = _get_descriptor_id(vnfd)
+            if vnfd_id:
+                return vnfd_id
+    raise CsarRewriteError(f"VNFD ID is not found in {vnfd_paths}")
+
+
+def _get_descriptor_id(node: Any) -> str | None:
+    """Find descriptor_id property value in the parsed VNFD.
+    SOL001 VNFD defines it in the VNF node type as a property definition with
+    'default' value or 'valid_values' constraint, the node template can set it directly.
+    Args:
+        node: parsed VNFD or its part
+    Returns:
+        VNFD ID or None when it is not found
+    """
+    if isinstance(node, list):
+        return next(filter(None, (_get_descriptor_id(item) for item in node)), None)
+    if not isinstance(node, dict):
+        return None
+    value = node.get(DESCRIPTOR_ID_KEY)
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, dict):
+        if value.get("default") is not None:
+            return str(value["default"])
+        for constraint in value.get("constraints") or []:
+            if isinstance(constraint, dict) and constraint.get("valid_values"):
+                return str(constraint["valid_values"][0])
+    return next(
+        filter(None, (_get_descriptor_id(item) for item in node.values())), None
+    )
+
+
+def _rewrite_text_members(
+    source_zip: zipfile.ZipFile, old_vnfd_id: bytes, new_vnfd_id: bytes
+) -> dict[str, bytes]:
+    """Replace VNFD ID in text members and update manifest hashes of changed members
+    Args:
+        source_zip: source CSAR package
+        old_vnfd_id: VNFD ID to replace
+        new_vnfd_id: new VNFD ID
+    Returns:
+        new content of changed members by member name
+    """
+    # only the whole ID is replaced, not the ID as part of another word
+    vnfd_id_pattern = re.compile(
+        rb"(?<![\w-])" + re.escape(old_vnfd_id) + rb"(?![\w-])"
+    )
+    rewritten = {}
+    manifests = {}
+    for info in source_zip.infolist():
+        if (
+            not info.filename.endswith(TEXT_MEMBER_SUFFIXES)
+            or info.file_size > MAX_TEXT_MEMBER_SIZE
+        ):
+            continue
+        content = source_zip.read(info)
+        if info.filename.endswith(".mf"):
+            manifests[info.filename] = content
+        new_content = vnfd_id_pattern.sub(new_vnfd_id, content)
+        if new_content != content:
+            rewritten[info.filename] = new_content
+
+    for manifest_name, original in manifests.items():
+        content = rewritten.get(manifest_name, original)
+
+        def update_hash(match: re.Match) -> bytes:
+            source = match.group("source").decode()
+            if source not in rewritten:
+                return match.group(0)
+            algorithm = match.group("algorithm").decode().replace("-", "").lower()
+            new_hash = hashlib.new(algorithm, rewritten[source]).hexdigest().encode()
+            return match.group(1) + new_hash
+
+        new_content = MANIFEST_HASH_PATTERN.sub(update_hash, content)
+        if new_content != original:
+            rewritten[manifest_name] = new_content
+    return rewritten
+
+
+def _clone_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Create ZipInfo for the member to be written again with the same name, date and attributes
+    Args:
+        info: source member info
+    Returns:
+        new member info
+    """
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.external_attr = info.external_attr
+    new_info.create_system = info.create_system
+    new_info.comment = info.comment
+    return new_info
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Remove ZIP64 extra field, it is added again by zipfile when it is needed
+    Args:
+        extra: member extra field bytes
+    Returns:
+        extra field bytes without ZIP64 record
+    """
+    result = b""
+    position = 0
+    while position + 4 <= len(extra):
+        field_id, field_size = struct.unpack("<HH", extra[position : position + 4])
+        if field_id != ZIP64_EXTRA_ID:
+            result += extra[position : position + 4 + field_size]
+        position += 4 + field_size
+    return result
+
+
+def _copy_raw_member(
+    source_fp: BinaryIO, info: zipfile.ZipInfo, destination_zip: zipfile.ZipFile
+) -> None:
+    """Copy member compressed data as is, without decompression and compression
+    Args:
+        source_fp: source CSAR file object
+        info: source member info
+        destination_zip: destination CSAR opened for writing
+    """
+    source_fp.seek(info.header_offset)
+    local_header = source_fp.read(LOCAL_FILE_HEADER_SIZE)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    source_fp.seek(
+        info.header_offset + LOCAL_FILE_HEADER_SIZE + name_length + extra_length
+    )
+
+    new_info = copy(info)
+    new_info.extra = _strip_zip64_extra(info.extra)
+    # sizes and CRC are known, so they are written to the local header instead of data descriptor
+    new_info.flag_bits &= ~DATA_DESCRIPTOR_FLAG
+    new_info.header_offset = destination_zip.fp.tell()
+    destination_zip.fp.write(new_info.FileHeader())
+
+    remaining = info.compress_size
+    while remaining:
+        chunk = source_fp.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise CsarRewriteError(f"Unexpected end of data of {info.filename} member")
+        destination_zip.fp.write(chunk)
+        remaining -= len(chunk)
+
+    # register member so zipfile writes it to the central directory on close
+    # pylint: disable=protected-access
+    destination_zip.filelist.append(new_info)
+    destination_zip.NameToInfo[new_info.filename] = new_info
+    destination_zip.start_dir = destination_zip.fp.tell()
+    destination_zip._didModify = True
@@ -87,3 +87,23 @@ class MasterNodeNotFoundError(Exception):
 
 class MissingKeyInConfigMapError(Exception):
     """Exception raises when expected key is missing from ConfigMap"""
+
+
+class NamespacesDeletionTimeoutError(Exception):
+    """Exception raises when namespaces are not deleted within provided timeout"""
+
+
+class VnflcmShellError(Exception):
+    """Exception raises when command in VNFLCM shell session fails or session is broken"""
+
+
+class CsarRewriteError(Exception):
+    """Exception raises when CSAR package can't be rewritten, e.g. VNFD ID is not found"""
+
+
+class PackageOnboardingError(Exception):
+    """Exception raises when VNF package onboarding fails"""
+
+
+class DependencyFailedError(Exception):
+    """Exception raises when task of dependency graph is not run because its dependency failed"""
@@ -1,13 +1,28 @@
 """Module that stores CvnfmNamespaceDeleter class for deleting cnf namespaces from cluster"""
+from functools import cached_property
+from http import HTTPStatus
+from time import monotonic
 
 from core_libs.common.custom_exceptions import NamespaceNotFoundException
+from kubernetes.client import ApiException, CoreV1Api
+from kubernetes.watch import Watch
 
 from apps.codeploy.codeploy_app import CodeployApp
 from libs.common.asset_names import AssetNames
 from libs.common.config_reader import ConfigReader
+from libs.common.custom_exceptions import NamespacesDeletionTimeoutError
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 from libs.common.constants import GR_TEST_PREFIX
 
+NAMESPACES_DELETION_TIMEOUT = 10 * 60
+# namespace conditions that explain why namespace is stuck in Terminating state
+BLOCKING_NS_CONDITIONS = (
+    "NamespaceContentRemaining",
+    "NamespaceFinalizersRemaining",
+    "NamespaceDeletionContentFailure",
+)
+
 
 class CvnfmNamespaceDeleter:
     """Class for deleting CVNFM namespaces from cluster"""
@@ -20,6 +35,13 @@ class CvnfmNamespaceDeleter:
         self.logger = set_eo_gr_logger_for_class(self)
         self.asset_names = AssetNames()
 
+    @cached_property
+    def core_v1_api(self) -> CoreV1Api:
+        """Raw k8s CoreV1Api client for non-blocking requests and watches"""
+        return CoreV1Api(
+            api_client=K8S_CLIENTS.get_api_client(self._codeploy.kubeconfig_path)
+        )
+
     def delete_namespace_by_shared_name(self) -> None:
         """Delete namespace by provided shared name env variable"""
 
@@ -38,26 +60,138 @@ class CvnfmNamespaceDeleter:
                 f"because it does not exists on {self.cluster_name!r} cluster"
             )
 
-    def delete_namespaces_by_default_prefix(self) -> None:
-        """Method that deleted CNF namespaces by default pattern from cluster"""
+    def delete_namespaces_by_default_prefix(
+        self, timeout: int = NAMESPACES_DELETION_TIMEOUT
+    ) -> None:
+        """Method that deleted CNF namespaces by default pattern from cluster.
+        Deletion requests are sent for all matching namespaces at once,
+        then all of them are tracked by single watch under one overall timeout.
+        Args:
+            timeout: overall timeout for all namespaces deletion
+        Raises:
+            NamespacesDeletionTimeoutError: when some namespaces are not deleted within timeout
+        """
 
         self.logger.info(f"Deletion of namespaces that starts with {GR_TEST_PREFIX!r}")
-        is_ns_deleted = False
 
-        ns_names = self.k8s_client.get_list_namespaces()
-        for ns_name in ns_names:
-            if ns_name.startswith(GR_TEST_PREFIX):
-                self.logger.info(
-                    f"Deleting namespace {ns_name!r} from {self.cluster_name!r} cluster..."
-                )
-                # deleting some ns (e.g. with broken objects) may take longer than usual
-                self.k8s_client.delete_namespace(ns_name, timeout=2 * 60)
-                is_ns_deleted = True
-                self.logger.info(
-                    f"Namespace {ns_name!r} deleted from {self.cluster_name!r} cluster"
-                )
-        if not is_ns_deleted:
+        ns_names = [
+            ns_name
+            for ns_name in self.k8s_client.get_list_namespaces()
+            if ns_name.startswith(GR_TEST_PREFIX)
+        ]
+        if not ns_names:
             self.logger.info(
                 f"Namespaces that stars with {GR_TEST_PREFIX!r} "
                 f"were not found on {self.cluster_name!r} cluster."
             )
+            return
+
+        requested = self._request_namespaces_deletion(ns_names)
+        remaining = self._watch_namespaces_deletion(requested, timeout=timeout)
+
+        if remaining:
+            stuck_info = "\n".join(
+                self._describe_blocking_resources(ns_name)
+                for ns_name in sorted(remaining)
+            )
+            raise NamespacesDeletionTimeoutError(
+                f"{len(remaining)} namespace(s) were not deleted from {self.cluster_name!r} "
+                f"cluster within {timeout} seconds:\n{stuck_info}"
+            )
+        self.logger.info(
+            f"Namespaces {ns_names} deleted from {self.cluster_name!r} cluster"
+        )
+
+    def _request_namespaces_deletion(self, ns_names: list[str]) -> set[str]:
+        """Send deletion requests for all provided namespaces without waiting for deletion
+        Args:
+            ns_names: namespaces names
+        Returns:
+            names of namespaces for which deletion was requested and which still exist
+        Raises:
+            ApiException: when request fails with status code other than 404
+        """
+        requested = set()
+        for ns_name in ns_names:
+            self.logger.info(
+                f"Requesting deletion of {ns_name!r} namespace from {self.cluster_name!r} cluster..."
+            )
+            try:
+                self.core_v1_api.delete_namespace(ns_name)
+                requested.add(ns_name)
+            except ApiException as err:
+                if err.status != HTTPStatus.NOT_FOUND:
+                    raise
+                self.logger.info(f"Namespace {ns_name!r} has already been removed")
+        return requested
+
+    def _watch_namespaces_deletion(self, ns_names: set[str], timeout: int) -> set[str]:
+        """Track namespaces Terminating -> gone transition by single namespaces watch
+        Args:
+            ns_names: names of namespaces to track
+            timeout: overall timeout for all namespaces deletion
+        Returns:
+            names of namespaces that are still present after timeout
+        """
+        deadline = monotonic() + timeout
+        ns_list = self.core_v1_api.list_namespace()
+        remaining = {ns.metadata.name for ns in ns_list.items} & ns_names
+        resource_version = ns_list.metadata.resource_version
+
+        while remaining and (time_left := int(deadline - monotonic())) > 0:
+            self.logger.info(
+                f"Waiting for {len(remaining)} namespace(s) deletion, {time_left} seconds left..."
+            )
+            watch = Watch()
+            try:
+                for event in watch.stream(
+                    self.core_v1_api.list_namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=time_left,
+                ):
+                    namespace = event["object"]
+                    resource_version = namespace.metadata.resource_version
+                    if (
+                        event["type"] == "DELETED"
+                        and namespace.metadata.name in remaining
+                    ):
+                        remaining.discard(namespace.metadata.name)
+                        self.logger.info(
+                            f"Namespace {namespace.metadata.name!r} deleted from {self.cluster_name!r} cluster"
+                        )
+                        if not remaining:
+                            watch.stop()
+            except ApiException as err:
+                if err.status != HTTPStatus.GONE:
+                    raise
+                # resource version is too old, re-list and continue watching
+                ns_list = self.core_v1_api.list_namespace()
+                remaining &= {ns.metadata.name for ns in ns_list.items}
+                resource_version = ns_list.metadata.resource_version
+        return remaining
+
+    def _describe_blocking_resources(self, ns_name: str) -> str:
+        """Collect namespace finalizers and conditions that block its deletion
+        Args:
+            ns_name: namespace name
+        Returns:
+            text description of namespace deletion blockers
+        """
+        try:
+            namespace = self.core_v1_api.read_namespace(ns_name)
+        except ApiException as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                return f"{ns_name}: already deleted"
+            raise
+        finalizers = namespace.spec.finalizers if namespace.spec else None
+        blockers = [
+            f"{condition.type}: {condition.message}"
+            for condition in namespace.status.conditions or []
+            if condition.type in BLOCKING_NS_CONDITIONS and condition.status == "True"
+        ]
+        description = (
+            f"{ns_name} (phase={namespace.status.phase}, finalizers={finalizers}): "
+            f"{'; '.join(blockers) or 'no blocking resources reported'}"
+        )
+        self.logger.error(f"Namespace is stuck on deletion: {description}")
+        return description
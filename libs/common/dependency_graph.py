@@ -0,0 +1,195 @@
+"""Module with DependencyGraph class that runs dependent tasks concurrently in a thread pool"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Iterable
+
+from libs.common.custom_exceptions import DependencyFailedError
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+DEFAULT_GRAPH_WORKERS = 8
+
+
+@dataclass
+class _Node:
+    """Task of the graph, receives results of its dependencies as positional arguments"""
+
+    func: Callable
+    deps: tuple[str, ...]
+
+
+class DependencyGraph:
+    """
+    Graph of named tasks with dependencies. Task starts in a thread pool as soon as all its
+    dependencies are done, so independent tasks (e.g. round trips to different sites) run
+    concurrently and total time is bounded by the slowest chain of dependent tasks.
+    Results and errors are kept per task: error of the task is raised when its result is taken,
+    tasks depending on the failed one are not run and raise DependencyFailedError.
+    Result of the task that was not run yet is computed on demand in the calling thread,
+    result of the task run by another thread is waited for without blocking other tasks.
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_GRAPH_WORKERS):
+        """
+        Args:
+            name: graph name used in logs and thread names
+            max_workers: max number of concurrently running tasks
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self._nodes: dict[str, _Node] = {}
+        self._futures: dict[str, Future] = {}
+        self._durations: dict[str, float] = {}
+        self._lock = Lock()
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    @property
+    def names(self) -> set[str]:
+        """Names of all tasks of the graph"""
+        return set(self._nodes)
+
+    def add(self, name: str, func: Callable, deps: Iterable[str] = ()) -> None:
+        """Add task to the graph
+        Args:
+            name: task name
+            func: callable that receives results of dependencies in order of deps
+            deps: names of tasks the task depends on
+        """
+        self._nodes[name] = _Node(func=func, deps=tuple(deps))
+
+    def run(self, names: Iterable[str] | None = None) -> None:
+        """Run tasks with their dependencies concurrently and wait for all of them
+        Args:
+            names: tasks to run, all tasks if not provided
+        """
+        pending = self._get_closure(self.names if names is None else names)
+        started = monotonic()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.name
+        ) as executor:
+            running: dict[Future, str] = {}
+            while pending or running:
+                for name in sorted(pending):
+                    deps = self._nodes[name].deps
+                    if not all(self._is_done(dep) for dep in deps):
+                        continue
+                    pending.discard(name)
+                    future, is_owner = self._claim(name)
+                    if is_owner and not self._fail_if_dependency_failed(name, future):
+                        executor.submit(self._run_node, name, future)
+                    if not future.done():
+                        running[future] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+        self._logger.info(
+            "%s finished in %.1fs: %s",
+            self.name,
+            monotonic() - started,
+            ", ".join(
+                f"{name} {duration:.1f}s"
+                for name, duration in sorted(
+                    self._durations.items(), key=lambda item: -item[1]
+                )
+            ),
+        )
+
+    def result(self, name: str) -> Any:
+        """Get result of the task, task and its dependencies are run in the calling thread if not run yet,
+        task run by another thread is waited for
+        Args:
+            name: task name
+        Raises:
+            exception raised by the task or DependencyFailedError if its dependency failed
+        Returns:
+            task result
+        """
+        future, is_owner = self._claim(name)
+        if is_owner:
+            for dep in self._nodes[name].deps:
+                try:
+                    self.result(dep)
+                except BaseException:  # pylint: disable=broad-except
+                    break
+            if not self._fail_if_dependency_failed(name, future):
+                self._run_node(name, future)
+        return future.result()
+
+    def _claim(self, name: str) -> tuple[Future, bool]:
+        """Get future of the task, the first caller becomes its owner and has to run the task
+        Args:
+            name: task name
+        Returns:
+            future of the task and True if the caller is the owner
+        """
+        with self._lock:
+            if name in self._futures:
+                return self._futures[name], False
+            future = self._futures[name] = Future()
+            return future, True
+
+    def _is_done(self, name: str) -> bool:
+        """Check if the task is finished
+        Args:
+            name: task name
+        Returns:
+            True if the task result or error is stored
+        """
+        future = self._futures.get(name)
+        return future is not None and future.done()
+
+    def _fail_if_dependency_failed(self, name: str, future: Future) -> bool:
+        """Store DependencyFailedError as the task error if any of its finished dependencies failed
+        Args:
+            name: task name
+            future: future of the task
+        Returns:
+            True if the dependency failed
+        """
+        for dep in self._nodes[name].deps:
+            if self._is_done(dep) and (exc := self._futures[dep].exception()):
+                error = DependencyFailedError(
+                    f"{name!r} is not run, its dependency {dep!r} failed"
+                )
+                error.__cause__ = exc
+                future.set_exception(error)
+                return True
+        return False
+
+    def _run_node(self, name: str, future: Future) -> None:
+        """Run the task and store its result or error, incl. BaseException such as pytest skip,
+        so the error is raised again when the result is taken instead of running the task again
+        Args:
+            name: task name
+            future: future of the task to store result to
+        """
+        node = self._nodes[name]
+        started = monotonic()
+        try:
+            result = node.func(*(self._futures[dep].result() for dep in node.deps))
+        except BaseException as exc:  # pylint: disable=broad-except
+            self._logger.warning(f"{self.name} task {name!r} failed: {exc!r}")
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            self._durations[name] = monotonic() - started
+
+    def _get_closure(self, names: Iterable[str]) -> set[str]:
+        """Get tasks with all their transitive dependencies
+        Args:
+            names: task names
+        Returns:
+            task names
+        """
+        closure = set()
+        stack = [name for name in names if name in self._nodes]
+        while stack:
+            name = stack.pop()
+            if name not in closure:
+                closure.add(name)
+                stack.extend(self._nodes[name].deps)
+        return closure
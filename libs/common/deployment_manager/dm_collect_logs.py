@@ -16,6 +16,7 @@ from libs.common.deployment_manager.dm_constants import (
 )
 from libs.common.env_variables import ENV_VARS
 from libs.common.eo_rv_node.constants import EoNodePaths
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.common_utils import run_shell_cmd, search_with_pattern
 from libs.utils.logging.logger import logger
 from libs.common.constants import LOCAL_LOG_DIR
@@ -40,7 +41,7 @@ class DeploymentManagerLogCollection(DeploymentManagerClient):
         K8s EO client property
         Returns: K8sApiClient instance
         """
-        return K8sApiClient(
+        return K8S_CLIENTS.get_client(
             namespace=self.namespace,
             kubeconfig_path=self.kube_config_path,
         )
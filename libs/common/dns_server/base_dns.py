@@ -11,6 +11,7 @@ from libs.common.constants import (
     DEFAULT_DOWNLOAD_LOCATION,
 )
 from libs.common.dns_server.data.dns_constants import DnsServerK8sConstants
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 
 
@@ -41,7 +42,7 @@ class BaseDns:
     @cached_property
     def k8s_dns_server_client(self) -> K8sApiClient:
         """K8s client for DNS server"""
-        return K8sApiClient(
+        return K8S_CLIENTS.get_client(
             namespace=self.k8s_dns_namespace,
             kubeconfig_path=self.active_site_config.read_section(
                 GrConfigKeys.DNS_SERVER_KUBE_CONFIG
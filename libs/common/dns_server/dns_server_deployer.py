@@ -26,6 +26,7 @@ from libs.common.dns_server.data.dns_constants import (
     DnsServerPaths,
     DnsFileConstants,
 )
+from libs.common.k8s_client_registry import K8S_CLIENTS
 
 SiteData = namedtuple("SiteData", "env_name k8s_client config")
 
@@ -183,7 +184,7 @@ class DNSServerDeployer(BaseDns):
         Returns:
             K8sApiClient object
         """
-        return K8sApiClient(
+        return K8S_CLIENTS.get_client(
             namespace=self.namespace,
             kubeconfig_path=config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH),
             download_location=DEFAULT_DOWNLOAD_LOCATION,
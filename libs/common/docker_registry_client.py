@@ -11,6 +11,7 @@ from core_libs.common.misc_utils import (
     get_pretty_json,
 )
 
+from libs.common.api_call_stats import ApiClients, count_session_requests
 from libs.common.constants import DockerRegistryV2ApiPaths
 from libs.common.env_variables import ENV_VARS
 from libs.utils.logging.logger import logger
@@ -25,6 +26,7 @@ class DockerRegistryApiV2Client:
         self.password = password
         self._session = requests.Session()
         self._session.auth = (self.username, self.password)
+        count_session_requests(self._session, ApiClients.REGISTRY)
 
     def _request(self, method, url_path: str) -> requests.Response:
         """
@@ -67,6 +69,20 @@ class DockerRegistryApiV2Client:
         """
         return self._request(method="GET", url_path=url_path)
 
+    def ping(self, timeout: float = 10) -> bool:
+        """
+        Check registry API availability with V2 base endpoint, request is not logged to keep it lightweight
+        Args:
+            timeout: request timeout
+        Returns:
+            True if registry API answered successfully
+        """
+        return self._session.get(
+            urljoin(self.registry_host, DockerRegistryV2ApiPaths.BASE),
+            verify=False,
+            timeout=timeout,
+        ).ok
+
     def get_repositories(self) -> dict:
         """
         Get all repositories (images) from registry
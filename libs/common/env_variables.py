@@ -6,7 +6,13 @@ from typing import Any
 from core_libs.common.constants import EnvVariables
 from core_libs.common.misc_utils import get_boolean_from_env_var
 
-from libs.common.constants import GrEnvVariables, UtilScriptsEnvVarConst, DEFAULT_NAME
+from libs.common.constants import (
+    DEFAULT_ARTEFACT_CACHE_DIR,
+    DEFAULT_CHECKPOINT_DIR,
+    DEFAULT_NAME,
+    GrEnvVariables,
+    UtilScriptsEnvVarConst,
+)
 from libs.common.custom_exceptions import EnvironmentVariableNotProvidedError
 
 
@@ -73,6 +79,17 @@ class EnvironmentVariables:
             GrEnvVariables.EO_VERSIONS_COLLECTION, default_val=True, is_bool_var=True
         )
 
+    @cached_property
+    def is_probe_switchover_availability(self) -> bool:
+        """Returns boolean value of PROBE_SWITCHOVER_AVAILABILITY environment variable
+        - Default value is: False
+        """
+        return self._get_env(
+            GrEnvVariables.PROBE_SWITCHOVER_AVAILABILITY,
+            default_val=False,
+            is_bool_var=True,
+        )
+
     @cached_property
     def pretty_api_logs(self) -> bool:
         """Returns value of PRETTY_API_LOGS environment variable
@@ -100,6 +117,48 @@ class EnvironmentVariables:
         """Returns value of the DOCKER_CONFIG environment variable"""
         return self._get_env(GrEnvVariables.DOCKER_CONFIG)
 
+    @cached_property
+    def artefact_cache_dir(self) -> str:
+        """Returns value of ARTEFACT_CACHE_DIR environment variable
+        - Default value is: ~/.cache/eo_gr/artefacts
+        """
+        return self._get_env(
+            GrEnvVariables.ARTEFACT_CACHE_DIR,
+            default_val=str(DEFAULT_ARTEFACT_CACHE_DIR),
+        )
+
+    @cached_property
+    def artefact_cache_max_size_gb(self) -> float:
+        """Returns value of ARTEFACT_CACHE_MAX_SIZE_GB environment variable
+        - Default value is: 50
+        """
+        return float(
+            self._get_env(GrEnvVariables.ARTEFACT_CACHE_MAX_SIZE_GB, default_val=50)
+        )
+
+    @cached_property
+    def api_qps_budgets(self) -> dict[str, float]:
+        """Returns value of API_QPS_BUDGETS environment variable as dict,
+        e.g. 'k8s=20,ssh=5' limits K8s API calls to 20 and SSH commands to 5 per second
+        - Default value is: empty, calls are not limited
+        """
+        budgets = self._get_env(GrEnvVariables.API_QPS_BUDGETS, default_val="")
+        return {
+            client.strip(): float(rate)
+            for client, rate in (
+                budget.split("=", 1) for budget in budgets.split(",") if budget.strip()
+            )
+        }
+
+    @cached_property
+    def checkpoint_dir(self) -> str:
+        """Returns value of CHECKPOINT_DIR environment variable
+        - Default value is: checkpoints directory in the project root
+        """
+        return self._get_env(
+            GrEnvVariables.CHECKPOINT_DIR, default_val=str(DEFAULT_CHECKPOINT_DIR)
+        )
+
     # endregion
 
     # region DM
@@ -2,12 +2,15 @@
 Module that stores EO Node relative functionality
 """
 import logging
+import os
 
 import asyncssh
 from core_libs.common.constants import CommonConfigKeys
 from core_libs.common.ssh import SSHClient
 
+from libs.common.api_call_stats import API_CALLS, ApiClients, tracked_command
 from libs.common.config_reader import ConfigReader
+from libs.common.time_accounting import TimeBuckets, accounted
 from libs.utils.logging.logger import logger
 
 logging.getLogger("asyncssh").setLevel(logging.WARNING)
@@ -41,6 +44,13 @@ class EoRvNode:
         """EO_NODE_PASSWORD property"""
         return self.config_reader.read_section(CommonConfigKeys.EO_NODE_PASSWORD)
 
+    @property
+    def site(self) -> str:
+        """Name of the site, added to the structured log records of the commands"""
+        return self.config_reader.read_section(CommonConfigKeys.ENV_NAME)
+
+    @accounted(TimeBuckets.REMOTE)
+    @tracked_command(ApiClients.EO_NODE, host_attr="eo_node_host")
     def execute_cmd(self, cmd: str, **kwargs) -> str:
         """
         Execute provided cmd on eo node
@@ -55,6 +65,8 @@ class EoRvNode:
             output = ssh_client.exec_cmd(cmd, stdout_only=False, **kwargs)
         return output.stdout or output.stderr
 
+    @accounted(TimeBuckets.REMOTE)
+    @tracked_command(ApiClients.EO_NODE, host_attr="eo_node_host")
     async def execute_cmd_async(self, cmd: str, **kwargs) -> str:
         """
         Execute provided cmd on eo node in async mode
@@ -75,6 +87,7 @@ class EoRvNode:
             output = await conn.run(cmd, **kwargs)
         return output.stdout or output.stderr
 
+    @accounted(TimeBuckets.REMOTE)
     def download_file(self, remote_file_path: str, destination_local_path: str) -> None:
         """
         Download file from E0 RV Node to local path
@@ -84,5 +97,8 @@ class EoRvNode:
         """
         logger.info(f"Download file {remote_file_path} from EO Node")
 
-        with self.ssh_client as ssh_client:
+        with API_CALLS.track(
+            ApiClients.EO_NODE, "download", remote_file_path
+        ) as call, self.ssh_client as ssh_client:
             ssh_client.download_file(remote_file_path, destination_local_path)
+            call.received_bytes = os.path.getsize(destination_local_path)
@@ -7,6 +7,7 @@ from core_libs.eo.ccd.k8s_api_client import K8sApiClient
 
 from libs.common.config_reader import ConfigReader
 from libs.common.iperf_tool.constants import IperfServerPaths
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 
 
@@ -35,7 +36,7 @@ class IperfToolServer:
         Returns:
             K8s client
         """
-        return K8sApiClient(
+        return K8S_CLIENTS.get_client(
             namespace=self.namespace,
             kubeconfig_path=self._config.read_section(
                 CcdConfigKeys.CCD_KUBECONFIG_PATH
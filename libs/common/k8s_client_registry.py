@@ -0,0 +1,207 @@
+"""Module that stores process-wide registry of K8s clients shared per cluster"""
+import json
+from collections import Counter
+from copy import copy
+from threading import RLock
+
+from core_libs.eo.ccd.k8s_api_client import K8sApiClient
+from kubernetes.client import ApiClient, ApiException
+
+from libs.common.api_call_stats import API_CALLS, ApiClients
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
+from libs.utils.logging.logger import logger
+
+# max number of simultaneously opened connections to one cluster API server,
+# covers thread pools used for bulk k8s operations (PV cleanup, namespaces deletion etc.)
+K8S_CONNECTION_POOL_MAXSIZE = 32
+
+
+class K8sClientRegistry:
+    """
+    Registry that keeps one configured K8s client per cluster (kubeconfig, context)
+    and hands out namespace-scoped views over it.
+
+    Views are built from the cluster client without loading kubeconfig again: they share API objects
+    with tuned kubernetes ApiClient(s) and connection pools of the cluster client,
+    but have their own namespace and own copies of container attributes (caches).
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._clients: dict[tuple, K8sApiClient] = {}
+        self._views: dict[tuple, K8sApiClient] = {}
+        self._request_counters: dict[tuple, Counter] = {}
+
+    def get_client(
+        self,
+        kubeconfig_path: str,
+        namespace: str,
+        download_location: str | None = None,
+    ) -> K8sApiClient:
+        """Get K8s client scoped to provided namespace of the cluster
+        Args:
+            kubeconfig_path: path or url to the cluster kubeconfig
+            namespace: namespace name the client is scoped to
+            download_location: location to download kubeconfig and other files to
+        Returns:
+            namespace-scoped K8sApiClient instance that shares connections with other cluster clients
+        """
+        view_key = kubeconfig_path, download_location, namespace
+        with self._lock:
+            if view_key not in self._views:
+                self._views[view_key] = self._create_view(
+                    self._get_cluster_client(kubeconfig_path, download_location),
+                    namespace,
+                )
+            return self._views[view_key]
+
+    def get_api_client(self, kubeconfig_path: str) -> ApiClient:
+        """Get raw kubernetes ApiClient of the cluster client with tuned connection pool and request counting
+        Args:
+            kubeconfig_path: path or url to the cluster kubeconfig
+        Returns:
+            shared kubernetes ApiClient instance
+        """
+        with self._lock:
+            return self._get_api_clients(self._get_cluster_client(kubeconfig_path))[0]
+
+    def get_request_counters(self) -> dict[str, dict[str, int]]:
+        """Get number of requests sent to K8s API servers grouped by client and HTTP method
+        Returns:
+            dict with client name as a key and requests number per HTTP method as a value
+        """
+        with self._lock:
+            return {
+                " ".join(filter(None, map(str, key))): dict(counter)
+                for key, counter in self._request_counters.items()
+            }
+
+    def log_request_counters(self) -> None:
+        """Log number of requests sent by every registered client"""
+        for client, counters in self.get_request_counters().items():
+            logger.info(
+                f"K8s client {client!r}: {sum(counters.values())} requests {counters}"
+            )
+
+    def clear(self) -> None:
+        """Close all shared clients and clear the registry"""
+        with self._lock:
+            for client in self._clients.values():
+                for api_client in self._get_api_clients(client):
+                    api_client.close()
+            self._clients.clear()
+            self._views.clear()
+            self._request_counters.clear()
+
+    def _get_cluster_client(
+        self, kubeconfig_path: str, download_location: str | None = None
+    ) -> K8sApiClient:
+        """Get or create base K8s client of the cluster
+        Args:
+            kubeconfig_path: path or url to the cluster kubeconfig
+            download_location: location to download kubeconfig and other files to
+        Returns:
+            K8sApiClient instance of the cluster
+        """
+        key = kubeconfig_path, download_location
+        if key not in self._clients:
+            logger.debug(f"Creating shared K8s client for {kubeconfig_path!r}")
+            kwargs = (
+                {"download_location": download_location} if download_location else {}
+            )
+            client = K8sApiClient(
+                namespace=None, kubeconfig_path=kubeconfig_path, **kwargs
+            )
+            self._tune_client_connections(client, key)
+            self._clients[key] = client
+        return self._clients[key]
+
+    @staticmethod
+    def _create_view(cluster_client: K8sApiClient, namespace: str) -> K8sApiClient:
+        """Create K8s client scoped to the namespace from the already configured cluster client
+        Args:
+            cluster_client: base K8sApiClient instance of the cluster
+            namespace: namespace name the client is scoped to
+        Returns:
+            namespace-scoped K8sApiClient instance
+        """
+        view = copy(cluster_client)
+        for name, value in vars(view).items():
+            if isinstance(value, (dict, list, set)):
+                setattr(view, name, copy(value))
+        view.namespace = namespace
+        return view
+
+    @staticmethod
+    def _get_api_clients(client: K8sApiClient) -> list[ApiClient]:
+        """Get kubernetes ApiClient(s) used by API objects of K8sApiClient
+        Args:
+            client: K8sApiClient instance
+        Returns:
+            unique ApiClient instances
+        """
+        return list(
+            {
+                id(api.api_client): api.api_client
+                for api in vars(client).values()
+                if isinstance(getattr(api, "api_client", None), ApiClient)
+            }.values()
+        )
+
+    def _tune_client_connections(self, client: K8sApiClient, key: tuple) -> None:
+        """Enlarge connection pool and enable request counting for kubernetes ApiClient(s) used by K8sApiClient
+        Args:
+            client: K8sApiClient instance
+            key: registry key of the client
+        """
+        for api_client in self._get_api_clients(client):
+            pool_manager = api_client.rest_client.pool_manager
+            pool_manager.connection_pool_kw["maxsize"] = K8S_CONNECTION_POOL_MAXSIZE
+            pool_manager.clear()
+            self._count_requests(api_client, key)
+
+    def _count_requests(self, api_client: ApiClient, key: tuple) -> None:
+        """Wrap ApiClient call_api and REST client request methods to count requests sent by the client,
+        their bytes and latency per resource path and account their time
+        Args:
+            api_client: kubernetes ApiClient instance
+            key: registry key of the client
+        """
+        counter = self._request_counters.setdefault(key, Counter())
+        call_api = api_client.call_api
+        rest_request = api_client.rest_client.request
+
+        def counted_call_api(resource_path, method, *args, **kwargs):
+            counter[method] += 1
+            with TIME_ACCOUNTANT.account(TimeBuckets.REMOTE), API_CALLS.track(
+                ApiClients.K8S, method, resource_path
+            ) as call:
+                path_params = args[0] if args else kwargs.get("path_params")
+                if "/pods/" in resource_path and path_params:
+                    call.pod = path_params.get("name")
+                call.host = api_client.configuration.host
+                try:
+                    return call_api(resource_path, method, *args, **kwargs)
+                except ApiException as exc:
+                    call.http_status = exc.status
+                    raise
+
+        def measured_request(method, url, *args, **kwargs):
+            response = rest_request(method, url, *args, **kwargs)
+            API_CALLS.set_http_status(response.status)
+            body = kwargs.get("body")
+            API_CALLS.add_bytes(
+                sent=len(json.dumps(body, default=str)) if body is not None else 0,
+                received=(
+                    len(response.data or b"")
+                    if kwargs.get("_preload_content", True)
+                    else 0
+                ),
+            )
+            return response
+
+        api_client.call_api = counted_call_api
+        api_client.rest_client.request = measured_request
+
+
+K8S_CLIENTS = K8sClientRegistry()
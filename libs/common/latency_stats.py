@@ -0,0 +1,38 @@
+"""Module with helpers to summarize latency samples of operations and requests"""
+from math import ceil
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: list[float], percent: float) -> float | None:
+    """Calculate percentile of values with nearest-rank method
+    Args:
+        values: list of values
+        percent: percentile to calculate, 0-100
+    Returns:
+        percentile value, None for empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_latencies(values: list[float], precision: int = 3) -> dict:
+    """Summarize latency samples into count, min, max, mean and percentiles
+    Args:
+        values: latency samples in seconds
+        precision: number of digits to round values to
+    Returns:
+        dictionary with summary, e.g. {"count": 3, "min": 0.1, "p50": 0.2, ...}
+    """
+    summary = {"count": len(values)}
+    if not values:
+        return summary
+    summary["min"] = round(min(values), precision)
+    summary["mean"] = round(sum(values) / len(values), precision)
+    for percent in PERCENTILES:
+        summary[f"p{percent}"] = round(percentile(values, percent), precision)
+    summary["max"] = round(max(values), precision)
+    return summary
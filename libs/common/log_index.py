@@ -0,0 +1,162 @@
+"""Module with LogIndex class that keeps byte offsets of test phases in the log file"""
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Iterable
+
+from libs.common.constants import UTF_8
+
+LOG_INDEX_SUFFIX = ".index"
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class LogIndexEntry:
+    """Byte range of the log file written during the test phase, times are epoch seconds"""
+
+    nodeid: str
+    when: str
+    start: int
+    end: int
+    started: float
+    ended: float
+
+
+class LogIndex:
+    """
+    Sidecar file of the log with one JSON line per test phase (setup/call/teardown) holding
+    byte offsets of the phase records, so the log of any test or time window is sliced with a seek
+    instead of scanning a multi-GB file. Entries are appended when the phase finishes,
+    so the index can be read while the session is running.
+    """
+
+    def __init__(self, log_path: str | Path):
+        """
+        Args:
+            log_path: path to the log file
+        """
+        self.log_path = Path(log_path)
+        self.path = self.log_path.with_name(self.log_path.name + LOG_INDEX_SUFFIX)
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        """Remove entries of the previous session, log file is rewritten by the new session"""
+        self.path.unlink(missing_ok=True)
+
+    def get_offset(self) -> int:
+        """Flush file handlers writing to the log and get its size, i.e. offset of the next record
+        Returns:
+            byte offset
+        """
+        for handler in self._get_file_handlers():
+            handler.flush()
+        try:
+            return self.log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def add(self, entry: LogIndexEntry) -> None:
+        """Append entry to the index
+        Args:
+            entry: test phase entry
+        """
+        with self._lock, self.path.open("a", encoding=UTF_8) as f:
+            f.write(json.dumps(asdict(entry)) + "\n")
+
+    def read(self) -> list[LogIndexEntry]:
+        """Read all entries of the index
+        Returns:
+            entries in order of test phases
+        """
+        with self.path.open(encoding=UTF_8) as f:
+            return [LogIndexEntry(**json.loads(line)) for line in f if line.strip()]
+
+    def find(
+        self,
+        nodeid: str | None = None,
+        when: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[LogIndexEntry]:
+        """Find entries of test phases matching all provided filters
+        Args:
+            nodeid: part of pytest node id
+            when: test phase: setup, call or teardown
+            since: epoch seconds, phases ended before are skipped
+            until: epoch seconds, phases started after are skipped
+        Returns:
+            matching entries
+        """
+        return [
+            entry
+            for entry in self.read()
+            if (nodeid is None or nodeid in entry.nodeid)
+            and (when is None or entry.when == when)
+            and (since is None or entry.ended >= since)
+            and (until is None or entry.started <= until)
+        ]
+
+    def copy(self, entries: Iterable[LogIndexEntry], output: BinaryIO) -> int:
+        """Copy log records of the entries to output, adjacent byte ranges are copied at once
+        Args:
+            entries: entries to copy
+            output: binary stream
+        Returns:
+            number of copied bytes
+        """
+        ranges = []
+        for entry in sorted(entries, key=lambda item: item.start):
+            if ranges and entry.start <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], entry.end)
+            else:
+                ranges.append([entry.start, entry.end])
+
+        copied = 0
+        with self.log_path.open("rb") as log_file:
+            for start, end in ranges:
+                log_file.seek(start)
+                shutil.copyfileobj(
+                    _LimitedReader(log_file, end - start), output, COPY_CHUNK_SIZE
+                )
+                copied += end - start
+        return copied
+
+    def _get_file_handlers(self) -> list[logging.FileHandler]:
+        """Get file handlers of all loggers writing to the log file
+        Returns:
+            file handlers
+        """
+        loggers = [logging.getLogger()] + [
+            item
+            for item in logging.Logger.manager.loggerDict.values()
+            if isinstance(item, logging.Logger)
+        ]
+        log_path = os.path.abspath(self.log_path)
+        return list(
+            {
+                handler
+                for item in loggers
+                for handler in item.handlers
+                if isinstance(handler, logging.FileHandler)
+                and handler.baseFilename == log_path
+            }
+        )
+
+
+class _LimitedReader:
+    """Binary stream reader that stops after the given number of bytes"""
+
+    def __init__(self, stream: BinaryIO, size: int):
+        self._stream = stream
+        self._left = size
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most size bytes without crossing the limit"""
+        size = self._left if size < 0 else min(size, self._left)
+        data = self._stream.read(size)
+        self._left -= len(data)
+        return data
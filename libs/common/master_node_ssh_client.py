@@ -7,8 +7,12 @@ from shlex import quote
 import paramiko
 from core_libs.common.ssh import SSHClient, SSHResult
 
+from libs.common.api_call_stats import API_CALLS, ApiClients, tracked_command
+from libs.common.time_accounting import TimeBuckets, accounted
 from libs.utils.logging.logger import logger, log_exception
 
+SSH_CMD_LOG_PATTERN = "SSH {host}CMD: {cmd}"
+
 
 class SSHMasterNode(SSHClient):
     """Class that allows establishing SSH sessions to the master and worker nodes"""
@@ -23,6 +27,7 @@ class SSHMasterNode(SSHClient):
         worker_ip: str | None = None,
         worker_username: str | None = None,
         worker_password: str | None = None,
+        site: str | None = None,
     ) -> None:
         super().__init__(
             hostname, username=username, password=password, key_filename=key_filename
@@ -37,6 +42,7 @@ class SSHMasterNode(SSHClient):
         self.worker_client = None
         self.worker_host = None
         self._tcp_forwarding_enabled = False
+        self.site = site
 
     def connect(
         self, timeout: int = 60 * 2, on_worker: bool = False, **kwargs
@@ -104,6 +110,8 @@ class SSHMasterNode(SSHClient):
 
         return self
 
+    @accounted(TimeBuckets.REMOTE)
+    @tracked_command(ApiClients.SSH)
     def exec_cmd(
         self,
         cmd: str | list,
@@ -136,26 +144,21 @@ class SSHMasterNode(SSHClient):
             cmd = " ".join([quote(str(i)) for i in cmd])
 
         host_pattern = "-> [{}] "
-        log_message_pattern = "SSH {host}CMD: {cmd}"
         host = host_pattern.format(self.host)
 
         try:
             if on_worker:
                 self.connect(on_worker=on_worker)
                 host += host_pattern.format(self.worker_host)
+                API_CALLS.set_host(self.worker_host)
                 # establishing jump connection
                 with self.worker_client as worker_client:
                     result = self.ssh_result(worker_client.exec_command(cmd, **kwargs))
             else:
                 result = self.ssh_result(self.client.exec_command(cmd, **kwargs))
 
-            log_message = log_message_pattern.format(host=host, cmd=cmd)
-
-            if result.stdout:
-                log_message += f"\nSTDOUT: {result.stdout}"
-            if result.stderr:
-                log_message += f"\nSTDERR: {result.stderr}"
-            logger.info(log_message)
+            API_CALLS.set_exit_code(result.exit_code)
+            self._log_cmd_result(SSH_CMD_LOG_PATTERN.format(host=host, cmd=cmd), result)
 
             if result.exit_code != 0:
                 err_txt = (
@@ -174,10 +177,25 @@ class SSHMasterNode(SSHClient):
                 ) from exc
             raise
         except TimeoutError:
-            log_message = log_message_pattern.format(host=host, cmd=cmd)
+            log_message = SSH_CMD_LOG_PATTERN.format(host=host, cmd=cmd)
             logger.info(log_message)
             raise
 
+    @staticmethod
+    def _log_cmd_result(log_message: str, result: SSHResult) -> None:
+        """
+        Log the command with its output, typed fields of the command are written
+        to the structured log by tracked_command
+        Args:
+            log_message: message with the host and the command
+            result: SSHResult instance
+        """
+        if result.stdout:
+            log_message += f"\nSTDOUT: {result.stdout}"
+        if result.stderr:
+            log_message += f"\nSTDERR: {result.stderr}"
+        logger.info(log_message)
+
     @staticmethod
     def ssh_result(raw_ssh_result: tuple) -> SSHResult:
         """
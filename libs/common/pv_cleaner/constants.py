@@ -18,3 +18,14 @@ class CloudVolumeStatuses:
 
     IN_USE = "in-use"
     ERROR = "error"
+
+
+class PvCleanerSettings:
+    """
+    Stores PVs, PVCs and cloud volumes clean up settings
+    """
+
+    MAX_WORKERS = 10
+    DISAPPEARANCE_TIMEOUT = 5 * 60
+    DISAPPEARANCE_INTERVAL = 5
+    MAX_REPORTED_NAMES = 10
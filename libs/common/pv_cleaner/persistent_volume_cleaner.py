@@ -1,20 +1,33 @@
 """A module that stores PVs and PVCs cleaning up functionality"""
-from functools import cached_property
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, partial
 from http import HTTPStatus
+from typing import Callable, Iterable
 
 from core_libs.common.constants import CcdConfigKeys, CommonConfigKeys
 from core_libs.common.custom_exceptions import (
     PvcNotFoundException,
     PersistentVolumeNotFoundException,
 )
+from core_libs.common.misc_utils import wait_for
 from core_libs.eo.ccd.k8s_api_client import K8sApiClient
-from core_libs.vim.openstack import OpenStack
-from kubernetes.client import ApiException, V1PersistentVolume
+from kubernetes.client import (
+    ApiException,
+    V1PersistentVolume,
+    V1PersistentVolumeClaim,
+)
 
 from libs.common.config_reader import ConfigReader
 from libs.common.eo_rv_node.constants import EoNodePaths
 from libs.common.eo_rv_node.eo_rv_node import EoRvNode
-from libs.common.pv_cleaner.constants import CloudVolumeKeys, CloudVolumeStatuses
+from libs.common.k8s_client_registry import K8S_CLIENTS
+from libs.common.pv_cleaner.constants import (
+    CloudVolumeKeys,
+    CloudVolumeStatuses,
+    PvCleanerSettings,
+)
+from libs.common.shared_openstack import OPENSTACK_CLIENTS, SharedOpenStack
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 
 
@@ -44,9 +57,9 @@ class PersistentVolumeCleaner:
         return self._k8s_client
 
     @cached_property
-    def openstack(self) -> OpenStack:
-        """OpenStack client"""
-        return OpenStack(self.config, cluster_vim=True)
+    def openstack(self) -> SharedOpenStack:
+        """OpenStack client shared between all cluster VIM consumers"""
+        return OPENSTACK_CLIENTS.get(self.config, cluster_vim=True)
 
     @cached_property
     def eo_node(self) -> EoRvNode:
@@ -64,9 +77,9 @@ class PersistentVolumeCleaner:
         )
         config_ns = self.config.read_section(CcdConfigKeys.CODEPLOY_NAMESPACE)
 
-        self._k8s_client = K8sApiClient(
-            namespace=config_ns,
-            kubeconfig_path=self.config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH),
+        kubeconfig_path = self.config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH)
+        self._k8s_client = K8S_CLIENTS.get_client(
+            namespace=config_ns, kubeconfig_path=kubeconfig_path
         )
         list_ns = self._k8s_client.get_list_namespaces()
 
@@ -81,7 +94,9 @@ class PersistentVolumeCleaner:
                 )
         else:
             self._namespace = config_ns
-        self._k8s_client.namespace = self.namespace
+        self._k8s_client = K8S_CLIENTS.get_client(
+            namespace=self.namespace, kubeconfig_path=kubeconfig_path
+        )
         self._logger.info(f"Namespace was defined: {self.namespace!r}")
 
     def is_namespace_lm(self, namespace: str | None = None) -> bool:
@@ -109,56 +124,184 @@ class PersistentVolumeCleaner:
                 f"It has already been removed. Skipping it..."
             )
 
+    def _patch_and_remove_pv_with_retry(self, body: V1PersistentVolume) -> None:
+        """
+        Patch and remove Persistent Volume instance, retry once on conflict with the refreshed object
+        Args:
+            body: V1PersistentVolume instance to patch and remove
+        Raises:
+            ApiException: when request fails with status code other than 404 and 409
+        """
+        try:
+            self.patch_and_remove_pv(body=body)
+        except ApiException as err:
+            if err.status != HTTPStatus.CONFLICT:
+                raise ApiException from err
+            self._logger.info(
+                f"Retry patching and removing PV {body.metadata.name} after refreshing the PV object"
+            )
+            try:
+                pv = self.k8s_client.read_persistent_volume(body.metadata.name)
+            except PersistentVolumeNotFoundException:
+                return
+            self.patch_and_remove_pv(body=pv)
+            self._logger.info("Conflicting PV has been successfully removed")
+
+    def _patch_and_remove_pvc(self, body: V1PersistentVolumeClaim) -> None:
+        """
+        Patch and remove Persistent Volume Claim instance
+        Args:
+            body: V1PersistentVolumeClaim instance to patch and remove
+        """
+        body.metadata.finalizers = None
+        try:
+            self.k8s_client.patch_persistent_volume_claim(body=body)
+            self.k8s_client.delete_persistent_volume_claim(name=body.metadata.name)
+        except PvcNotFoundException:
+            self._logger.info(
+                f"Persistent volume claim {body.metadata.name} wasn't found. "
+                f"It has already been removed. Skipping it..."
+            )
+
+    def _get_namespace_persistent_volumes(self) -> list[V1PersistentVolume]:
+        """
+        Receive persistent volumes bound to the namespace claims.
+        Note: PV API doesn't support field selectors by claim namespace, so filtering is done on client side
+        Returns:
+            list of V1PersistentVolume instances
+        """
+        return [
+            pv
+            for pv in self.k8s_client.get_persistent_volume_list()
+            if pv.spec.claim_ref and pv.spec.claim_ref.namespace == self.namespace
+        ]
+
+    def _run_concurrently(self, func: Callable, items: Iterable) -> None:
+        """
+        Run provided function for every item in thread pool with bounded number of workers
+        Args:
+            func: callable that takes single item
+            items: items to process
+        Raises:
+            Exception: first exception raised by any of the workers
+        """
+        items = list(items)
+        if not items:
+            return
+        workers = min(PvCleanerSettings.MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=func.__name__
+        ) as executor:
+            futures = [executor.submit(func, item) for item in items]
+        for future in as_completed(futures):
+            future.result()
+
+    def _wait_for_objects_disappearance(
+        self, list_func: Callable[[], list], names: set[str], kind: str
+    ) -> None:
+        """
+        Wait until all objects with provided names are gone, using single list request per attempt
+        Args:
+            list_func: callable that returns list of k8s objects
+            names: names of the objects to wait for
+            kind: objects kind, used for logging only
+        Raises:
+            TimeoutError: when some objects still exist after timeout
+        """
+        remaining = set(names)
+
+        def all_objects_disappeared() -> bool:
+            nonlocal remaining
+            existing = {item.metadata.name for item in list_func()}
+            remaining = remaining & existing
+            if remaining:
+                self._logger.debug(
+                    f"{len(remaining)} {kind}s still exist, e.g.: "
+                    f"{sorted(remaining)[:PvCleanerSettings.MAX_REPORTED_NAMES]}"
+                )
+            return not remaining
+
+        self._logger.info(f"Waiting for {len(names)} {kind}s removal...")
+        if not wait_for(
+            all_objects_disappeared,
+            interval=PvCleanerSettings.DISAPPEARANCE_INTERVAL,
+            timeout=PvCleanerSettings.DISAPPEARANCE_TIMEOUT,
+            raise_exc=False,
+        ):
+            sample = sorted(remaining)[: PvCleanerSettings.MAX_REPORTED_NAMES]
+            raise TimeoutError(
+                f"{len(remaining)} {kind}s were not removed in "
+                f"{PvCleanerSettings.DISAPPEARANCE_TIMEOUT}s, e.g.: {sample}"
+            )
+        self._logger.info(f"All {kind}s have been removed")
+
     def remove_persistent_volumes(self) -> None:
         """
-        Removes existing persistent volumes on the cluster
+        Removes existing persistent volumes bound to the namespace on the cluster.
+        Finalizers patching and removal are performed concurrently, then it waits for all PVs disappearance.
         Raises:
             ApiException: when request fails with status code other than 404 and 409
         """
-        for pv in self.k8s_client.get_persistent_volume_list():
-            if pv.spec.claim_ref.namespace == self.namespace:
-                try:
-                    self.patch_and_remove_pv(body=pv)
-                except ApiException as err:
-                    if err.status == HTTPStatus.CONFLICT:
-                        self._logger.info(
-                            "Retry patching and removing after refreshing the PV object"
-                        )
-                        pv = self.k8s_client.read_persistent_volume(pv.metadata.name)
-                        self.patch_and_remove_pv(body=pv)
-                        self._logger.info(
-                            "Conflicting PV has been successfully removed"
-                        )
-                    else:
-                        raise ApiException from err
+        pvs = self._get_namespace_persistent_volumes()
+        if not pvs:
+            self._logger.info(f"No PVs bound to {self.namespace!r} namespace found")
+            return
+        self._logger.info(f"Removing {len(pvs)} PVs bound to {self.namespace!r}")
+        self._run_concurrently(self._patch_and_remove_pv_with_retry, pvs)
+        self._wait_for_objects_disappearance(
+            list_func=self._get_namespace_persistent_volumes,
+            names={pv.metadata.name for pv in pvs},
+            kind="PV",
+        )
 
     def remove_persistent_volume_claims(self) -> None:
         """
-        Removes existing persistent volume claims attached to the EO namespace
+        Removes existing persistent volume claims attached to the EO namespace.
+        Finalizers patching and removal are performed concurrently, then it waits for all PVCs disappearance.
         """
-        for pvc in self.k8s_client.get_persistent_volume_claim_list(self.namespace):
-            pvc.metadata.finalizers = None
-            try:
-                self.k8s_client.patch_persistent_volume_claim(body=pvc)
-                self.k8s_client.delete_persistent_volume_claim(name=pvc.metadata.name)
-            except PvcNotFoundException:
-                self._logger.info(
-                    f"Persistent volume claim {pvc.metadata.name} wasn't found. "
-                    f"It has already been removed. Skipping it..."
-                )
+        list_pvc = partial(
+            self.k8s_client.get_persistent_volume_claim_list, self.namespace
+        )
+        pvcs = list_pvc()
+        if not pvcs:
+            self._logger.info(f"No PVCs found in {self.namespace!r} namespace")
+            return
+        self._logger.info(f"Removing {len(pvcs)} PVCs from {self.namespace!r}")
+        self._run_concurrently(self._patch_and_remove_pvc, pvcs)
+        self._wait_for_objects_disappearance(
+            list_func=list_pvc,
+            names={pvc.metadata.name for pvc in pvcs},
+            kind="PVC",
+        )
+
+    def _detach_server_volumes(self, server_volumes: tuple[str, list]) -> None:
+        """
+        Detach provided cloud volumes from the server one by one
+        Args:
+            server_volumes: pair of VIM server id and cloud volumes attached to the server
+        """
+        server_id, volumes = server_volumes
+        server = self.openstack.servers.get_server(server_id)
+        for volume in volumes:
+            self._logger.info(f"Detaching volume {volume.id} from server {server_id}")
+            self.openstack.volumes.detach_volume(server=server, volume=volume)
 
     def detach_cloud_volumes(self) -> None:
         """
-        Removes all remaining attached and failed volumes from the cluster VIM zone
+        Removes all remaining attached and failed volumes from the cluster VIM zone.
+        Volumes are grouped by server, detaching is performed in parallel per server.
         """
-        volumes = self.openstack.volumes.list_volumes_by_namespace(self.namespace)
+        volumes = self.openstack.list_volumes_by_namespace(self.namespace)
         unexpected_statuses = CloudVolumeStatuses.IN_USE, CloudVolumeStatuses.ERROR
+        volumes_by_server = defaultdict(list)
         for volume in volumes:
             if volume.status in unexpected_statuses and volume.attachments:
                 for attachment in volume.attachments:
                     server_id = attachment[CloudVolumeKeys.SERVER_ID]
-                    server = self.openstack.servers.get_server(server_id)
-                    self.openstack.volumes.detach_volume(server=server, volume=volume)
+                    volumes_by_server[server_id].append(volume)
+
+        self._run_concurrently(self._detach_server_volumes, volumes_by_server.items())
+        self.openstack.invalidate("volumes")
 
     def remove_namespace_pv_pvc_and_vim_volumes(self) -> None:
         """
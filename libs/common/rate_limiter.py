@@ -0,0 +1,66 @@
+"""Module with RateLimiter class that spaces out calls to not exceed given rate"""
+import asyncio
+from threading import Lock
+from time import monotonic, sleep
+
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out calls evenly to not exceed given number of calls per second.
+    Every acquire() call reserves the next free time slot and sleeps until it comes,
+    acquire_async() awaits the slot without blocking the event loop.
+    """
+
+    def __init__(self, rate: float | None):
+        """
+        Args:
+            rate: max number of calls per second, no limit if None or 0
+        """
+        self.rate = rate
+        self._lock = Lock()
+        self._next_slot = monotonic()
+
+    def acquire(self) -> float:
+        """Wait for the next free time slot
+        Returns:
+            monotonic time of the slot, i.e. time when the call is allowed to start
+        """
+        slot = self._reserve_slot()
+        delay = slot - monotonic()
+        if delay > 0:
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                sleep(delay)
+        return slot
+
+    async def acquire_async(self) -> float:
+        """Wait for the next free time slot in the event loop
+        Returns:
+            monotonic time of the slot, i.e. time when the call is allowed to start
+        """
+        slot = self._reserve_slot()
+        delay = slot - monotonic()
+        if delay > 0:
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                await asyncio.sleep(delay)
+        return slot
+
+    def _reserve_slot(self) -> float:
+        """Reserve the next free time slot
+        Returns:
+            monotonic time of the slot, current time if rate is not limited
+        """
+        if not self.rate:
+            return monotonic()
+        with self._lock:
+            slot = max(self._next_slot, monotonic())
+            self._next_slot = slot + 1 / self.rate
+        return slot
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
@@ -0,0 +1,138 @@
+"""Module with SamplingProfiler class that samples stacks of all threads and renders flamegraphs"""
+import sys
+import threading
+import zlib
+from collections import Counter
+from html import escape
+from pathlib import Path
+
+PROFILE_INTERVAL = 0.01
+FLAMEGRAPH_WIDTH = 1200
+FRAME_HEIGHT = 16
+MIN_TEXT_WIDTH = 30
+CHAR_WIDTH = 7
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler that takes stacks of all threads in background thread with given
+    interval, so waiting threads are shown as well as working ones. Stacks are collapsed into
+    "thread:<name>;frame;frame" lines with sample counts, so every thread (main test thread,
+    switchover ThreadRunner etc.) is a separate root of the flamegraph.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        """
+        Args:
+            interval: sampling interval in seconds
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling in background thread"""
+        self.stacks = Counter()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="SAMPLING_PROFILER", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling
+        Returns:
+            collapsed stacks with sample counts
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.stacks
+
+    def _run(self) -> None:
+        """Take samples until stopped"""
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        """Take stacks of all threads except the profiler one"""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for (
+            ident,
+            frame,
+        ) in sys._current_frames().items():  # pylint: disable=protected-access
+            if ident == threading.get_ident():
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                # co_qualname is available since Python 3.11
+                name = getattr(code, "co_qualname", code.co_name)
+                stack.append(
+                    f"{name} ({Path(code.co_filename).name})".replace(";", ":")
+                )
+                frame = frame.f_back
+            thread_name = thread_names.get(ident, str(ident)).replace(";", ":")
+            self.stacks[";".join([f"thread:{thread_name}", *reversed(stack)])] += 1
+
+
+def write_collapsed_stacks(stacks: Counter[str], path: Path) -> None:
+    """Write stacks in collapsed format supported by flamegraph.pl, speedscope etc.
+    Args:
+        stacks: collapsed stacks with sample counts
+        path: file path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+    )
+
+
+def render_flamegraph(stacks: Counter[str], title: str) -> str:
+    """Render collapsed stacks as standalone SVG flamegraph, frame title shows its sample count
+    Args:
+        stacks: collapsed stacks with sample counts
+        title: flamegraph title
+    Returns:
+        SVG document
+    """
+    root = {"children": {}, "value": 0}
+    for stack, count in stacks.items():
+        node = root
+        node["value"] += count
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"children": {}, "value": 0})
+            node["value"] += count
+
+    def get_depth(node: dict) -> int:
+        return 1 + max(map(get_depth, node["children"].values()), default=0)
+
+    height = (get_depth(root) + 1) * FRAME_HEIGHT
+    total = root["value"] or 1
+    rects = []
+
+    def add_rects(node: dict, x: float, depth: int) -> None:
+        for name, child in sorted(node["children"].items()):
+            width = child["value"] / total * FLAMEGRAPH_WIDTH
+            y = height - (depth + 1) * FRAME_HEIGHT
+            hue = 20 + zlib.crc32(name.encode()) % 40
+            label = name[: int(width / CHAR_WIDTH)] if width > MIN_TEXT_WIDTH else ""
+            rects.append(
+                f'<g><title>{escape(name)} ({child["value"]} samples, '
+                f'{child["value"] / total:.1%})</title>'
+                f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{FRAME_HEIGHT - 1}" '
+                f'fill="hsl({hue},90%,60%)"/>'
+                f'<text x="{x + 2:.2f}" y="{y + FRAME_HEIGHT - 4}">{escape(label)}</text></g>'
+            )
+            add_rects(child, x, depth + 1)
+            x += width
+
+    add_rects(root, 0, 0)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{FLAMEGRAPH_WIDTH}" '
+        f'height="{height + FRAME_HEIGHT}" font-family="monospace" font-size="11">'
+        f'<text x="0" y="12">{escape(title)} ({root["value"]} samples)</text>'
+        f'<g transform="translate(0,{FRAME_HEIGHT})">{"".join(rects)}</g></svg>'
+    )
@@ -0,0 +1,70 @@
+"""Module that stores pool of authenticated REST sessions shared per (host, user)"""
+from collections import Counter
+from threading import Lock
+from time import monotonic
+from typing import Callable, TypeVar
+
+from libs.utils.logging.logger import logger
+
+# authenticated sessions are re-created (re-login) after this time to not use expiring tokens
+SESSION_REFRESH_INTERVAL = 10 * 60
+
+T = TypeVar("T")
+
+
+class SessionPool:
+    """
+    Pool of authenticated REST sessions (EvnfmApi, UserSession etc.) shared per (host, user).
+    Sharing one session object keeps its token and HTTP keep-alive connections reused
+    by all apps that work with the same host under the same user.
+    Every session creation is counted as a login.
+    """
+
+    def __init__(self, refresh_interval: int = SESSION_REFRESH_INTERVAL):
+        self._refresh_interval = refresh_interval
+        self._lock = Lock()
+        self._key_locks: dict[tuple, Lock] = {}
+        self._sessions: dict[tuple, tuple[float, object]] = {}
+        self._logins = Counter()
+
+    def get(self, key: tuple, factory: Callable[[], T]) -> T:
+        """Get shared session by key, create (login) it if it does not exist or close to token expiry
+        Args:
+            key: session key, e.g. (session type, host, user)
+            factory: callable that creates new authenticated session
+        Returns:
+            shared session object
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            created, session = self._sessions.get(key, (None, None))
+            if session is None or monotonic() - created > self._refresh_interval:
+                logger.debug(
+                    f"{'Refreshing' if session else 'Creating'} session for {key}"
+                )
+                session = factory()
+                self._sessions[key] = monotonic(), session
+                self._logins[key] += 1
+            return session
+
+    def invalidate(self, key: tuple) -> None:
+        """Drop session from the pool, next get() will login again
+        Args:
+            key: session key
+        """
+        self._sessions.pop(key, None)
+
+    @property
+    def login_counters(self) -> dict[str, int]:
+        """Number of logins per session key"""
+        return {" ".join(map(str, key)): count for key, count in self._logins.items()}
+
+    def log_login_counters(self) -> None:
+        """Log number of logins performed for every session key"""
+        for key, count in self.login_counters.items():
+            logger.info(f"REST session {key!r}: {count} login(s)")
+
+
+SESSION_POOL = SessionPool()
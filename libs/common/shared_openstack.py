@@ -0,0 +1,125 @@
+"""Module that stores OpenStack clients shared per VIM (auth_url, project) with listing cache"""
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable
+
+from core_libs.common.constants import VimConfigKeys
+from core_libs.vim.openstack import OpenStack
+
+from libs.common.config_reader import ConfigReader
+from libs.common.constants import ClusterVimConfigKeys
+from libs.utils.logging.logger import logger
+
+# time in seconds during which listing results are reused
+LISTING_CACHE_TTL = 30
+
+
+class SharedOpenStack:
+    """
+    Wrapper over OpenStack client that is shared between all VIM consumers of the same (auth_url, project).
+    Authenticated session (and its token) is reused until expiry by underlying client,
+    listings are cached for LISTING_CACHE_TTL seconds.
+    All other attributes are delegated to the wrapped OpenStack instance.
+    """
+
+    def __init__(self, openstack: OpenStack, ttl: int = LISTING_CACHE_TTL):
+        self.openstack = openstack
+        self._ttl = ttl
+        self._lock = RLock()
+        self._listings: dict[tuple, tuple[float, list]] = {}
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.openstack, item)
+
+    def list_servers(self, name_filter: dict | None = None) -> list:
+        """List VIM servers, result is cached per filter
+        Note: 'name' filter is applied on server side as a regular expression,
+            so it works like an 'in' operator and results may still need client side filtering.
+        Args:
+            name_filter: server side filters, e.g. {ServerKeys.NAME: "prefix"}
+        Returns:
+            list of servers
+        """
+        filter_key = tuple(sorted((name_filter or {}).items()))
+        return self._get_listing(
+            ("servers", filter_key),
+            lambda: self.openstack.servers.list_servers(name_filter),
+        )
+
+    def list_volumes_by_namespace(self, namespace: str) -> list:
+        """List VIM volumes that belong to the namespace, result is cached per namespace
+        Args:
+            namespace: k8s namespace name
+        Returns:
+            list of volumes
+        """
+        return self._get_listing(
+            ("volumes", namespace),
+            lambda: self.openstack.volumes.list_volumes_by_namespace(namespace),
+        )
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """Drop cached listings
+        Args:
+            kind: listing kind to drop ("servers" or "volumes"), all listings are dropped if not provided
+        """
+        with self._lock:
+            for key in list(self._listings):
+                if kind is None or key[0] == kind:
+                    del self._listings[key]
+
+    def _get_listing(self, key: tuple, list_func: Callable[[], list]) -> list:
+        """Get cached listing if it is not expired, otherwise request it from VIM
+        Args:
+            key: cache key
+            list_func: callable that requests listing from VIM
+        Returns:
+            list of VIM objects
+        """
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached and monotonic() - cached[0] < self._ttl:
+                logger.debug(f"Using cached VIM listing for {key}")
+                return list(cached[1])
+            result = list(list_func())
+            self._listings[key] = monotonic(), result
+            return list(result)
+
+
+class SharedOpenStackRegistry:
+    """Registry of SharedOpenStack clients keyed by (auth_url, project)"""
+
+    def __init__(self):
+        self._lock = RLock()
+        self._clients: dict[tuple, SharedOpenStack] = {}
+
+    def get(self, config: ConfigReader, cluster_vim: bool = False) -> SharedOpenStack:
+        """Get shared OpenStack client for VIM defined in config
+        Args:
+            config: ConfigReader instance
+            cluster_vim: if True cluster VIM from env config is used, otherwise VIM from vim config
+        Returns:
+            SharedOpenStack instance
+        """
+        if cluster_vim:
+            key = (
+                config.read_section(ClusterVimConfigKeys.OPENSTACK_CLUSTER_AUTH_URL),
+                config.read_section(
+                    ClusterVimConfigKeys.OPENSTACK_CLUSTER_PROJECT_NAME
+                ),
+            )
+        else:
+            key = (
+                config.read_section(VimConfigKeys.OS_AUTH_URL),
+                config.read_section(VimConfigKeys.PROJECT_NAME),
+            )
+        with self._lock:
+            if key not in self._clients:
+                logger.debug(f"Creating shared OpenStack client for {key}")
+                self._clients[key] = SharedOpenStack(
+                    OpenStack(config=config, cluster_vim=cluster_vim)
+                )
+            return self._clients[key]
+
+
+OPENSTACK_CLIENTS = SharedOpenStackRegistry()
@@ -0,0 +1,162 @@
+"""Module with StepHistory class that stores step durations run over run and finds slow steps"""
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from libs.common.latency_stats import percentile
+from libs.common.step_timer import StepRecord, StepStatuses
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+HISTORY_WINDOW = 20
+MIN_HISTORY_SAMPLES = 5
+# step is slow only if it exceeds the percentile by both tolerances, to ignore jitter of short steps
+RELATIVE_TOLERANCE = 0.2
+ABSOLUTE_TOLERANCE = 5.0
+
+
+@dataclass
+class StepRegression:
+    """Step which duration exceeds percentile of its recent history with tolerance"""
+
+    name: str
+    duration: float
+    threshold: float
+    samples: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.duration:.2f}s > {self.threshold:.2f}s "
+            f"(of {self.samples} recent runs)"
+        )
+
+
+class StepHistory:
+    """
+    SQLite store of step durations of passed steps per test, used to compare step duration
+    of the current run with the recent runs of the same test on the runner
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Args:
+            db_path: path of SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._logger = set_eo_gr_logger_for_class(self)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS step_durations ("
+                    "run_id TEXT, test_id TEXT, step TEXT, started_at TEXT, "
+                    "duration REAL, status TEXT)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS step_durations_test_step "
+                    "ON step_durations (test_id, step)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database, sessions running in parallel wait for each other's writes
+        Returns:
+            database connection
+        """
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def append(self, run_id: str, test_id: str, records: list[StepRecord]) -> None:
+        """Store steps of the test
+        Args:
+            run_id: test session id
+            test_id: pytest node id
+            records: steps of the test
+        """
+        started_at = datetime.now().isoformat(timespec="seconds")
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO step_durations VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run_id,
+                            test_id,
+                            record.name,
+                            started_at,
+                            record.duration,
+                            record.status,
+                        )
+                        for record in records
+                    ],
+                )
+
+    def get_recent_durations(
+        self, test_id: str, step: str, exclude_run_id: str, limit: int = HISTORY_WINDOW
+    ) -> list[float]:
+        """Get durations of the passed step in the recent runs of the test
+        Args:
+            test_id: pytest node id
+            step: step name
+            exclude_run_id: run which durations are not taken into account, i.e. current run
+            limit: number of recent durations
+        Returns:
+            list of durations
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT duration FROM step_durations "
+                "WHERE test_id = ? AND step = ? AND status = ? AND run_id != ? "
+                "ORDER BY rowid DESC LIMIT ?",
+                (test_id, step, StepStatuses.PASSED, exclude_run_id, limit),
+            ).fetchall()
+        return [duration for (duration,) in rows]
+
+    def find_regressions(
+        self,
+        run_id: str,
+        test_id: str,
+        records: list[StepRecord],
+        *,
+        percent: float,
+        window: int = HISTORY_WINDOW,
+        min_samples: int = MIN_HISTORY_SAMPLES,
+        relative_tolerance: float = RELATIVE_TOLERANCE,
+        absolute_tolerance: float = ABSOLUTE_TOLERANCE,
+    ) -> list[StepRegression]:
+        """Find passed steps which duration exceeds percentile of the recent runs
+        by both relative and absolute tolerance
+        Args:
+            run_id: current test session id
+            test_id: pytest node id
+            records: steps of the test in the current run
+            percent: percentile of recent durations
+            window: number of recent runs to compare with
+            min_samples: steps with less recent runs are not checked
+            relative_tolerance: allowed excess as a fraction of the percentile
+            absolute_tolerance: allowed excess in seconds
+        Returns:
+            list of slow steps
+        """
+        regressions = []
+        for record in records:
+            if record.status != StepStatuses.PASSED:
+                continue
+            durations = self.get_recent_durations(
+                test_id, record.name, exclude_run_id=run_id, limit=window
+            )
+            if len(durations) < max(min_samples, 1):
+                continue
+            baseline = percentile(durations, percent)
+            threshold = max(
+                baseline * (1 + relative_tolerance), baseline + absolute_tolerance
+            )
+            if record.duration > threshold:
+                regressions.append(
+                    StepRegression(
+                        name=record.name,
+                        duration=record.duration,
+                        threshold=threshold,
+                        samples=len(durations),
+                    )
+                )
+        return regressions
@@ -0,0 +1,118 @@
+"""Module with StepTimer class that measures duration of GR and EVNFM app steps within a test"""
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from time import monotonic
+from typing import Callable, Iterator
+
+from libs.utils.logging.logger import logger
+
+
+class StepStatuses:
+    """Statuses of timed step"""
+
+    PASSED = "passed"
+    FAILED = "failed"
+
+
+@dataclass
+class StepRecord:
+    """Timed step, start is relative to test start"""
+
+    name: str
+    start: float
+    duration: float
+    status: str
+    depth: int
+    thread: str
+
+
+class StepTimer:
+    """
+    Collects duration of steps of the current test. Steps are timed with step() context manager or
+    timed_step() decorator, nested steps are recorded with their depth, steps of background
+    threads (e.g. switchover thread) are recorded to the same test.
+    """
+
+    def __init__(self):
+        self.test_id: str | None = None
+        self.records: list[StepRecord] = []
+        self._test_started = monotonic()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start_test(self, test_id: str) -> None:
+        """Drop steps of the previous test and start timing steps of the new one
+        Args:
+            test_id: pytest node id
+        """
+        with self._lock:
+            self.test_id = test_id
+            self.records = []
+            self._test_started = monotonic()
+
+    def finish_test(self) -> list[StepRecord]:
+        """Stop timing steps of the current test
+        Returns:
+            steps of the test ordered by start time
+        """
+        with self._lock:
+            records = sorted(self.records, key=lambda record: record.start)
+            self.test_id = None
+            self.records = []
+        return records
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Context manager that times the block as a step of the current test
+        Args:
+            name: step name
+        """
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        started = monotonic()
+        status = StepStatuses.FAILED
+        try:
+            yield
+            status = StepStatuses.PASSED
+        finally:
+            duration = monotonic() - started
+            self._local.depth = depth
+            logger.debug(f"Step {name!r} {status} in {duration:.3f} seconds")
+            with self._lock:
+                if self.test_id is not None:
+                    self.records.append(
+                        StepRecord(
+                            name=name,
+                            start=started - self._test_started,
+                            duration=duration,
+                            status=status,
+                            depth=depth,
+                            thread=threading.current_thread().name,
+                        )
+                    )
+
+
+STEP_TIMER = StepTimer()
+
+
+def timed_step(name: str | None = None) -> Callable:
+    """Decorator that times function calls as steps of the current test
+    Args:
+        name: step name, qualified function name is used if not provided
+    Returns:
+        decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        step_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with STEP_TIMER.step(step_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,146 @@
+"""Module with streaming multipart/form-data encoder for uploads of big files with bounded memory"""
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import BinaryIO, Iterator
+from uuid import uuid4
+
+from libs.utils.logging.logger import set_eo_gr_logger_for_class
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_LOG_STEP = 10
+MB = 1024**2
+
+
+@dataclass
+class UploadMetrics:
+    """Timing of file upload, times are monotonic clock seconds"""
+
+    size: int
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def transfer_time(self) -> float | None:
+        """Time between the first and the last byte read by HTTP client"""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+    @property
+    def throughput(self) -> float | None:
+        """Upload throughput in MB per second"""
+        if not self.transfer_time:
+            return None
+        return self.size / MB / self.transfer_time
+
+    def to_report(self) -> dict:
+        """Metrics report
+        Returns:
+            metrics report dictionary
+        """
+        return {
+            "size_mb": round(self.size / MB, 3),
+            "transfer_time": round(self.transfer_time, 3)
+            if self.transfer_time is not None
+            else None,
+            "throughput_mb_s": round(self.throughput, 3) if self.throughput else None,
+        }
+
+
+class StreamingMultipartEncoder:
+    """
+    File-like multipart/form-data body with one file field. The file is read from disk by chunks
+    as HTTP client reads the body, so memory usage doesn't depend on file size. Body length is
+    known in advance, so request is sent with Content-Length instead of chunked encoding.
+    Upload progress is logged and transfer time is measured from the first to the last read byte.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        field_name: str = "file",
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        """
+        Args:
+            file_path: path of the file to upload
+            field_name: name of multipart form field
+            chunk_size: size of chunks returned by iteration
+        """
+        self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
+        boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._preamble = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{self.file_path.name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        self._epilogue = f"\r\n--{boundary}--\r\n".encode()
+        self._file_end = len(self._preamble) + self.file_path.stat().st_size
+        self.len = self._file_end + len(self._epilogue)
+        self.metrics = UploadMetrics(size=self.len)
+        self._position = 0
+        self._file: BinaryIO | None = None
+        self._logged_percent = 0
+        self._logger = set_eo_gr_logger_for_class(self)
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """Read next part of the body
+        Args:
+            size: max number of bytes to read, chunk size if negative
+        Returns:
+            next part of the body, empty bytes when the body is read
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+        if self.metrics.started is None:
+            self.metrics.started = monotonic()
+            # closed in close() when the body is read, the body is read by the HTTP client
+            self._file = open(  # pylint: disable=consider-using-with
+                self.file_path, "rb"
+            )
+
+        data = b""
+        if self._position < len(self._preamble):
+            data = self._preamble[self._position : self._position + size]
+        elif self._position < self._file_end:
+            data = self._file.read(min(size, self._file_end - self._position))
+        elif self._position < self.len:
+            offset = self._position - self._file_end
+            data = self._epilogue[offset : offset + size]
+        self._position += len(data)
+        self._log_progress()
+
+        if self._position >= self.len and self.metrics.finished is None:
+            self.metrics.finished = monotonic()
+            self.close()
+        return data
+
+    def close(self) -> None:
+        """Close the uploaded file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _log_progress(self) -> None:
+        """Log upload progress every PROGRESS_LOG_STEP percent"""
+        percent = self._position * 100 // self.len
+        if percent < self._logged_percent + PROGRESS_LOG_STEP:
+            return
+        self._logged_percent = percent - percent % PROGRESS_LOG_STEP
+        elapsed = monotonic() - self.metrics.started
+        self._logger.info(
+            f"Uploading {self.file_path.name}: {self._logged_percent}% "
+            f"({self._position / MB:.1f} of {self.len / MB:.1f} MB, "
+            f"{self._position / MB / elapsed if elapsed else 0:.1f} MB/s)"
+        )
@@ -10,6 +10,7 @@ from libs.common.custom_exceptions import (
     ConditionIsNotMetWhileThreadAliveError,
     ThreadTimeoutExpiredError,
 )
+from libs.common.time_accounting import TIME_ACCOUNTANT, TimeBuckets
 
 
 class ThreadRunner(Thread):
@@ -77,7 +78,8 @@ class ThreadRunner(Thread):
             if condition():
                 logger.info(f"Condition {condition_name} is met")
                 return True
-            sleep(interval)
+            with TIME_ACCOUNTANT.account(TimeBuckets.SLEEP):
+                sleep(interval)
         exc_msg = f"Condition {condition_name} is not met. Thread {self.name} has been finished."
         if raise_exc:
             raise ConditionIsNotMetWhileThreadAliveError(exc_msg)
@@ -0,0 +1,232 @@
+"""Module with TimeAccountant class that attributes test wall time to sleeping, remote calls, logging and local work"""
+import asyncio
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from time import monotonic, process_time
+from typing import Callable, Iterator
+
+import requests
+
+
+class TimeBuckets:
+    """Buckets of accounted time"""
+
+    SLEEP = "sleep"
+    REMOTE = "remote"
+    LOGGING = "logging"
+    LOCAL = "local"
+
+    MEASURED = SLEEP, REMOTE, LOGGING
+    ALL = SLEEP, REMOTE, LOGGING, LOCAL
+
+
+@dataclass
+class _Frame:
+    """Accounting frame of the current context, resumed is None while nested frame is running"""
+
+    bucket: str
+    resumed: float | None
+    owner: object
+    is_foreground: bool
+
+
+_current_frame: ContextVar[_Frame | None] = ContextVar(
+    "time_accounting_frame", default=None
+)
+
+
+def _get_owner() -> object:
+    """Get owner of accounting frames: the running asyncio task or the thread
+    Returns:
+        asyncio task or thread
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task or threading.current_thread()
+
+
+class TimeAccountant:
+    """
+    Attributes wall time of the current test to buckets: sleeping and polling, remote calls
+    (SSH, K8s, HTTP, shell commands incl. DM docker), logging I/O and local work (the rest).
+    Time is accounted by context-local timers put into common utilities and clients, timers are
+    exclusive: when a remote call is made while waiting in wait_for, waiting is paused.
+    Asyncio tasks of the test thread may run timers concurrently, so the test timeline is split
+    into intervals between timer events and every interval is attributed once, to the running
+    bucket of the highest priority (remote, logging, sleep), i.e. the buckets of the test thread
+    sum up to the test wall time. Time of other threads (switchover thread, trackers, probers)
+    is accounted separately as background time, process CPU time of all threads is reported
+    for comparison. Accounting is disabled until enable() is called.
+    """
+
+    PRIORITY = TimeBuckets.REMOTE, TimeBuckets.LOGGING, TimeBuckets.SLEEP
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._foreground = Counter()
+        self._background = Counter()
+        self._running = Counter()
+        self._last_event = monotonic()
+        self._wall_started = monotonic()
+        self._cpu_started = process_time()
+        self.session_summary = Counter()
+
+    def enable(self) -> None:
+        """Enable time accounting"""
+        self.enabled = True
+
+    def start(self) -> None:
+        """Start accounting of a new test"""
+        with self._lock:
+            self._foreground = Counter()
+            self._background = Counter()
+            self._wall_started = self._last_event = monotonic()
+            self._cpu_started = process_time()
+
+    def finish(self) -> dict:
+        """Finish accounting of the current test and add it to the session summary
+        Returns:
+            test summary: wall time, time per bucket of the test thread, background time per bucket
+            and process CPU time, in seconds
+        """
+        with self._lock:
+            now = monotonic()
+            self._flush(now)
+            wall = now - self._wall_started
+            summary = {"wall": wall}
+            for bucket in TimeBuckets.MEASURED:
+                summary[bucket] = self._foreground[bucket]
+            summary[TimeBuckets.LOCAL] = max(
+                wall - sum(self._foreground[b] for b in TimeBuckets.MEASURED), 0
+            )
+            summary["cpu"] = process_time() - self._cpu_started
+            for bucket in TimeBuckets.MEASURED:
+                summary[f"background_{bucket}"] = self._background[bucket]
+            self.session_summary.update(summary)
+        return summary
+
+    @contextmanager
+    def account(self, bucket: str) -> Iterator[None]:
+        """Context manager that accounts time of the block to the bucket,
+        time of the enclosing block of the same task or thread is paused while the block is running
+        Args:
+            bucket: TimeBuckets value
+        """
+        if not self.enabled:
+            yield
+            return
+        now = monotonic()
+        owner = _get_owner()
+        parent = _current_frame.get()
+        if parent is not None and parent.owner is not owner:
+            # frame of the task which created the current task, it keeps running concurrently
+            parent = None
+        if parent is not None and parent.resumed is not None:
+            self._pause(parent, now)
+        frame = _Frame(
+            bucket=bucket,
+            resumed=None,
+            owner=owner,
+            is_foreground=threading.current_thread() is threading.main_thread(),
+        )
+        self._resume(frame, now)
+        token = _current_frame.set(frame)
+        try:
+            yield
+        finally:
+            now = monotonic()
+            if frame.resumed is not None:
+                self._pause(frame, now)
+            _current_frame.reset(token)
+            if parent is not None:
+                self._resume(parent, now)
+
+    def _resume(self, frame: _Frame, now: float) -> None:
+        """Start accounting time of the frame
+        Args:
+            frame: accounting frame
+            now: current monotonic time
+        """
+        if frame.is_foreground:
+            with self._lock:
+                self._flush(now)
+                self._running[frame.bucket] += 1
+        frame.resumed = now
+
+    def _pause(self, frame: _Frame, now: float) -> None:
+        """Stop accounting time of the frame
+        Args:
+            frame: accounting frame
+            now: current monotonic time
+        """
+        with self._lock:
+            if frame.is_foreground:
+                self._flush(now)
+                self._running[frame.bucket] -= 1
+            else:
+                self._background[frame.bucket] += now - frame.resumed
+        frame.resumed = None
+
+    def _flush(self, now: float) -> None:
+        """Attribute time of the test thread since the last timer event to the running bucket
+        of the highest priority, the lock must be held
+        Args:
+            now: current monotonic time
+        """
+        bucket = next(
+            (bucket for bucket in self.PRIORITY if self._running[bucket] > 0), None
+        )
+        if bucket is not None:
+            self._foreground[bucket] += max(now - self._last_event, 0)
+        self._last_event = now
+
+
+TIME_ACCOUNTANT = TimeAccountant()
+
+
+def accounted(bucket: str) -> Callable:
+    """Decorator that accounts time of function calls to the bucket, coroutine functions are supported
+    Args:
+        bucket: TimeBuckets value
+    Returns:
+        decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with TIME_ACCOUNTANT.account(bucket):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with TIME_ACCOUNTANT.account(bucket):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def install_global_accounting() -> None:
+    """Account time of all HTTP requests sent with requests library as remote calls
+    and time of all logging handlers as logging I/O
+    """
+    if getattr(requests.adapters.HTTPAdapter.send, "__wrapped__", None):
+        return
+    requests.adapters.HTTPAdapter.send = accounted(TimeBuckets.REMOTE)(
+        requests.adapters.HTTPAdapter.send
+    )
+    logging.Handler.handle = accounted(TimeBuckets.LOGGING)(logging.Handler.handle)
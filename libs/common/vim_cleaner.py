@@ -2,13 +2,13 @@
 
 from core_libs.common.constants import EnvVariables
 from core_libs.vim.data.constants import ServerKeys
-from core_libs.vim.openstack import OpenStack
 
 from libs.common.asset_names import AssetNames
 from libs.common.config_reader import ConfigReader
 from libs.common.constants import GR_TEST_PREFIX
 from libs.common.custom_exceptions import EnvironmentVariableNotProvidedError
 from libs.common.env_variables import ENV_VARS
+from libs.common.shared_openstack import OPENSTACK_CLIENTS
 from libs.utils.logging.logger import set_eo_gr_logger_for_class
 
 
@@ -18,7 +18,7 @@ class VimCleaner:
     def __init__(self, config: ConfigReader):
         self._config = config
         self.vim_name = self.__check_and_get_vim_zone_env_var()
-        self._openstack = OpenStack(config=self._config)
+        self._openstack = OPENSTACK_CLIENTS.get(self._config)
         self._asset_names = AssetNames()
         self._logger = set_eo_gr_logger_for_class(self)
 
@@ -102,7 +102,7 @@ class VimCleaner:
                 # Filter servers request by name to increase performance when a lot of servers exist on a VIM,
                 # but because 'name' works like an 'in' operator, the response still needs to be filtered by prefix.
                 # For all other objects, such filter is either unavailable or works as an "equality" operator.
-                lambda: self._openstack.servers.list_servers(name_filter),
+                lambda: self._openstack.list_servers(name_filter),
                 self._delete_server,
             ),
             (self._openstack.networks.list_networks, self._delete_network),
@@ -123,6 +123,7 @@ class VimCleaner:
                         f"Something went wrong. {asset.name!r} looks like already deleted. "
                         f"Please check it on {self.vim_name!r} VIM zone."
                     )
+        self._openstack.invalidate("servers")
         self._logger.info(
             f"Cleanup VIM by {GR_TEST_PREFIX!r} prefix finished successfully."
         )
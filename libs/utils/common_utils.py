@@ -5,14 +5,18 @@ import socket
 import subprocess
 from operator import gt, ge, lt, le, eq, ne
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from subprocess import CompletedProcess
+from time import monotonic
 
 import yaml
 from packaging import version
 from jinja2 import Environment, FileSystemLoader
 
 from libs.common.constants import ROOT_PATH, ConfigFilePaths, UTF_8
+from libs.common.time_accounting import TimeBuckets, accounted
+from libs.utils.logging.json_formatter import log_fields
 from libs.utils.logging.logger import logger, log_exception
 
 
@@ -66,6 +70,7 @@ def get_datetime_from_str(
     return datetime.strptime(string, pattern)
 
 
+@accounted(TimeBuckets.REMOTE)
 def run_shell_cmd(
     cmd: str | list,
     timeout: int | None = 60,
@@ -94,6 +99,7 @@ def run_shell_cmd(
         CompletedProcess instance
     """
     logger.info(f"Executing {cmd=}")
+    started = monotonic()
 
     try:
         proc = subprocess.run(
@@ -134,14 +140,20 @@ def run_shell_cmd(
         returncode=return_code,
     )
 
+    fields = log_fields(
+        command=cmd if isinstance(cmd, str) else " ".join(map(str, cmd)),
+        duration=round(monotonic() - started, 3),
+        exit_code=return_code,
+    )
     if check_return_code and return_code:
-        raise RuntimeError(log_exception(log_message))
+        raise RuntimeError(log_exception(log_message, extra=fields))
 
-    logger.info(log_message)
+    logger.info(log_message, extra=fields)
 
     return proc
 
 
+@accounted(TimeBuckets.REMOTE)
 def run_shell_cmd_as_process(
     cmd: str | list,
     stdout: int = subprocess.PIPE,
@@ -178,6 +190,7 @@ def run_shell_cmd_as_process(
     return output
 
 
+@accounted(TimeBuckets.REMOTE)
 async def run_shell_cmd_as_process_async(
     cmd: str | list,
     stdout: int = subprocess.PIPE,
@@ -351,6 +364,19 @@ def compare_versions(
         ) from err
 
 
+@lru_cache
+def get_template_environment(template_dir: Path) -> Environment:
+    """
+    Get Jinja environment of the templates directory, the environment is created once per directory,
+    so compiled templates are cached by it and recompiled only when template files are changed
+    Args:
+        template_dir: A path to the templates directory
+    Returns:
+        Jinja environment
+    """
+    return Environment(loader=FileSystemLoader(template_dir))
+
+
 def create_file_from_template(
     template_path: Path, file_path: Path, content_dict: dict
 ) -> None:
@@ -365,8 +391,9 @@ def create_file_from_template(
         f"Creating a file {file_path} by rendering a template {template_path} "
         f"with a specified data:\n{content_dict}"
     )
-    environment = Environment(loader=FileSystemLoader(template_path.parent))
-    template = environment.get_template(template_path.name)
+    template = get_template_environment(template_path.parent).get_template(
+        template_path.name
+    )
     content = template.render(content_dict)
 
     with file_path.open(mode="w", encoding=UTF_8) as f:
@@ -0,0 +1,64 @@
+"""
+File with JSON formatter of the structured log, one JSON object per record
+"""
+import logging
+
+import orjson
+
+RECORD_FIELDS_ATTR = "fields"
+
+
+class LogFields:
+    """
+    Typed fields of the structured log records
+    """
+
+    SITE = "site"
+    HOST = "host"
+    CLIENT = "client"
+    METHOD = "method"
+    ENDPOINT = "endpoint"
+    COMMAND = "command"
+    POD = "pod"
+    DURATION = "duration"
+    EXIT_CODE = "exit_code"
+    HTTP_STATUS = "http_status"
+    FAILED = "failed"
+    SENT_BYTES = "sent_bytes"
+    RECEIVED_BYTES = "received_bytes"
+
+
+def log_fields(**fields) -> dict:
+    """
+    Get 'extra' argument of logger methods that adds typed fields to the structured log record,
+    fields with None value are skipped
+    Args:
+        **fields: values of the fields named as LogFields values
+    Returns:
+        extra dict
+    """
+    return {
+        RECORD_FIELDS_ATTR: {
+            name: value for name, value in fields.items() if value is not None
+        }
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter that serializes the record with its typed fields to one line JSON object with orjson,
+    so the log can be aggregated by downstream tools without parsing free-form messages
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+            **getattr(record, RECORD_FIELDS_ATTR, {}),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
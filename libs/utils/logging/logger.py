@@ -7,7 +7,13 @@ import os
 import yaml
 
 from core_libs.common.constants import EnvVariables
-from libs.common.constants import LoggingConfigPath, EO_GR_LOGGER_NAME, UTF_8
+from libs.common.constants import (
+    LoggingConfigPath,
+    EO_GR_LOGGER_NAME,
+    UTF_8,
+    GrEnvVariables,
+)
+from libs.utils.logging.json_formatter import JsonFormatter
 
 # Read logging configuration from YAML file
 with LoggingConfigPath.LOGGING_CONFIG.open(encoding=UTF_8) as ymlfile:
@@ -19,6 +25,23 @@ log_filename = os.getenv(EnvVariables.LOG_FILENAME, "log.log")
 log_path = os.path.join(logs_folder, log_filename)
 logging_settings["handlers"]["file_hdlr"]["filename"] = log_path
 
+# Add a handler writing JSON records with typed fields to all loggers if structured log is enabled
+structured_log_filename = os.getenv(GrEnvVariables.STRUCTURED_LOG_FILENAME)
+if structured_log_filename:
+    logging_settings["formatters"]["json"] = {"()": JsonFormatter}
+    logging_settings["handlers"]["json_hdlr"] = {
+        "class": "logging.FileHandler",
+        "formatter": "json",
+        "filename": os.path.join(logs_folder, structured_log_filename),
+        "mode": "w",
+        "encoding": UTF_8,
+    }
+    for logger_settings in [
+        *logging_settings["loggers"].values(),
+        logging_settings["root"],
+    ]:
+        logger_settings["handlers"].append("json_hdlr")
+
 # Create 'eo_gr' logger
 logger = logging.getLogger(EO_GR_LOGGER_NAME)
 logging.config.dictConfig(logging_settings)
@@ -33,15 +56,17 @@ logging.getLogger("core_libs").setLevel(log_level)
 logging.getLogger("root").setLevel(log_level)
 
 
-def log_exception(error_message):
+def log_exception(error_message, extra=None):
     """
     Method allows to log the exception in the log
     :param error_message: the exception text
     :type error_message: str
+    :param extra: typed fields of the structured log record, see log_fields
+    :type extra: dict
     :return: the exception text
     :rtype: str
     """
-    logger.exception(msg=error_message)
+    logger.exception(msg=error_message, extra=extra)
     return error_message
 
 
@@ -13,8 +13,11 @@ from _pytest.fixtures import FixtureRequest
 from libs.common.constants import GrEnvVariables, EoVersionsFiles
 from libs.common.custom_exceptions import EnvironmentVariableNotProvidedError
 from libs.common.env_variables import ENV_VARS
+from libs.common.k8s_client_registry import K8S_CLIENTS
+from libs.common.session_pool import SESSION_POOL
 from libs.utils.common_utils import create_file_from_template
 from libs.utils.logging.logger import logger
+from tests.fixtures.requirements import SessionRequirements
 
 
 def format_fixture_path(filepath: str) -> str:
@@ -89,21 +92,26 @@ def command_line_session_mark(pytestconfig: pytest.Config) -> str:
 
 
 @pytest.fixture(scope="session", autouse=True)
-def check_passive_site_env_var_provided(request: FixtureRequest) -> None:
+def check_passive_site_env_var_provided(session_requirements: frozenset[str]) -> None:
     """Checking environment variable for Passive Site is provided. It's mandatory for GR related tests.
     Args:
-        request: an object that gives access to the pytest context and options
+        session_requirements: prerequisites required by the tests selected for the session
     """
-    if not ENV_VARS.passive_site:
-        tests_markers = [
-            mark.name for test in request.node.items for mark in test.own_markers
-        ]
-        if "NON_GR" not in tests_markers:
-            err_msg = (
-                f"Please provide {GrEnvVariables.PASSIVE_SITE!r} environment variable."
-            )
-            logger.error(err_msg)
-            raise EnvironmentVariableNotProvidedError(err_msg)
+    if (
+        SessionRequirements.PASSIVE_SITE in session_requirements
+        and not ENV_VARS.passive_site
+    ):
+        err_msg = (
+            f"Please provide {GrEnvVariables.PASSIVE_SITE!r} environment variable."
+        )
+        logger.error(err_msg)
+        raise EnvironmentVariableNotProvidedError(err_msg)
+
+
+def pytest_sessionfinish() -> None:
+    """Log number of requests sent to K8s clusters and REST logins performed during the test session"""
+    K8S_CLIENTS.log_request_counters()
+    SESSION_POOL.log_login_counters()
 
 
 def create_dumy_eo_versions_if_not_exist() -> None:
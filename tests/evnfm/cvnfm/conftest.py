@@ -14,6 +14,7 @@ from apps.cvnfm.cvnfm_app import CvnfmApp
 from apps.cvnfm.data.constants import PackageFields, PackageStates
 from apps.cvnfm.data.cvnfm_artefact_model import CvnfmArtifactModel
 from libs.common.asset_names import AssetNames
+from libs.common.checkpoint_store import CheckpointAssets, CheckpointStore
 from libs.common.config_reader import ConfigReader
 from libs.common.constants import DEFAULT_DOWNLOAD_LOCATION
 from libs.common.dns_server.dns_server_deployer import DNSServerDeployer
@@ -43,10 +44,82 @@ def check_docker_registry(
         logger.warning("Global and local registry verification skipped for Windows OS!")
 
 
+@fixture(scope="session")
+def restore_cnf_package(
+    cvnfm_app: CvnfmApp, checkpoint_store: CheckpointStore | None
+) -> Callable:
+    """
+    Fixture that returns function that restores CNF package onboarded by previous session of the stage
+    Args:
+        cvnfm_app: CvnfmApp instance
+        checkpoint_store: checkpoint store of the test stage, None if not in resume mode
+    Returns:
+        A function that sets descriptor and package ids stored in checkpoint to the package
+        if the package is still onboarded
+    """
+
+    def restore_pkg(package: CvnfmArtifactModel) -> bool:
+        """
+        Function that restores CNF package from checkpoint
+        """
+        if checkpoint_store is None:
+            return False
+        key = f"{CheckpointAssets.CNF_PACKAGE}:{package.url}"
+        stored = checkpoint_store.get_asset(key)
+        if not stored:
+            return False
+        if not cvnfm_app.is_package_onboarded(
+            stored[PackageFields.VNFD_ID], stored[PackageFields.ID]
+        ):
+            checkpoint_store.drop_asset(key)
+            return False
+        package.descriptor_id = stored[PackageFields.VNFD_ID]
+        package.package_id = stored[PackageFields.ID]
+        logger.info(f"CNF package {package.package_id!r} restored from checkpoint")
+        return True
+
+    return restore_pkg
+
+
+@fixture(scope="session")
+def restore_cnf_instance(
+    cvnfm_app: CvnfmApp, checkpoint_store: CheckpointStore | None
+) -> Callable:
+    """
+    Fixture that returns function that restores CNF instance instantiated by previous session of the stage
+    Args:
+        cvnfm_app: CvnfmApp instance
+        checkpoint_store: checkpoint store of the test stage, None if not in resume mode
+    Returns:
+        A function that returns instance id stored in checkpoint if the instance is still instantiated
+    """
+
+    def restore_instance(instance_name: str) -> str | None:
+        """
+        Function that restores CNF instance id from checkpoint
+        """
+        if checkpoint_store is None:
+            return None
+        key = f"{CheckpointAssets.CNF_INSTANCE}:{instance_name}"
+        instance_id = checkpoint_store.get_asset(key)
+        if not instance_id:
+            return None
+        if not cvnfm_app.is_instance_instantiated(instance_id):
+            checkpoint_store.drop_asset(key)
+            return None
+        logger.info(f"CNF instance {instance_name!r} restored from checkpoint")
+        return instance_id
+
+    return restore_instance
+
+
 @fixture(scope="module")
-def onboard_cnf_package(cvnfm_app: CvnfmApp) -> callable:
+def onboard_cnf_package(
+    cvnfm_app: CvnfmApp, checkpoint_store: CheckpointStore | None
+) -> callable:
     """
-    Fixture that return function that onboard CNF package
+    Fixture that return function that onboard CNF package,
+    in resume mode the package is stored in checkpoint for the tests of the next sessions
     """
 
     def onboard_pkg(package) -> None:
@@ -61,6 +134,14 @@ def onboard_cnf_package(cvnfm_app: CvnfmApp) -> callable:
             package_details.get(PackageFields.OPERATIONAL_STATE)
             == PackageStates.ENABLED
         ), log_exception(f"Expected operationalState is not {PackageStates.ENABLED}")
+        if checkpoint_store is not None:
+            checkpoint_store.save_asset(
+                f"{CheckpointAssets.CNF_PACKAGE}:{package.url}",
+                {
+                    PackageFields.VNFD_ID: package.descriptor_id,
+                    PackageFields.ID: package.package_id,
+                },
+            )
 
     return onboard_pkg
 
@@ -71,14 +152,20 @@ def instantiate_cnf_package(
     cluster_app: Cluster,
     asset_names: AssetNames,
     codeploy_app_active_site: CodeployApp,
+    checkpoint_store: CheckpointStore | None,
+    restore_cnf_package: Callable,
 ) -> Callable:
     """
-    Fixture return function that instantiate CNF package
+    Fixture return function that instantiate CNF package,
+    in resume mode package onboarded by the test completed in previous session is restored
+    and the instance is stored in checkpoint for the tests of the next sessions
     Args:
         cvnfm_app: CvnfmApp instance
         cluster_app: Cluster instance
         asset_names: a AssetNames instance
         codeploy_app_active_site: CodeployApp instance
+        checkpoint_store: checkpoint store of the test stage, None if not in resume mode
+        restore_cnf_package: restores CNF package stored in checkpoint
     Returns:
         A function that deploys the provided package with the specified instance name
     """
@@ -89,6 +176,8 @@ def instantiate_cnf_package(
         """
 
         instance_name = instance_name or asset_names.cnf_instance_name
+        if not package.package_id:
+            restore_cnf_package(package)
         cnf_id = cvnfm_app.create_cnf_instance_identifier(
             package.descriptor_id, vapp_name=instance_name
         )
@@ -102,6 +191,10 @@ def instantiate_cnf_package(
             cluster_app.cluster_name,
             instance_name,
         )
+        if checkpoint_store is not None:
+            checkpoint_store.save_asset(
+                f"{CheckpointAssets.CNF_INSTANCE}:{instance_name}", cnf_id
+            )
 
         return instance_id
 
@@ -1,12 +1,14 @@
 """
 This module contains a test functions to execute second Phase B of GR testing
 """
+from typing import Callable
 
 from core_libs.eo.evnfm.evnfm_constants import Operations
 from pytest import fixture
 from pytest import mark
 
 from apps.cvnfm.cvnfm_app import CvnfmApp
+from libs.common.asset_names import AssetNames
 from libs.common.env_variables import ENV_VARS
 from libs.utils.logging.logger import logger
 
@@ -16,18 +18,29 @@ pytestmark = [mark.cvnfm]
 
 
 @fixture(scope="module", autouse=True)
-def setup_preconditions(cvnfm_app: CvnfmApp) -> None:
+def setup_preconditions(
+    cvnfm_app: CvnfmApp,
+    asset_names: AssetNames,
+    restore_cnf_package: Callable,
+    restore_cnf_instance: Callable,
+    is_resume_mode: bool,
+) -> None:
     """
-    Get package id and instance id from Phase A
+    Get package id and instance id from Phase A, in resume mode from checkpoint if Phase A was run
+    with the same GR_STAGE_SHARED_NAME on the runner, otherwise by package descriptor id
     Download CVNFM upgrade package on file system
     """
     logger.info("Getting package id and instance id from Phase A")
-    cvnfm_app.cnf_smallstack_pkg.package_id = cvnfm_app.get_package_id_by_vnfd(
-        cvnfm_app.cnf_smallstack_pkg.descriptor_id
-    )
-    cvnfm_app.cnf_id = cvnfm_app.get_package_cnfd_id(
-        cvnfm_app.cnf_smallstack_pkg.descriptor_id, is_unique=True
-    )
+    if is_resume_mode and restore_cnf_package(cvnfm_app.cnf_smallstack_pkg):
+        cvnfm_app.cnf_id = restore_cnf_instance(asset_names.cnf_instance_name)
+    else:
+        cvnfm_app.cnf_smallstack_pkg.package_id = cvnfm_app.get_package_id_by_vnfd(
+            cvnfm_app.cnf_smallstack_pkg.descriptor_id
+        )
+    if not cvnfm_app.cnf_id:
+        cvnfm_app.cnf_id = cvnfm_app.get_package_cnfd_id(
+            cvnfm_app.cnf_smallstack_pkg.descriptor_id, is_unique=True
+        )
 
     logger.info("Download upgrade CNF package")
     cvnfm_app.download_cnf_package_and_randomize_vnf_id(
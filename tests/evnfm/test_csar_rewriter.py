@@ -0,0 +1,95 @@
+"""
+This module contains test cases that verify VNFD ID randomisation of CSAR package
+on SOL001 style package built by the test
+"""
+import hashlib
+import zipfile
+from pathlib import Path
+
+from pytest import fixture, mark
+
+from libs.common.csar_rewriter import randomize_vnfd_id
+
+VNFD_ID = "1b8e4a5c-2f6d-4e0a-9c3b-7d2f1e6a8b90"
+VNFD_PATH = "Definitions/sample_vnfd.yaml"
+MANIFEST_PATH = "sample.mf"
+IMAGE_PATH = "Files/images/image.bin"
+VNFD = f"""tosca_definitions_version: tosca_simple_yaml_1_3
+
+node_types:
+  Ericsson.Sample.1_0.{VNFD_ID}:
+    derived_from: tosca.nodes.nfv.VNF
+    properties:
+      descriptor_id:
+        type: string
+        constraints: [ valid_values: [ {VNFD_ID} ] ]
+        default: {VNFD_ID}
+      descriptor_version:
+        type: string
+        default: cxp9025898_4r81e08
+      provider:
+        type: string
+        default: Ericsson
+
+topology_template:
+  node_templates:
+    vnf:
+      type: Ericsson.Sample.1_0.{VNFD_ID}
+"""
+TOSCA_META = f"""TOSCA-Meta-File-Version: 1.0
+CSAR-Version: 1.1
+Created-By: Ericsson
+Entry-Definitions: {VNFD_PATH}
+Entry-Manifest: {MANIFEST_PATH}
+"""
+IMAGE = b"\x00type: string\xff" * 1024
+
+pytestmark = [mark.csar_rewriter]
+
+
+def get_manifest(vnfd: bytes) -> str:
+    """
+    Get manifest of the package with hash of the VNFD
+    """
+    vnfd_hash = hashlib.sha256(vnfd).hexdigest()
+    return (
+        f"metadata:\n  vnfd_id: {VNFD_ID}\n\n"
+        f"Source: {VNFD_PATH}\nAlgorithm: SHA-256\nHash: {vnfd_hash}\n"
+    )
+
+
+@fixture
+def sol001_csar(tmp_path: Path) -> Path:
+    """
+    Fixture that builds SOL001 style CSAR package with VNFD ID defined in the VNF node type
+    """
+    csar_path = tmp_path / "sample.csar"
+    with zipfile.ZipFile(csar_path, "w", zipfile.ZIP_DEFLATED) as csar:
+        csar.writestr("TOSCA-Metadata/TOSCA.meta", TOSCA_META)
+        csar.writestr(VNFD_PATH, VNFD)
+        csar.writestr(MANIFEST_PATH, get_manifest(VNFD.encode()))
+        csar.writestr(IMAGE_PATH, IMAGE)
+    return csar_path
+
+
+def test_randomize_vnfd_id_of_sol001_package(sol001_csar: Path, tmp_path: Path):
+    """
+    This test case verifies that only the VNFD ID is replaced in SOL001 style package,
+    manifest hash of the VNFD is updated and binary members are copied as is
+    """
+    destination = tmp_path / "randomized.csar"
+
+    new_vnfd_id = randomize_vnfd_id(sol001_csar, destination)
+
+    assert new_vnfd_id != VNFD_ID
+    with zipfile.ZipFile(destination) as csar:
+        assert csar.testzip() is None, "Rewritten package is corrupted"
+        vnfd = csar.read(VNFD_PATH)
+        assert vnfd == VNFD.replace(VNFD_ID, new_vnfd_id).encode()
+        assert b"type: string" in vnfd and b"node_types:" in vnfd
+        assert (
+            csar.read(MANIFEST_PATH)
+            == get_manifest(vnfd).replace(VNFD_ID, new_vnfd_id).encode()
+        )
+        assert csar.read("TOSCA-Metadata/TOSCA.meta") == TOSCA_META.encode()
+        assert csar.read(IMAGE_PATH) == IMAGE
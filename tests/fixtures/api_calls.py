@@ -0,0 +1,109 @@
+"""
+Module with pytest hooks that attach K8s, SSH and REST API calls made by every test to the test report,
+log and write the session summary and apply QPS budgets of API clients
+"""
+import json
+from datetime import datetime
+from html import escape
+
+import pytest
+
+from libs.common.api_call_stats import API_CALLS, ApiCallSummary
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.env_variables import ENV_VARS
+from libs.utils.logging.logger import logger
+
+TOP_ENDPOINTS_TO_LOG = 20
+
+
+def pytest_configure() -> None:
+    """Limit rate of API calls with the configured budgets"""
+    if ENV_VARS.api_qps_budgets:
+        logger.info(f"API QPS budgets: {ENV_VARS.api_qps_budgets}")
+    API_CALLS.set_budgets(ENV_VARS.api_qps_budgets)
+
+
+def pytest_runtest_logstart() -> None:
+    """Start counting API calls of the test"""
+    API_CALLS.start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """A hookwrapper that attaches API calls of setup, call and teardown to the teardown report of the test"""
+    output = yield
+    report = output.get_result()
+    if report.when != "teardown":
+        return
+    summary = API_CALLS.finish_test()
+    if not summary:
+        return
+    logger.info(
+        f"API calls of {item.nodeid}: {sum(call.count for call in summary.values())}"
+    )
+    report.extra = [
+        *getattr(report, "extra", []),
+        {"name": "API calls", "format": "html", "content": render_table(summary)},
+    ]
+
+
+def pytest_sessionfinish() -> None:
+    """Log the most called endpoints of the session and write all of them to JSON report"""
+    summary = dict(API_CALLS.session_summary)
+    if not summary:
+        return
+    top_calls = sorted(summary.items(), key=lambda item: item[1].count, reverse=True)
+    logger.info(
+        "Most called API endpoints:\n%s",
+        "\n".join(
+            f"{' '.join(key)}: {calls.count} calls, {calls.errors} errors, "
+            f"avg {calls.avg_latency:.3f}s, max {calls.max_latency:.3f}s"
+            for key, calls in top_calls[:TOP_ENDPOINTS_TO_LOG]
+        ),
+    )
+    report_path = LOAD_REPORTS_DIR / f"api_calls_{datetime.now():%Y%m%d_%H%M%S}.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report = [
+        {
+            "client": client,
+            "verb": verb,
+            "endpoint": endpoint,
+            **vars(calls),
+            "avg_latency": calls.avg_latency,
+        }
+        for (client, verb, endpoint), calls in top_calls
+    ]
+    report_path.write_text(json.dumps(report, indent=2))
+
+
+def render_table(summary: dict[tuple, ApiCallSummary]) -> str:
+    """Render API calls as HTML table ordered by client and number of calls
+    Args:
+        summary: calls summary by (client, verb, endpoint)
+    Returns:
+        HTML table
+    """
+    header = "".join(
+        f"<th>{column}</th>"
+        for column in (
+            "Client",
+            "Verb",
+            "Endpoint",
+            "Calls",
+            "Errors",
+            "Sent",
+            "Received",
+            "Avg latency",
+            "Max latency",
+        )
+    )
+    rows = "".join(
+        f"<tr><td>{escape(client)}</td><td>{escape(verb)}</td><td>{escape(endpoint)}</td>"
+        f"<td>{calls.count}</td><td>{calls.errors}</td>"
+        f"<td>{calls.sent_bytes / 1024:.1f} KB</td><td>{calls.received_bytes / 1024:.1f} KB</td>"
+        f"<td>{calls.avg_latency:.3f}s</td><td>{calls.max_latency:.3f}s</td></tr>"
+        for (client, verb, endpoint), calls in sorted(
+            summary.items(), key=lambda item: (item[0][0], -item[1].count)
+        )
+    )
+    return f'<table class="api-calls"><tr>{header}</tr>{rows}</table>'
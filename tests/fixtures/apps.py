@@ -2,7 +2,8 @@
 A module to store common objects pytest fixtures
 """
 
-from core_libs.vim.openstack import OpenStack
+from typing import Generator
+
 from pytest import fixture
 
 from apps.codeploy.codeploy_app import CodeployApp
@@ -12,8 +13,11 @@ from apps.gr.geo_redundancy import GeoRedundancyApp
 from apps.vim_app import VimApp
 from apps.vmvnfm.vmvnfm_app import VmvnfmApp
 from libs.common.config_reader import ConfigReader
+from libs.common.dependency_graph import DependencyGraph
 from libs.common.dns_server.dns_checker import DnsChecker
 from libs.common.env_variables import ENV_VARS
+from libs.common.shared_openstack import OPENSTACK_CLIENTS, SharedOpenStack
+from tests.fixtures.bootstrap import BootstrapTasks
 
 
 @fixture(scope="session")
@@ -29,15 +33,18 @@ def cvnfm_app(config_read_active_site: ConfigReader) -> CvnfmApp:
 
 
 @fixture(scope="session")
-def vmvnfm_app(config_read_active_site: ConfigReader) -> VmvnfmApp:
+def vmvnfm_app(config_read_active_site: ConfigReader) -> Generator:
     """
-    A pytest fixture that creates a VmvnfmApp object
+    A pytest fixture that creates a VmvnfmApp object and closes its VNFLCM shell session at teardown
     Args:
         config_read_active_site: the ConfigReader instance of Active Site
-    Return:
+    Yields:
         VmvnfmApp object
     """
-    return VmvnfmApp(config_read_active_site)
+    app = VmvnfmApp(config_read_active_site)
+    yield app
+    if "shell" in vars(app):
+        app.shell.close()
 
 
 @fixture(scope="session")
@@ -53,39 +60,39 @@ def vim_app(config_read_active_site: ConfigReader) -> VimApp:
 
 
 @fixture(scope="session")
-def cluster_app(config_read_active_site: ConfigReader) -> Cluster:
+def cluster_app(session_bootstrap: DependencyGraph) -> Cluster:
     """
     A pytest fixture that creates a Cluster object
-    :param config_read_active_site: the ConfigReader instance of Active Site
+    :param session_bootstrap: session bootstrap graph
     :return: Cluster object
     """
-    return Cluster(config_read_active_site)
+    return session_bootstrap.result(BootstrapTasks.CLUSTER_APP)
 
 
 @fixture(scope="session")
-def codeploy_app_active_site(config_read_active_site: ConfigReader) -> CodeployApp:
+def codeploy_app_active_site(session_bootstrap: DependencyGraph) -> CodeployApp:
     """
     A pytest fixture that creates a CodeployApp object for Active Site
-    :param config_read_active_site: the ConfigReader instance of Active Site
+    :param session_bootstrap: session bootstrap graph
     :return: CodeployApp object
     """
-    return CodeployApp(config_read_active_site)
+    return session_bootstrap.result(BootstrapTasks.CODEPLOY_APP_ACTIVE_SITE)
 
 
 @fixture(scope="session")
-def codeploy_app_passive_site(config_read_passive_site: ConfigReader) -> CodeployApp:
+def codeploy_app_passive_site(session_bootstrap: DependencyGraph) -> CodeployApp:
     """
     A pytest fixture that creates a CodeployApp object for Passive Site
     Args:
-        config_read_passive_site: the ConfigReader instance of Passive Site
+        session_bootstrap: session bootstrap graph
     Returns:
         CodeployApp object
     """
-    return CodeployApp(config_read_passive_site)
+    return session_bootstrap.result(BootstrapTasks.CODEPLOY_APP_PASSIVE_SITE)
 
 
 @fixture(scope="session")
-def openstack_app(config_read_active_site: ConfigReader) -> OpenStack:
+def openstack_app(config_read_active_site: ConfigReader) -> SharedOpenStack:
     """
     A pytest fixture that initializes an OpenStack wrapper
     Args:
@@ -93,7 +100,7 @@ def openstack_app(config_read_active_site: ConfigReader) -> OpenStack:
     Returns:
         OpenStack instance
     """
-    return OpenStack(config=config_read_active_site)
+    return OPENSTACK_CLIENTS.get(config_read_active_site)
 
 
 @fixture(scope="session")
@@ -116,11 +123,11 @@ def gr_app(
 
 
 @fixture(scope="session")
-def dns_checker(config_read_active_site: ConfigReader) -> DnsChecker:
+def dns_checker(session_bootstrap: DependencyGraph) -> DnsChecker:
     """A pytest fixture that initializes a DnsChecker instance
     Args:
-        config_read_active_site: the ConfigReader instance of Active Site
+        session_bootstrap: session bootstrap graph
     Returns:
         DnsChecker instance
     """
-    return DnsChecker(active_site_config=config_read_active_site)
+    return session_bootstrap.result(BootstrapTasks.DNS_CHECKER)
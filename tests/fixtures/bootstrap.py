@@ -0,0 +1,249 @@
+"""
+Module with session bootstrap: session fixtures of both sites are declared as dependency graph
+that is run concurrently once for the test session, the fixtures return results of the graph tasks
+"""
+from pathlib import Path
+
+import pytest
+from core_libs.common.constants import ArtefactAppType
+from core_libs.common.file_utils import FileUtils
+from pytest import fixture
+
+from apps.codeploy.codeploy_app import CodeployApp
+from apps.cvnfm.cluster import Cluster
+from apps.cvnfm.data.constants import CvnfmDefaults
+from libs.common.artefact_cache import ARTEFACT_CACHE
+from libs.common.config_reader import ConfigReader
+from libs.common.constants import DEFAULT_DOWNLOAD_LOCATION, EoVersionsFiles
+from libs.common.dependency_graph import DependencyGraph
+from libs.common.dns_server.dns_checker import DnsChecker
+from libs.common.env_variables import ENV_VARS
+from libs.common.versions_collector import VersionCollector
+from libs.utils.common_utils import create_file_from_template
+from libs.utils.logging.logger import logger
+from tests.fixtures.requirements import SessionRequirements
+
+
+class BootstrapTasks:
+    """Names of session bootstrap tasks, the same as names of the fixtures returning their results"""
+
+    CONFIG_READ_ACTIVE_SITE = "config_read_active_site"
+    CONFIG_READ_PASSIVE_SITE = "config_read_passive_site"
+    CODEPLOY_APP_ACTIVE_SITE = "codeploy_app_active_site"
+    CODEPLOY_APP_PASSIVE_SITE = "codeploy_app_passive_site"
+    CLUSTER_APP = "cluster_app"
+    DNS_CHECKER = "dns_checker"
+    DOWNLOAD_KUBE_CONFIG = "download_kube_config"
+    POPULATE_EO_VERSIONS = "populate_eo_versions"
+    CHECK_DNS_PREREQUISITES = "check_dns_environment_configuration_prerequisites"
+    REGISTER_DEFAULT_KUBE_CLUSTER = "register_default_kube_cluster"
+    PREFETCH_ARTEFACTS = "prefetch_artefacts"
+
+
+# tasks run only when tests selected for the session require their prerequisite
+REQUIREMENT_TASKS = {
+    SessionRequirements.EO_VERSIONS: BootstrapTasks.POPULATE_EO_VERSIONS,
+    SessionRequirements.DNS_PREREQUISITES: BootstrapTasks.CHECK_DNS_PREREQUISITES,
+}
+# tasks not needed by the first test, they are run in background by their fixtures
+BACKGROUND_TASKS = {BootstrapTasks.POPULATE_EO_VERSIONS}
+
+
+@fixture(scope="session")
+def session_bootstrap(
+    request: pytest.FixtureRequest,
+    override_config_options: str,
+    session_requirements: frozenset[str],
+    create_downloads_and_cleanup: None,  # pylint: disable=unused-argument
+) -> DependencyGraph:
+    """
+    Fixture that runs bootstrap tasks needed by the tests selected for the session concurrently:
+    configs of both sites are read in parallel, then artefacts prefetch start, EO versions collection,
+    DNS prerequisites check, kube config download and default cluster registration run in parallel,
+    so time to the first test is bounded by the slowest chain of tasks instead of their sum.
+    Error of the task is raised by the fixture returning its result. Tasks of prerequisites not required by the selected tests
+    and background tasks are not run by the fixture.
+    Args:
+        request: pytest request object
+        override_config_options: a fixture that returns values that should be overridden
+        session_requirements: prerequisites required by the tests selected for the session
+        create_downloads_and_cleanup: a fixture that creates downloads folder used by the tasks
+    Returns:
+        DependencyGraph with results of bootstrap tasks
+    """
+    selected_names = {
+        name
+        for item in request.session.items
+        for name in (
+            *(mark.name for mark in item.iter_markers()),
+            *item.path.parts,
+        )
+    }
+    graph = DependencyGraph("SESSION_BOOTSTRAP")
+    graph.add(
+        BootstrapTasks.CONFIG_READ_ACTIVE_SITE,
+        lambda: read_active_site_config(override_config_options),
+    )
+    graph.add(BootstrapTasks.CONFIG_READ_PASSIVE_SITE, read_passive_site_config)
+    graph.add(
+        BootstrapTasks.CODEPLOY_APP_ACTIVE_SITE,
+        CodeployApp,
+        deps=[BootstrapTasks.CONFIG_READ_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.CODEPLOY_APP_PASSIVE_SITE,
+        CodeployApp,
+        deps=[BootstrapTasks.CONFIG_READ_PASSIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.CLUSTER_APP,
+        Cluster,
+        deps=[BootstrapTasks.CONFIG_READ_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.DNS_CHECKER,
+        lambda config: DnsChecker(active_site_config=config),
+        deps=[BootstrapTasks.CONFIG_READ_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.DOWNLOAD_KUBE_CONFIG,
+        download_kube_config,
+        deps=[BootstrapTasks.CODEPLOY_APP_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.POPULATE_EO_VERSIONS,
+        populate_eo_versions,
+        deps=[BootstrapTasks.CODEPLOY_APP_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.CHECK_DNS_PREREQUISITES,
+        DnsChecker.verify_dns_environment_configuration_prerequisites,
+        deps=[BootstrapTasks.DNS_CHECKER],
+    )
+    graph.add(
+        BootstrapTasks.PREFETCH_ARTEFACTS,
+        lambda config: prefetch_artefacts(config, selected_names),
+        deps=[BootstrapTasks.CONFIG_READ_ACTIVE_SITE],
+    )
+    graph.add(
+        BootstrapTasks.REGISTER_DEFAULT_KUBE_CLUSTER,
+        register_default_kube_cluster,
+        deps=[BootstrapTasks.CLUSTER_APP, BootstrapTasks.DOWNLOAD_KUBE_CONFIG],
+    )
+    skipped_tasks = BACKGROUND_TASKS | {
+        task
+        for requirement, task in REQUIREMENT_TASKS.items()
+        if requirement not in session_requirements
+    }
+    graph.run(
+        {name for item in request.session.items for name in item.fixturenames}
+        & graph.names - skipped_tasks
+    )
+    return graph
+
+
+def read_active_site_config(override_config_options: str) -> ConfigReader:
+    """
+    Create a ConfigReader object and read all given configuration files: common, env, vim
+    Args:
+        override_config_options: values that should be overridden
+    Returns:
+        ConfigReader object
+    """
+    logger.info("Reading Active Site configuration...")
+    config = ConfigReader()
+    config.read_all(env=ENV_VARS.active_site, vim=ENV_VARS.vim)
+    config.override_config(ENV_VARS.override or override_config_options)
+    return config
+
+
+def read_passive_site_config() -> ConfigReader:
+    """
+    Create a ConfigReader object and read configuration files for Passive Site GR env
+    Returns:
+        ConfigReader object
+    """
+    logger.info("Reading Passive Site configuration...")
+    config = ConfigReader()
+    config.read_env(env=ENV_VARS.passive_site)
+    return config
+
+
+def prefetch_artefacts(
+    config_read_active_site: ConfigReader, selected_names: set[str]
+) -> None:
+    """
+    Start background download of the artefacts needed by the tests selected for the session
+    to the artefact cache. Artefacts are selected by application type (cvnfm, vmvnfm) found
+    in markers or directories of the selected tests.
+    Args:
+        config_read_active_site: ConfigReader instance for Active Site
+        selected_names: markers and path parts of the selected tests
+    """
+    urls = [
+        url
+        for app_type in (ArtefactAppType.CVNFM, ArtefactAppType.VMVNFM)
+        if app_type in selected_names
+        for artefact in config_read_active_site.artefacts.get_by_app_type(app_type)
+        for url in (
+            artefact.url,
+            getattr(artefact, "additional_config", None),
+            getattr(artefact, "additional_config_modify", None),
+            getattr(artefact, "additional_config_scale", None),
+        )
+        if url
+    ]
+    ARTEFACT_CACHE.prefetch(urls)
+
+
+def download_kube_config(codeploy_app_active_site: CodeployApp) -> Path:
+    """
+    Obtain kube config data from the director VM and save it into config file
+    Args:
+        codeploy_app_active_site: CodeployApp instance of Active Site
+    Returns:
+        kube config file path
+    """
+    file_path = (
+        Path(DEFAULT_DOWNLOAD_LOCATION) / CvnfmDefaults.DEFAULT_CISM_CLUSTER_NAME
+    )
+    FileUtils.save_data_to_yaml_file(
+        data=codeploy_app_active_site.k8s_eo_client.kubeconfig,
+        file_path=file_path,
+    )
+    return file_path
+
+
+def populate_eo_versions(codeploy_app_active_site: CodeployApp) -> None:
+    """
+    Create the versions_report.html file with current EO versions
+    1. Collect EO components versions
+    2. Reads and renders eo_versions.html
+    3. Creates or overrides versions_report.html with the rendered data
+    Args:
+        codeploy_app_active_site: CodeployApp instance of Active Site
+    """
+    if ENV_VARS.is_collect_eo_versions:
+        version_collector = VersionCollector(
+            k8s_eo_client=codeploy_app_active_site.k8s_eo_client,
+        )
+        create_file_from_template(
+            EoVersionsFiles.VERSIONS_TEMPLATE,
+            EoVersionsFiles.VERSIONS_REPORT,
+            version_collector.collection_versions_for_pytest_reporter,
+        )
+
+
+def register_default_kube_cluster(cluster_app: Cluster, kube_config_path: Path) -> None:
+    """
+    Register default Kubernetes cluster if it doesn't exist in the system.
+    According to CVNFM limitations, described in SM-135927,
+    every first cluster is always default and cannot be deleted
+    Args:
+        cluster_app: Cluster instance
+        kube_config_path: kube config file path of Active Site
+    """
+    if not cluster_app.api.clusters_client.check_default_cluster_exists():
+        logger.info("The default Kubernetes cluster hasn't been found. Registering...")
+        cluster_app.cluster_config_path = kube_config_path
+        cluster_app.register_cluster_config()
@@ -0,0 +1,77 @@
+"""
+Module with pytest hooks and fixtures that record completed tests and created assets of the GR test stage
+in the checkpoint store and skip completed tests, only when session is run with --resume option
+"""
+import pytest
+from pytest import fixture
+
+from libs.common.checkpoint_store import CheckpointStore
+from libs.common.constants import DEFAULT_NAME
+from libs.common.env_variables import ENV_VARS
+from libs.utils.logging.logger import logger
+from tests.fixtures.options import PytestOptions
+
+checkpoint_store_key = pytest.StashKey[CheckpointStore]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Open checkpoint store of the test stage in resume mode"""
+    if not config.getoption(PytestOptions.RESUME):
+        return
+    stage_name = ENV_VARS.gr_stage_shared_name
+    if stage_name == DEFAULT_NAME:
+        raise pytest.UsageError(
+            f"{PytestOptions.RESUME} requires unique GR_STAGE_SHARED_NAME of the test stage"
+        )
+    store = CheckpointStore(ENV_VARS.checkpoint_dir, stage_name)
+    config.stash[checkpoint_store_key] = store
+    logger.info(f"Resuming test stage from checkpoint {store.path}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Skip the test completed by previous session before its fixtures are set up, in resume mode"""
+    store = item.config.stash.get(checkpoint_store_key, None)
+    if store is not None and store.is_test_completed(item.nodeid):
+        pytest.skip(
+            "Completed by previous session of the stage, resumed from checkpoint"
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """A hookwrapper that marks passed test as completed and failed one as not completed, in resume mode"""
+    output = yield
+    report = output.get_result()
+    store = item.config.stash.get(checkpoint_store_key, None)
+    if store is None:
+        return
+    if report.failed:
+        store.reset_test(item.nodeid)
+    elif report.when == "call" and report.passed:
+        store.complete_test(item.nodeid)
+
+
+@fixture(scope="session")
+def checkpoint_store(request: pytest.FixtureRequest) -> CheckpointStore | None:
+    """
+    Fixture that returns checkpoint store of the test stage
+    Args:
+        request: pytest request object
+    Returns:
+        CheckpointStore instance, None if session is not run with --resume option
+    """
+    return request.config.stash.get(checkpoint_store_key, None)
+
+
+@fixture(scope="session")
+def is_resume_mode(request: pytest.FixtureRequest) -> bool:
+    """
+    Fixture that returns True if session is run with --resume option,
+    then fixtures reuse valid assets stored in the checkpoint instead of creating them
+    Args:
+        request: pytest request object
+    Returns:
+        True if resume mode is enabled
+    """
+    return request.config.getoption(PytestOptions.RESUME)
@@ -2,27 +2,25 @@
 module to store common pytest fixtures
 """
 from pathlib import Path
+from typing import Generator
 
 from core_libs.common.file_utils import FileUtils
 from core_libs.eo.ccd.k8s_data.pods import API_GATEWAY
 from pytest import fixture
 
 from apps.codeploy.codeploy_app import CodeployApp
-from apps.cvnfm.cluster import Cluster
-from apps.cvnfm.data.constants import CvnfmDefaults
 from apps.gr.data.constants import GrBurOrchestratorDeploymentEnvVars
+from libs.common.artefact_cache import ARTEFACT_CACHE
 from libs.common.asset_names import AssetNames
 from libs.common.config_reader import ConfigReader
-from libs.common.constants import (
-    DEFAULT_DOWNLOAD_LOCATION,
-    EoVersionsFiles,
-)
-from libs.common.dns_server.dns_checker import DnsChecker
-from libs.common.env_variables import ENV_VARS
+from libs.common.constants import DEFAULT_DOWNLOAD_LOCATION
+from libs.common.dependency_graph import DependencyGraph
 from libs.common.thread_runner import ThreadRunner
-from libs.common.versions_collector import VersionCollector
 from libs.utils.logging.logger import logger
-from libs.utils.common_utils import create_file_from_template
+from tests.fixtures.bootstrap import BootstrapTasks
+from tests.fixtures.requirements import SessionRequirements
+
+EO_VERSIONS_COLLECTION_TIMEOUT = 5 * 60
 
 
 # region auto-use fixtures:
@@ -53,100 +51,108 @@ def create_downloads_and_cleanup():
 
 
 @fixture(scope="session", autouse=True)
-def populate_eo_versions(codeploy_app_active_site: CodeployApp) -> None:
+def prefetch_artefacts(
+    session_bootstrap: DependencyGraph,  # pylint: disable=unused-argument
+) -> Generator:
+    """
+    Prefetch of the artefacts needed by the tests selected for the session is started by
+    prefetch_artefacts bootstrap task right after Active Site config is read,
+    while other bootstrap tasks run. Apps wait for the prefetched artefact download
+    when they need the file. Downloads not finished by the end of the session are stopped.
+    Args:
+        session_bootstrap: session bootstrap graph
+    """
+    yield
+    ARTEFACT_CACHE.cancel_prefetch()
+
+
+@fixture(scope="session", autouse=True)
+def populate_eo_versions(
+    session_bootstrap: DependencyGraph, session_requirements: frozenset[str]
+) -> Generator:
     """
-    Creates the versions_report.html file with current EO versions
-    1. Collect EO components versions
-    2. Reads and renders eo_versions.html
-    3. Creates or overrides versions_report.html with the rendered data
+    Creates the versions_report.html file with current EO versions in background, see populate_eo_versions
+    bootstrap task. Versions are not collected if the selected tests don't require them.
+    Failed collection is logged, the report keeps N/A versions then.
     Args:
-        codeploy_app_active_site: CodeployApp instance
+        session_bootstrap: session bootstrap graph
+        session_requirements: prerequisites required by the tests selected for the session
     """
-    if ENV_VARS.is_collect_eo_versions:
-        versions_template = EoVersionsFiles.VERSIONS_TEMPLATE
-        versions_report = EoVersionsFiles.VERSIONS_REPORT
-        version_collector = VersionCollector(
-            k8s_eo_client=codeploy_app_active_site.k8s_eo_client,
-        )
-        create_file_from_template(
-            versions_template,
-            versions_report,
-            version_collector.collection_versions_for_pytest_reporter,
+    if SessionRequirements.EO_VERSIONS not in session_requirements:
+        yield
+        return
+
+    def collect_versions() -> None:
+        try:
+            session_bootstrap.result(BootstrapTasks.POPULATE_EO_VERSIONS)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning(f"EO versions are not collected: {err!r}")
+
+    thread = ThreadRunner(target=collect_versions, name="EO_VERSIONS", daemon=True)
+    thread.start()
+    yield
+    thread.join(timeout=EO_VERSIONS_COLLECTION_TIMEOUT)
+    if thread.is_alive():
+        logger.warning(
+            f"EO versions are not collected in {EO_VERSIONS_COLLECTION_TIMEOUT}s"
         )
 
 
 @fixture(scope="session", autouse=True)
 def check_dns_environment_configuration_prerequisites(
-    dns_checker: DnsChecker,
+    session_bootstrap: DependencyGraph, session_requirements: frozenset[str]
 ) -> None:
     """
-    Checking DNS configurations for provided Active Site
+    Checking DNS configurations for provided Active Site if the selected tests require it
     Args:
-        dns_checker: DnsChecker instance
+        session_bootstrap: session bootstrap graph
+        session_requirements: prerequisites required by the tests selected for the session
     """
-    dns_checker.verify_dns_environment_configuration_prerequisites()
+    if SessionRequirements.DNS_PREREQUISITES in session_requirements:
+        session_bootstrap.result(BootstrapTasks.CHECK_DNS_PREREQUISITES)
 
 
 # endregion
 
 
 @fixture(scope="session")
-def config_read_active_site(override_config_options: str) -> ConfigReader:
+def config_read_active_site(session_bootstrap: DependencyGraph) -> ConfigReader:
     """
-    A pytest fixture that creates a ConfigReader object and reads all given configuration files: common, env, vim
-    :param override_config_options: a fixture that returns values that should be overridden
+    A pytest fixture that returns a ConfigReader object with all given configuration files read: common, env, vim
+    :param session_bootstrap: session bootstrap graph
     :return: ConfigReader object
     """
-    logger.info("Reading Active Site configuration...")
-    config = ConfigReader()
-    config.read_all(env=ENV_VARS.active_site, vim=ENV_VARS.vim)
-    config.override_config(ENV_VARS.override or override_config_options)
-
-    return config
+    return session_bootstrap.result(BootstrapTasks.CONFIG_READ_ACTIVE_SITE)
 
 
 @fixture(scope="session")
-def config_read_passive_site() -> ConfigReader:
+def config_read_passive_site(session_bootstrap: DependencyGraph) -> ConfigReader:
     """
-    A pytest fixture that creates a ConfigReader object and reads configuration files for Passive Site GR env
+    A pytest fixture that returns a ConfigReader object with configuration files for Passive Site GR env read
+    Args:
+        session_bootstrap: session bootstrap graph
     Returns:
         ConfigReader object
     """
-    logger.info("Reading Passive Site configuration...")
-    config = ConfigReader()
-    config.read_env(env=ENV_VARS.passive_site)
-    return config
+    return session_bootstrap.result(BootstrapTasks.CONFIG_READ_PASSIVE_SITE)
 
 
 @fixture(scope="session")
-def download_kube_config(codeploy_app_active_site):
+def download_kube_config(session_bootstrap: DependencyGraph) -> Path:
     """
     Obtains kube config data from the director VM and saves it into config file
     """
-    config_data = codeploy_app_active_site.k8s_eo_client.kubeconfig
-    file_path = (
-        Path(DEFAULT_DOWNLOAD_LOCATION) / CvnfmDefaults.DEFAULT_CISM_CLUSTER_NAME
-    )
-    FileUtils.save_data_to_yaml_file(
-        data=config_data,
-        file_path=file_path,
-    )
-    yield file_path
+    return session_bootstrap.result(BootstrapTasks.DOWNLOAD_KUBE_CONFIG)
 
 
 @fixture(scope="session")
-def register_default_kube_cluster(
-    cluster_app: Cluster, download_kube_config: str
-) -> None:
+def register_default_kube_cluster(session_bootstrap: DependencyGraph) -> None:
     """
     The pytest fixture that registers default Kubernetes cluster if it doesn't exist in the system.
     According to CVNFM limitations, described in SM-135927,
     every first cluster is always default and cannot be deleted
     """
-    if not cluster_app.api.clusters_client.check_default_cluster_exists():
-        logger.info("The default Kubernetes cluster hasn't been found. Registering...")
-        cluster_app.cluster_config_path = download_kube_config
-        cluster_app.register_cluster_config()
+    session_bootstrap.result(BootstrapTasks.REGISTER_DEFAULT_KUBE_CLUSTER)
 
 
 @fixture(scope="session")
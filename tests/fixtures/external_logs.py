@@ -0,0 +1,92 @@
+"""
+Module with pytest hooks that save captured logs of every test to compressed files next to the HTML report
+when --external-logs option is set and add their paths to the report. With --strip-external-logs option
+the report keeps only links to the files instead of the logs and loads log panes on demand
+"""
+import gzip
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from libs.common.constants import ROOT_PATH, UTF_8
+from libs.utils.common_utils import create_file_from_template
+from libs.utils.logging.logger import logger
+from tests.fixtures.options import PytestOptions
+from tests.fixtures.profiling import get_reports_dir
+
+LOGS_DIR_NAME = "logs"
+EXTERNAL_LOGS_SECTION = "External logs"
+LOGS_INDEX_TEMPLATE = ROOT_PATH / "tests/reporter_templates/logs_index.html"
+
+
+@dataclass
+class CapturedLogs:
+    """Log files of the test, paths are relative to the reports directory"""
+
+    nodeid: str
+    outcome: str = "passed"
+    duration: float = 0
+    files: list[tuple[str, str]] = field(default_factory=list)
+
+
+test_logs = pytest.StashKey[dict[str, CapturedLogs]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create registry of test log files if logs are externalised"""
+    if config.getoption(PytestOptions.EXTERNAL_LOGS):
+        config.stash[test_logs] = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """
+    A hookwrapper that saves sections captured in the test phase to compressed files and adds section
+    with paths of the files to the report, or replaces content of the report sections with the paths
+    if requested. Report of the later phase repeats sections of previous phases, they are not saved again.
+    """
+    output = yield
+    report = output.get_result()
+    registry = item.config.stash.get(test_logs, None)
+    if registry is None:
+        return
+
+    reports_dir = get_reports_dir(item.config)
+    logs = registry.setdefault(item.nodeid, CapturedLogs(nodeid=item.nodeid))
+    test_dir = Path(LOGS_DIR_NAME) / re.sub(r"[^\w.-]+", "_", item.nodeid)
+    for title, content in report.sections[len(logs.files) :]:
+        file_name = re.sub(r"\W+", "_", title.lower())
+        path = test_dir / f"{len(logs.files):02}_{file_name}.log.gz"
+        (reports_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(reports_dir / path, mode="wt", encoding=UTF_8) as f:
+            f.write(content)
+        logs.files.append((title, path.as_posix()))
+    if item.config.getoption(PytestOptions.STRIP_EXTERNAL_LOGS):
+        report.sections = list(logs.files)
+        report.external_logs = True
+    else:
+        report.sections.append(
+            (
+                EXTERNAL_LOGS_SECTION,
+                "\n".join(f"{title}: {path}" for title, path in logs.files),
+            )
+        )
+    logs.duration += report.duration
+    if logs.outcome == "passed":
+        logs.outcome = report.outcome
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Create index page with log files of all tests"""
+    registry = session.config.stash.get(test_logs, None)
+    if not registry:
+        return
+    index_path = get_reports_dir(session.config) / LOGS_DIR_NAME / "index.html"
+    # logs directory doesn't exist if no test captured any log section
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    create_file_from_template(
+        LOGS_INDEX_TEMPLATE, index_path, {"tests": list(registry.values())}
+    )
+    logger.info(f"Index of test logs is saved to {index_path}")
@@ -0,0 +1,48 @@
+"""
+Module with pytest hooks that index byte offsets of every test phase in the log file,
+see util_scripts/logging_scripts/slice_log_script.py to get log of the test from the index
+"""
+import pytest
+
+from libs.common.log_index import LogIndex, LogIndexEntry
+from libs.utils.logging.logger import log_path
+
+session_log_index = pytest.StashKey[LogIndex]()
+phase_start_offset = pytest.StashKey[int]()
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Create index of the log file rewritten by the session"""
+    log_index = LogIndex(log_path)
+    log_index.reset()
+    session.config.stash[session_log_index] = log_index
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item: pytest.Item) -> None:
+    """Remember log offset where setup of the test starts"""
+    log_index = item.config.stash.get(session_log_index, None)
+    if log_index is not None:
+        item.stash[phase_start_offset] = log_index.get_offset()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """A hookwrapper that adds byte range of the finished test phase to the log index"""
+    yield
+    log_index = item.config.stash.get(session_log_index, None)
+    if log_index is None:
+        return
+    start = item.stash.get(phase_start_offset, 0)
+    end = log_index.get_offset()
+    item.stash[phase_start_offset] = end
+    log_index.add(
+        LogIndexEntry(
+            nodeid=item.nodeid,
+            when=call.when,
+            start=start,
+            end=end,
+            started=call.start,
+            ended=call.stop,
+        )
+    )
@@ -3,6 +3,14 @@ Module to keep commonly used pytest options
 """
 from pytest import fixture
 
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.sampling_profiler import PROFILE_INTERVAL
+from libs.common.step_history import (
+    ABSOLUTE_TOLERANCE,
+    HISTORY_WINDOW,
+    MIN_HISTORY_SAMPLES,
+    RELATIVE_TOLERANCE,
+)
 from libs.utils.logging.logger import logger
 
 
@@ -12,6 +20,19 @@ class PytestOptions:
     """
 
     OVERRIDE = "--override"
+    STEP_HISTORY = "--step-history"
+    STEP_REGRESSION_PERCENTILE = "--step-regression-percentile"
+    STEP_HISTORY_WINDOW = "--step-history-window"
+    STEP_HISTORY_MIN_SAMPLES = "--step-history-min-samples"
+    STEP_REGRESSION_TOLERANCE = "--step-regression-tolerance"
+    STEP_REGRESSION_MIN_SECONDS = "--step-regression-min-seconds"
+    FAIL_ON_STEP_REGRESSION = "--fail-on-step-regression"
+    PROFILE = "--profile"
+    PROFILE_INTERVAL = "--profile-interval"
+    RESUME = "--resume"
+    EXTERNAL_LOGS = "--external-logs"
+    STRIP_EXTERNAL_LOGS = "--strip-external-logs"
+    TIME_ACCOUNTING = "--time-accounting"
 
 
 def pytest_addoption(parser):
@@ -22,6 +43,91 @@ def pytest_addoption(parser):
         default="",
         help="Defines configs that should be overridden.",
     )
+    parser.addoption(
+        PytestOptions.STEP_HISTORY,
+        action="store",
+        default=str(LOAD_REPORTS_DIR / "step_history.sqlite"),
+        help="SQLite file with step durations of previous runs.",
+    )
+    parser.addoption(
+        PytestOptions.STEP_REGRESSION_PERCENTILE,
+        action="store",
+        type=float,
+        default=95,
+        help="Step is flagged as slow if its duration exceeds this percentile of recent runs.",
+    )
+    parser.addoption(
+        PytestOptions.STEP_HISTORY_WINDOW,
+        action="store",
+        type=int,
+        default=HISTORY_WINDOW,
+        help="Number of recent runs of the step to compare with.",
+    )
+    parser.addoption(
+        PytestOptions.STEP_HISTORY_MIN_SAMPLES,
+        action="store",
+        type=int,
+        default=MIN_HISTORY_SAMPLES,
+        help="Steps with fewer recent runs are not checked for regression.",
+    )
+    parser.addoption(
+        PytestOptions.STEP_REGRESSION_TOLERANCE,
+        action="store",
+        type=float,
+        default=RELATIVE_TOLERANCE,
+        help="Allowed excess of the step duration over the percentile as a fraction of the percentile.",
+    )
+    parser.addoption(
+        PytestOptions.STEP_REGRESSION_MIN_SECONDS,
+        action="store",
+        type=float,
+        default=ABSOLUTE_TOLERANCE,
+        help="Allowed excess of the step duration over the percentile in seconds.",
+    )
+    parser.addoption(
+        PytestOptions.FAIL_ON_STEP_REGRESSION,
+        action="store_true",
+        default=False,
+        help="Fail test session if any step is flagged as slow.",
+    )
+    parser.addoption(
+        PytestOptions.PROFILE,
+        action="store_true",
+        default=False,
+        help="Profile every test with its fixtures and save flamegraphs next to the HTML report.",
+    )
+    parser.addoption(
+        PytestOptions.PROFILE_INTERVAL,
+        action="store",
+        type=float,
+        default=PROFILE_INTERVAL,
+        help="Sampling interval of the profiler in seconds.",
+    )
+    parser.addoption(
+        PytestOptions.RESUME,
+        action="store_true",
+        default=False,
+        help="Skip tests completed by previous sessions of the stage and reuse their assets.",
+    )
+    parser.addoption(
+        PytestOptions.EXTERNAL_LOGS,
+        action="store_true",
+        default=False,
+        help="Save captured logs of tests to compressed files next to the HTML report and list them in the report.",
+    )
+    parser.addoption(
+        PytestOptions.STRIP_EXTERNAL_LOGS,
+        action="store_true",
+        default=False,
+        help="With --external-logs, keep only links to the saved logs in the HTML report instead of inlining them.",
+    )
+    parser.addoption(
+        PytestOptions.TIME_ACCOUNTING,
+        action="store_true",
+        default=False,
+        help="Attribute wall time of tests to sleeping, remote calls, logging and local work, "
+        "instruments HTTP requests and logging handlers.",
+    )
 
 
 @fixture(scope="session")
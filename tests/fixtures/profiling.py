@@ -0,0 +1,73 @@
+"""
+Module with pytest hooks that profile every test with its fixtures when --profile option is set
+and save collapsed stacks and flamegraph of the test next to the HTML report
+"""
+import re
+from pathlib import Path
+
+import pytest
+
+from libs.common.constants import ROOT_PATH
+from libs.common.sampling_profiler import (
+    SamplingProfiler,
+    render_flamegraph,
+    write_collapsed_stacks,
+)
+from libs.utils.logging.logger import logger
+from tests.fixtures.options import PytestOptions
+
+PROFILES_DIR_NAME = "profiles"
+DEFAULT_REPORTS_DIR = ROOT_PATH / "pytest_reports"
+test_profiler = pytest.StashKey[SamplingProfiler]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create profiler of the test session if profiling is enabled"""
+    if config.getoption(PytestOptions.PROFILE):
+        config.stash[test_profiler] = SamplingProfiler(
+            interval=config.getoption(PytestOptions.PROFILE_INTERVAL)
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item: pytest.Item) -> None:
+    """Start profiling of the test, so setup and teardown of its fixtures are profiled too"""
+    profiler = item.config.stash.get(test_profiler, None)
+    if profiler is not None:
+        profiler.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """A hookwrapper that stops profiling on teardown and links profile files from the test report"""
+    output = yield
+    report = output.get_result()
+    profiler = item.config.stash.get(test_profiler, None)
+    if report.when != "teardown" or profiler is None:
+        return
+    stacks = profiler.stop()
+    if not stacks:
+        return
+
+    reports_dir = get_reports_dir(item.config)
+    file_name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+    collapsed_path = reports_dir / PROFILES_DIR_NAME / f"{file_name}.collapsed"
+    flamegraph_path = collapsed_path.with_suffix(".svg")
+    write_collapsed_stacks(stacks, collapsed_path)
+    flamegraph_path.write_text(render_flamegraph(stacks, title=item.nodeid))
+    logger.info(f"Profile of {item.nodeid} is saved to {flamegraph_path}")
+    report.profiles = {
+        "Flamegraph": flamegraph_path.relative_to(reports_dir).as_posix(),
+        "Collapsed stacks": collapsed_path.relative_to(reports_dir).as_posix(),
+    }
+
+
+def get_reports_dir(config: pytest.Config) -> Path:
+    """Get directory of the HTML report set with --report option of pytest-reporter
+    Args:
+        config: pytest config
+    Returns:
+        directory of the first HTML report or default reports directory
+    """
+    reports = config.getoption("--report", default=None) or []
+    return Path(reports[0]).absolute().parent if reports else DEFAULT_REPORTS_DIR
@@ -0,0 +1,65 @@
+"""
+Module with registry of expensive session prerequisites required by the tests, keyed by pytest markers,
+used to skip prerequisites not needed by the tests selected for the session
+"""
+import pytest
+from pytest import fixture
+
+from libs.utils.logging.logger import logger
+
+
+class SessionRequirements:
+    """Expensive session prerequisites"""
+
+    EO_VERSIONS = "eo_versions"
+    DNS_PREREQUISITES = "dns_prerequisites"
+    PASSIVE_SITE = "passive_site"
+
+    ALL = frozenset({EO_VERSIONS, DNS_PREREQUISITES, PASSIVE_SITE})
+
+
+# ordered registry, the first marker of the test found in it defines prerequisites required by the test,
+# so NON_GR and workaround marks take precedence over suite marks (e.g. cvnfm) of the same test,
+# tests without registered markers require all prerequisites
+MARKER_REQUIREMENTS: dict[str, frozenset[str]] = {
+    "NON_GR": frozenset({SessionRequirements.EO_VERSIONS}),
+    "restart_api_gateway_pod": frozenset(),
+    "csar_rewriter": frozenset(),
+    "workaround_change_backup_interval": frozenset({SessionRequirements.PASSIVE_SITE}),
+    "dummy_gr_availability": frozenset({SessionRequirements.PASSIVE_SITE}),
+    "dummy_gr_status": frozenset({SessionRequirements.PASSIVE_SITE}),
+    "dummy_gr_switchover": frozenset({SessionRequirements.PASSIVE_SITE}),
+}
+
+
+def get_item_requirements(item: pytest.Item) -> frozenset[str]:
+    """Get prerequisites required by the test
+    Args:
+        item: pytest test item
+    Returns:
+        SessionRequirements values
+    """
+    markers = {mark.name for mark in item.iter_markers()}
+    for marker, requirements in MARKER_REQUIREMENTS.items():
+        if marker in markers:
+            return requirements
+    return SessionRequirements.ALL
+
+
+@fixture(scope="session")
+def session_requirements(request: pytest.FixtureRequest) -> frozenset[str]:
+    """
+    Fixture that returns prerequisites required by the tests selected for the session
+    Args:
+        request: an object that gives access to the pytest context and options
+    Returns:
+        SessionRequirements values
+    """
+    requirements = frozenset().union(
+        *(get_item_requirements(item) for item in request.session.items)
+    )
+    logger.info(
+        f"Session prerequisites: {sorted(requirements)}, "
+        f"skipped: {sorted(SessionRequirements.ALL - requirements)}"
+    )
+    return requirements
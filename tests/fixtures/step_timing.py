@@ -0,0 +1,112 @@
+"""
+Module with pytest hooks that attach waterfall of timed GR and EVNFM app steps to the test report,
+store step durations in the history and flag steps that are slower than in recent runs
+"""
+import sqlite3
+from html import escape
+from uuid import uuid4
+
+import pytest
+
+from libs.common.step_history import StepHistory
+from libs.common.step_timer import STEP_TIMER, StepRecord, StepStatuses
+from libs.utils.logging.logger import logger
+from tests.fixtures.options import PytestOptions
+
+RUN_ID = uuid4().hex
+SLOW_STEPS_PROPERTY = "Slow steps"
+slow_steps_found = pytest.StashKey[bool]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Reset slow steps flag of the test session"""
+    config.stash[slow_steps_found] = False
+
+
+def pytest_runtest_logstart(nodeid: str) -> None:
+    """Start timing steps of the test"""
+    STEP_TIMER.start_test(nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """
+    A hookwrapper that attaches steps waterfall to the teardown report of the test,
+    so steps of setup, call and teardown (e.g. pods healthcheck) are included
+    """
+    output = yield
+    report = output.get_result()
+    if report.when != "teardown":
+        return
+    records = STEP_TIMER.finish_test()
+    if not records:
+        return
+
+    report.extra = [
+        *getattr(report, "extra", []),
+        {"name": "Steps", "format": "html", "content": render_waterfall(records)},
+    ]
+    config = item.config
+    try:
+        history = StepHistory(config.getoption(PytestOptions.STEP_HISTORY))
+        regressions = history.find_regressions(
+            RUN_ID,
+            item.nodeid,
+            records,
+            percent=config.getoption(PytestOptions.STEP_REGRESSION_PERCENTILE),
+            window=config.getoption(PytestOptions.STEP_HISTORY_WINDOW),
+            min_samples=config.getoption(PytestOptions.STEP_HISTORY_MIN_SAMPLES),
+            relative_tolerance=config.getoption(
+                PytestOptions.STEP_REGRESSION_TOLERANCE
+            ),
+            absolute_tolerance=config.getoption(
+                PytestOptions.STEP_REGRESSION_MIN_SECONDS
+            ),
+        )
+        history.append(RUN_ID, item.nodeid, records)
+    except sqlite3.Error as err:
+        logger.warning(f"Step history is not available: {err}")
+        return
+
+    if regressions:
+        slow_steps = "; ".join(str(regression) for regression in regressions)
+        logger.warning(f"Slow steps in {item.nodeid}: {slow_steps}")
+        report.user_properties.append((SLOW_STEPS_PROPERTY, slow_steps))
+        config.stash[slow_steps_found] = True
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Fail the test session if slow steps were found and the gate is enabled"""
+    if session.config.getoption(
+        PytestOptions.FAIL_ON_STEP_REGRESSION
+    ) and session.config.stash.get(slow_steps_found, False):
+        logger.error("Test session failed: slow steps found, see test reports")
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def render_waterfall(records: list[StepRecord]) -> str:
+    """Render steps as HTML table with bars positioned on the test timeline
+    Args:
+        records: steps ordered by start time
+    Returns:
+        HTML table
+    """
+    total = max(record.start + record.duration for record in records) or 1
+    rows = []
+    for record in records:
+        color = "#5cb85c" if record.status == StepStatuses.PASSED else "#d9534f"
+        rows.append(
+            "<tr>"
+            f'<td style="padding-left:{record.depth * 1.5}em">{escape(record.name)}</td>'
+            f"<td>{escape(record.thread)}</td>"
+            f"<td>{record.start:.1f}s</td>"
+            f"<td>{record.duration:.1f}s</td>"
+            f'<td style="width:50%"><div style="margin-left:{record.start / total:.1%};'
+            f"width:{max(record.duration / total, 0.002):.1%};background:{color};"
+            'height:1em"></div></td>'
+            "</tr>"
+        )
+    return (
+        '<table class="steps"><tr><th>Step</th><th>Thread</th><th>Start</th>'
+        f"<th>Duration</th><th>Timeline</th></tr>{''.join(rows)}</table>"
+    )
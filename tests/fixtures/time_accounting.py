@@ -0,0 +1,121 @@
+"""
+Module with pytest hooks that attribute wall time of every test to sleeping, remote calls,
+logging and local work, attach the breakdown to the test report and summarize it for the session,
+enabled by --time-accounting option
+"""
+import json
+from datetime import datetime
+from html import escape
+
+import pytest
+
+from libs.common.constants import LOAD_REPORTS_DIR
+from libs.common.time_accounting import (
+    TIME_ACCOUNTANT,
+    TimeBuckets,
+    install_global_accounting,
+)
+from libs.utils.logging.logger import logger
+from tests.fixtures.options import PytestOptions
+
+COLUMNS = ("wall", *TimeBuckets.ALL, "cpu")
+test_summaries = pytest.StashKey[dict[str, dict]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Enable time accounting incl. time of HTTP requests and logging handlers if requested"""
+    config.stash[test_summaries] = {}
+    if config.getoption(PytestOptions.TIME_ACCOUNTING):
+        TIME_ACCOUNTANT.enable()
+        install_global_accounting()
+
+
+def pytest_runtest_logstart() -> None:
+    """Start time accounting of the test"""
+    if TIME_ACCOUNTANT.enabled:
+        TIME_ACCOUNTANT.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    """A hookwrapper that attaches time breakdown to the teardown report of the test"""
+    output = yield
+    report = output.get_result()
+    if report.when != "teardown" or not TIME_ACCOUNTANT.enabled:
+        return
+    summary = TIME_ACCOUNTANT.finish()
+    item.config.stash[test_summaries][item.nodeid] = summary
+    logger.info(f"Time breakdown of {item.nodeid}: {format_row(summary)}")
+    report.extra = [
+        *getattr(report, "extra", []),
+        {
+            "name": "Time breakdown",
+            "format": "html",
+            "content": render_table({item.name: summary}),
+        },
+    ]
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Log time breakdown of all tests and the session and write it to JSON report"""
+    summaries = session.config.stash.get(test_summaries, {})
+    if not summaries:
+        return
+    session_summary = dict(TIME_ACCOUNTANT.session_summary)
+    logger.info(
+        "Time breakdown, seconds (%% of wall time):\n%s",
+        "\n".join(
+            f"{name}: {format_row(summary)}"
+            for name, summary in {**summaries, "SESSION": session_summary}.items()
+        ),
+    )
+    report_path = (
+        LOAD_REPORTS_DIR / f"time_accounting_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        name: {column: round(value, 3) for column, value in summary.items()}
+        for name, summary in {**summaries, "session": session_summary}.items()
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+
+
+def format_row(summary: dict) -> str:
+    """Format test time breakdown as one line
+    Args:
+        summary: time breakdown
+    Returns:
+        formatted breakdown
+    """
+    wall = summary["wall"] or 1
+    return ", ".join(
+        f"{column} {summary[column]:.1f}"
+        + (f" ({summary[column] / wall:.0%})" if column != "wall" else "")
+        for column in COLUMNS
+    )
+
+
+def render_table(summaries: dict[str, dict]) -> str:
+    """Render time breakdown as HTML table
+    Args:
+        summaries: time breakdown by test name
+    Returns:
+        HTML table
+    """
+    header = "".join(f"<th>{column}</th>" for column in ("", *COLUMNS))
+    rows = "".join(
+        f"<tr><td>{escape(name)}</td>"
+        + "".join(
+            f"<td>{summary[column]:.1f}s"
+            + (
+                f" ({summary[column] / (summary['wall'] or 1):.0%})"
+                if column != "wall"
+                else ""
+            )
+            + "</td>"
+            for column in COLUMNS
+        )
+        + "</tr>"
+        for name, summary in summaries.items()
+    )
+    return f'<table class="time-breakdown"><tr>{header}</tr>{rows}</table>'
@@ -1,13 +1,18 @@
 """
 Is dedicated for storing the switchover-specific fixtures
 """
+from dataclasses import replace
 from typing import Generator
 
 from pytest import fixture
 
 from apps.codeploy.codeploy_app import CodeployApp
 from apps.codeploy.pods_health_checker import PodsHealthChecker
+from apps.cvnfm.cluster import Cluster
+from apps.cvnfm.cvnfm_app import CvnfmApp
+from apps.cvnfm.lcm_traffic_generator import LcmTrafficGenerator
 from apps.gr.geo_redundancy import GeoRedundancyApp
+from libs.common.asset_names import AssetNames
 
 
 @fixture(scope="session")
@@ -95,3 +100,39 @@ def decrease_backup_cycle_interval_and_check_new_backup_created(
 
     """
     return gr_app.verify_backup_id_updated_in_availability(interval=10.0)
+
+
+@fixture(scope="function")
+def lcm_traffic_generator(
+    cvnfm_app: CvnfmApp,
+    cluster_app: Cluster,
+    asset_names: AssetNames,
+    register_default_kube_cluster: None,  # pylint: disable=unused-argument
+) -> Generator:
+    """
+    Onboards small CNF package with randomized VNFD id for LCM traffic and deletes it after the test
+    Args:
+        cvnfm_app: CvnfmApp instance
+        cluster_app: Cluster instance
+        asset_names: AssetNames instance
+        register_default_kube_cluster: registers default Kubernetes cluster if it doesn't exist
+    Yields:
+        LcmTrafficGenerator instance
+    """
+    # copy of the session-shared model, so its path and IDs are not changed for other tests
+    package = replace(
+        cvnfm_app.cnf_smallstack_pkg,
+        actions=list(cvnfm_app.cnf_smallstack_pkg.actions),
+        path=None,
+        descriptor_id=None,
+        package_id=None,
+    )
+    cvnfm_app.download_cnf_package_and_randomize_vnf_id(package, is_randomize_vnfd=True)
+    package.package_id = cvnfm_app.onboard_cnf_package(package, cleanup_pkg=True)
+    yield LcmTrafficGenerator(
+        cvnfm_app,
+        cluster_name=cluster_app.cluster_name,
+        name_prefix=asset_names.cnf_instance_name,
+        package=package,
+    )
+    cvnfm_app.delete_cnf_package_if_exists(package.descriptor_id)
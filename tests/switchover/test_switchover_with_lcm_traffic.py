@@ -0,0 +1,48 @@
+"""Module to store test function that makes switchover while EVNFM LCM traffic is generated"""
+from typing import Generator
+
+from pytest import mark
+
+from apps.cvnfm.lcm_traffic_generator import LcmTrafficGenerator
+from apps.gr.geo_redundancy import GeoRedundancyApp
+
+# pylint: disable=unused-argument
+
+pytestmark = [mark.switchover_with_lcm_traffic]
+
+
+def test_switchover_with_lcm_traffic(
+    gr_app: GeoRedundancyApp,
+    lcm_traffic_generator: LcmTrafficGenerator,
+    healthcheck_two_sites_switchover_success: Generator,
+) -> None:
+    """
+    Test does the following:
+    - make and verify GR Availability and GR Status commands
+    - generate EVNFM read and LCM traffic before, during and after switchover
+    - verify that every request class recovered after switchover
+
+    Args:
+        gr_app: GeoRedundancyApp instance
+        lcm_traffic_generator: LcmTrafficGenerator instance
+        healthcheck_two_sites_switchover_success: verifies that pods are in expected states after switchover done
+    """
+    assert (
+        gr_app.verify_gr_availability()
+    ), "EO GR hasn't become available before the switchover operation"
+    assert (
+        gr_app.gr_status.make_and_verify_geo_status_command()
+    ), "GR Status command contains missmatch for performing switchover"
+
+    assert lcm_traffic_generator.run_during_switchover(
+        gr_app
+    ), "Switchover completed with errors"
+
+    not_recovered = [
+        name
+        for name, report in lcm_traffic_generator.report["request_classes"].items()
+        if not report["recovered"]
+    ]
+    assert (
+        not not_recovered
+    ), f"EVNFM requests are not recovered after switchover: {not_recovered}"
@@ -3,7 +3,10 @@
 from argparse import ArgumentParser
 
 from libs.common.constants import GrEnvVariables, DEFAULT_NAME, GR_TEST_PREFIX
-from libs.common.cvnfm_namespace_deleter import CvnfmNamespaceDeleter
+from libs.common.cvnfm_namespace_deleter import (
+    CvnfmNamespaceDeleter,
+    NAMESPACES_DELETION_TIMEOUT,
+)
 from libs.common.env_variables import ENV_VARS
 from libs.common.thread_runner import ThreadRunner
 from util_scripts.common.common import print_with_highlight
@@ -50,6 +53,6 @@ Options:
             thread.start()
             threads.append(thread)
     for thread in threads:
-        thread.join_with_result(timeout=10 * 60)
+        thread.join_with_result(timeout=NAMESPACES_DELETION_TIMEOUT + 2 * 60)
 
     print_with_highlight("Script finished successfully.")
@@ -15,7 +15,6 @@ from core_libs.common.constants import CommonConfigKeys, CcdConfigKeys
 from core_libs.common.custom_exceptions import ConfigurationNotFoundException
 from core_libs.common.file_utils import FileUtils
 from core_libs.common.misc_utils import wait_for
-from core_libs.eo.ccd.k8s_api_client import K8sApiClient
 from core_libs.eo.ccd.k8s_data.pods import EO_AM_ONBOARDING
 
 from libs.common.config_reader import ConfigReader
@@ -25,6 +24,7 @@ from libs.common.constants import (
     DEFAULT_DOWNLOAD_LOCATION,
 )
 from libs.common.dns_server.dns_checker import DnsChecker
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from libs.utils.common_utils import run_shell_cmd
 from libs.utils.logging.logger import logger
 
@@ -107,7 +107,7 @@ class InstallCvnfmCertificates:
     def k8s_client(self):
         """K8s client property"""
         if self._k8s_eo_client is None:
-            self._k8s_eo_client = K8sApiClient(
+            self._k8s_eo_client = K8S_CLIENTS.get_client(
                 namespace=self.namespace,
                 kubeconfig_path=self.kubeconfig_path,
                 download_location=DEFAULT_DOWNLOAD_LOCATION,
@@ -0,0 +1,61 @@
+"""Module that stores script for running bulk CNF lifecycle load against EVNFM of the active site"""
+
+from argparse import ArgumentParser
+
+from apps.cvnfm.cnf_load_generator import CnfLoadGenerator, LoadSettings
+from apps.cvnfm.cvnfm_app import CvnfmApp
+from apps.cvnfm.data.constants import CvnfmDefaults
+from libs.common.constants import GR_TEST_PREFIX, LOAD_REPORTS_DIR, GrEnvVariables
+from libs.common.env_variables import ENV_VARS
+from util_scripts.common.common import print_with_highlight
+from util_scripts.common.config_reader import active_site_config
+
+if __name__ == "__main__":
+    DESCRIPTION = f"""
+Create, instantiate, scale and terminate N CNFs of already onboarded CNF test package on EVNFM
+and write LCM latency, queueing delay and error rate report to {LOAD_REPORTS_DIR}\n
+Required environment variables:
+    - {GrEnvVariables.ACTIVE_SITE}
+    Optional:
+    - {GrEnvVariables.GR_STAGE_SHARED_NAME}: used in CNF instance names
+"""
+    print_with_highlight(DESCRIPTION)
+
+    parser = ArgumentParser(description=DESCRIPTION)
+    parser.add_argument("--vnfd-id", required=True, help="VNFD ID of onboarded package")
+    parser.add_argument("--instances", type=int, default=10, help="Number of CNFs")
+    parser.add_argument(
+        "--concurrency", type=int, default=5, help="Max number of parallel operations"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=None, help="Max number of operations per second"
+    )
+    parser.add_argument(
+        "--cluster-name",
+        default=CvnfmDefaults.DEFAULT_CISM_CLUSTER_NAME,
+        help="Registered cluster config name",
+    )
+    parser.add_argument("--skip-scale", action="store_true", help="Skip scale phase")
+    args = parser.parse_args()
+
+    cvnfm_app = CvnfmApp(active_site_config)
+    package = cvnfm_app.cnf_smallstack_pkg
+    package.descriptor_id = args.vnfd_id
+    package.package_id = cvnfm_app.get_package_id_by_vnfd(args.vnfd_id)
+
+    load_generator = CnfLoadGenerator(
+        cvnfm_app,
+        cluster_name=args.cluster_name,
+        name_prefix=f"{GR_TEST_PREFIX}-{ENV_VARS.gr_stage_shared_name}",
+        package=package,
+    )
+    load_generator.run(
+        LoadSettings(
+            instances=args.instances,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            is_scale=not args.skip_scale,
+        )
+    )
+
+    print_with_highlight("Script finished successfully.")
@@ -5,6 +5,7 @@ from core_libs.common.constants import K8sKeys
 from core_libs.eo.ccd.k8s_api_client import K8sApiClient
 
 from libs.common.config_reader import ConfigReader
+from libs.common.k8s_client_registry import K8S_CLIENTS
 from util_scripts.common.common import print_with_highlight
 from util_scripts.common.constants import KMS_SECRET
 
@@ -57,7 +58,7 @@ class KmsKey:
         namespace = config.read_section(CcdConfigKeys.CODEPLOY_NAMESPACE)
         kubeconf = config.read_section(CcdConfigKeys.CCD_KUBECONFIG_PATH)
 
-        return K8sApiClient(namespace, kubeconf)
+        return K8S_CLIENTS.get_client(namespace=namespace, kubeconfig_path=kubeconf)
 
     def _get_kms_key(self, *, active_site: bool) -> str:
         """Method for parce KMS Master key value from KMS secret
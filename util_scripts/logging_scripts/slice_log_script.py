@@ -0,0 +1,67 @@
+"""Script that prints log records of the tests or time window using byte offsets from the log index"""
+import os
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+
+from core_libs.common.constants import EnvVariables
+
+from libs.common.log_index import LogIndex
+
+
+def parse_time(value: str) -> float:
+    """Parse ISO time, e.g. '2024-05-01 13:45:00'
+    Args:
+        value: time string
+    Returns:
+        epoch seconds
+    """
+    return datetime.fromisoformat(value).timestamp()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Prints log records of the tests matching provided filters, "
+        "test phases are located by the log index written next to the log by the test session"
+    )
+    parser.add_argument(
+        "--log",
+        default=os.path.join(
+            os.getenv(EnvVariables.LOGS_FOLDER, ""),
+            os.getenv(EnvVariables.LOG_FILENAME, "log.log"),
+        ),
+        help="Path to the log file, LOGS_FOLDER/LOG_FILENAME by default",
+    )
+    parser.add_argument("--test", help="Part of pytest node id of the test")
+    parser.add_argument(
+        "--phase", choices=["setup", "call", "teardown"], help="Test phase"
+    )
+    parser.add_argument(
+        "--since", type=parse_time, help="Skip phases ended before this ISO time"
+    )
+    parser.add_argument(
+        "--until", type=parse_time, help="Skip phases started after this ISO time"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List matching test phases only"
+    )
+    args = parser.parse_args()
+
+    log_index = LogIndex(args.log)
+    if not log_index.path.exists():
+        sys.exit(f"Log index {log_index.path} is not found")
+    entries = log_index.find(
+        nodeid=args.test, when=args.phase, since=args.since, until=args.until
+    )
+    if not entries:
+        sys.exit(f"No test phases matching filters found in {log_index.path}")
+
+    if args.list:
+        for entry in entries:
+            started = datetime.fromtimestamp(entry.started).isoformat(" ", "seconds")
+            print(
+                f"{started} {entry.ended - entry.started:8.1f}s "
+                f"{entry.end - entry.start:>12} bytes  {entry.nodeid} [{entry.when}]"
+            )
+    else:
+        log_index.copy(entries, sys.stdout.buffer)